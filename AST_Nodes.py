@@ -3,6 +3,9 @@
 # -------------------------------------------------------------- #
 
 import sys 
+from Values import isList, isString, ConsList, Rope, AppendList, pack, MembershipIndex
+import Values as values
+import Output as output
 
 # ------------------- Error Handling Classes ------------------- #
 import errno
@@ -22,37 +25,59 @@ class SemanticError(Error):
         
 # ------------------- Error Handling Classes ------------------- #
 
-# Variable stack -> Initialized with empty global variable list
-var_list = [dict()]
-# Dictionary of functions 
-fun_list = dict() 
-
+# Value of a slot that was never assigned
+UNSET = object()
+# Result cache miss, see Memo.py
+MISSING = object()
+
+# State of one run of a program, passed to every eval. Programs run
+# with their own Interpreter don't share anything, they can run one
+# after the other or at the same time on different threads.
+class Interpreter(): 
+    def __init__(self, sink=None, packed=None, memos=None): 
+        # Frame stack -> var_list[0] is the global array, var_list[-1] the
+        # current frame. Variables are found by the slots set in Resolver.py.
+        self.var_list = [[]]
+        # Dictionary of functions 
+        self.fun_list = dict() 
+        # Where print goes, the current sink of Output.py by default 
+        self.sink = sink if sink is not None else output.sink
+        # Pack numeric list literals, Values.packing by default 
+        self.packed = packed if packed is not None else values.packing
+        # Result caches of the pure functions by name (Memo.enable), none by default 
+        self.memos = memos if memos is not None else dict()
+        # Hash indexes of the lists tested with 'in' 
+        self.members = MembershipIndex()
+
+    def run(self, tree): 
+        return tree.eval(self)
+
+# Every node class lists its attributes in __slots__, the nodes have 
+# no __dict__. Large programs make millions of them. 
 class Node(): 
+    __slots__ = ('lineno',)
+
     def __init__(self):
-        self.parent = None 
-        
-    def parentCount(self):
-        count = 0
-        current = self.parent 
-        while current is not None:
-            count += 1
-            current = current.parent
-        return count
+        self.lineno = 0 # Source line, set by Parser.py 
         
 class Disjunction(Node):
+    __slots__ = ('left', 'right', 'fast')
+
     def __init__(self, left, right):
         super().__init__()
         self.left = left
         self.right = right
+        self.fast = None # Unchecked operator, set by TypeInference.py
         
     def typeCheck(self, left, right):
         if type(left) == bool and type(right) == bool:
             return True
         return False
         
-    def eval(self):
-        left = self.left.eval()
-        right = self.right.eval()
+    def eval(self, ctx):
+        left = self.left.eval(ctx)
+        right = self.right.eval(ctx)
+        if self.fast is not None: return self.fast(left, right)
         
         if self.typeCheck(left, right):
             return left or right
@@ -64,59 +89,72 @@ class Disjunction(Node):
         return False
 
 class Conjunction(Node):
+    __slots__ = ('left', 'right', 'fast')
+
     def __init__(self, left, right):
         super().__init__()
         self.left = left
         self.right = right
+        self.fast = None # Unchecked operator, set by TypeInference.py
     
     def typeCheck(self, left, right):
         if type(left) == bool and type(right) == bool:
             return True
         return False
         
-    def eval(self):
-        left = self.left.eval()
-        right = self.right.eval()
+    def eval(self, ctx):
+        left = self.left.eval(ctx)
+        right = self.right.eval(ctx)
+        if self.fast is not None: return self.fast(left, right)
         
         if self.typeCheck(left, right):
             return left and right
         raise SemanticError() 
                 
 class Negation(Node):
+    __slots__ = ('child', 'fast')
+
     def __init__(self, child):
         super().__init__()
         self.child = child
+        self.fast = None # Unchecked operator, set by TypeInference.py
         
     def typeCheck(self, child):
         if type(child) == bool:
             return True
         return False
 
-    def eval(self):
-        child = self.child.eval()
+    def eval(self, ctx):
+        child = self.child.eval(ctx)
+        if self.fast is not None: return self.fast(child)
         if self.typeCheck(child):
             return not child
         raise SemanticError() 
         
 # ---- Compare Node Handles all the comparison operators 
 class Compare(Node):
+    __slots__ = ('left', 'right', 'value', 'fast')
+
     def __init__(self, left, right, operation):
         super().__init__()
         self.left = left # Expression to the left of operator 
         self.right = right # Expression to the right of the operator 
         self.value = operation # Operator 
+        self.fast = None # Unchecked operator, set by TypeInference.py
         
     def typeCheck(self, left, right):
-        if type(left) != str and type(left) != int and type(left) != float:
+        if not isString(left) and type(left) != int and type(left) != float:
             return False
-        if type(right) != str and type(right) != int and type(right) != float:
+        if not isString(right) and type(right) != int and type(right) != float:
             return False      
         return True
         
-    def eval(self):   
+    def eval(self, ctx):   
         try:
-            left = self.left.eval()
-            right = self.right.eval()
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            # Operand types proven by TypeInference.py 
+            if self.fast is not None: return self.fast(left, right)
             if self.typeCheck(left, right):
                 if self.value == '<=' : value = left <= right
                 elif self.value == '<' : value = left < right
@@ -132,11 +170,14 @@ class Compare(Node):
 
 # ---- BinOp Node Handles all the comparison Binary Operations 
 class BinOp(Node):
+    __slots__ = ('left', 'right', 'value', 'fast')
+
     def __init__(self, left, right, operation):
         super().__init__()
         self.left = left # Expression to the left of operator 
         self.right = right # Expression to the right of operator 
         self.value = operation # Operation 
+        self.fast = None # Unchecked operator, set by TypeInference.py
 
     def typeCheck(self, left, right):
         if type(left) != int and type(left) != float:
@@ -146,9 +187,9 @@ class BinOp(Node):
         return True
     
     def typeCheckAdd(self, left, right): 
-        if type(left) != int and type(left) != float and type(left) != str and type(left) != list: 
+        if type(left) != int and type(left) != float and not isString(left) and not isList(left): 
             return False 
-        if type(right) != int and type(right) != float and type(right) != str and type(right) != list: 
+        if type(right) != int and type(right) != float and not isString(right) and not isList(right): 
             return False 
         return True 
     
@@ -157,13 +198,16 @@ class BinOp(Node):
             return False
         return True
         
-    def eval(self):   
+    def eval(self, ctx):   
         try:
-            left = self.left.eval()
-            right = self.right.eval()
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            # Operand types proven by TypeInference.py 
+            if self.fast is not None: return self.fast(left, right)
             # Addition allows Strings 
             if self.value == '+': 
                 if self.typeCheckAdd(left, right): 
+                    if type(left) is str and type(right) is str: return Rope.concat(left, right)
                     value = left + right 
                     return value
                 else : raise SemanticError()
@@ -191,7 +235,220 @@ class BinOp(Node):
             
         except : raise SemanticError()
         
+# ---- Operator specific nodes, created by the parser instead of the 
+# generic BinOp / Compare. Each evaluates its own operation only, the 
+# operator string stays in self.value for the passes and engines. 
+NUMBERS = (int, float)
+COMPARABLE = (int, float, str, Rope)
+
+def addable(value): 
+    return type(value) is int or type(value) is float or isString(value) or isList(value)
+
+class AddNode(BinOp): # Numbers, Strings and Lists
+    __slots__ = ()
+
+    def __init__(self, left, right): 
+        super().__init__(left, right, '+')
+
+    def eval(self, ctx): 
+        try: 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            if self.fast is not None or (addable(left) and addable(right)): 
+                if type(left) is str and type(right) is str: return Rope.concat(left, right)
+                return left + right
+        except : raise SemanticError()
+        raise SemanticError()
+
+class SubNode(BinOp): # Numbers only
+    __slots__ = ()
+
+    def __init__(self, left, right): 
+        super().__init__(left, right, '-')
+
+    def eval(self, ctx): 
+        try: 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            if self.fast is not None or (type(left) in NUMBERS and type(right) in NUMBERS): 
+                return left - right
+        except : raise SemanticError()
+        raise SemanticError()
+
+class MulNode(BinOp): # Numbers only
+    __slots__ = ()
+
+    def __init__(self, left, right): 
+        super().__init__(left, right, '*')
+
+    def eval(self, ctx): 
+        try: 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            if self.fast is not None or (type(left) in NUMBERS and type(right) in NUMBERS): 
+                return left * right
+        except : raise SemanticError()
+        raise SemanticError()
+
+class DivNode(BinOp): # Numbers only
+    __slots__ = ()
+
+    def __init__(self, left, right): 
+        super().__init__(left, right, '/')
+
+    def eval(self, ctx): 
+        try: 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            if self.fast is not None or (type(left) in NUMBERS and type(right) in NUMBERS): 
+                return left / right
+        except : raise SemanticError()
+        raise SemanticError()
+
+class PowNode(BinOp): # Numbers only
+    __slots__ = ()
+
+    def __init__(self, left, right): 
+        super().__init__(left, right, '**')
+
+    def eval(self, ctx): 
+        try: 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            if self.fast is not None or (type(left) in NUMBERS and type(right) in NUMBERS): 
+                return left ** right
+        except : raise SemanticError()
+        raise SemanticError()
+
+class IntDivNode(BinOp): # Integers only
+    __slots__ = ()
+
+    def __init__(self, left, right): 
+        super().__init__(left, right, 'div')
+
+    def eval(self, ctx): 
+        try: 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            if self.fast is not None or (type(left) is int and type(right) is int): 
+                return left // right
+        except : raise SemanticError()
+        raise SemanticError()
+
+class ModNode(BinOp): # Integers only
+    __slots__ = ()
+
+    def __init__(self, left, right): 
+        super().__init__(left, right, 'mod')
+
+    def eval(self, ctx): 
+        try: 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            if self.fast is not None or (type(left) is int and type(right) is int): 
+                return left % right
+        except : raise SemanticError()
+        raise SemanticError()
+
+class LessEqualNode(Compare): # Numbers or Strings
+    __slots__ = ()
+
+    def __init__(self, left, right): 
+        super().__init__(left, right, '<=')
+
+    def eval(self, ctx): 
+        try: 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            if self.fast is not None or (type(left) in COMPARABLE and type(right) in COMPARABLE): 
+                return left <= right
+        except : raise SemanticError()
+        raise SemanticError()
+
+class LessThanNode(Compare): # Numbers or Strings
+    __slots__ = ()
+
+    def __init__(self, left, right): 
+        super().__init__(left, right, '<')
+
+    def eval(self, ctx): 
+        try: 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            if self.fast is not None or (type(left) in COMPARABLE and type(right) in COMPARABLE): 
+                return left < right
+        except : raise SemanticError()
+        raise SemanticError()
+
+class EqualNode(Compare): # Numbers or Strings
+    __slots__ = ()
+
+    def __init__(self, left, right): 
+        super().__init__(left, right, '==')
+
+    def eval(self, ctx): 
+        try: 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            if self.fast is not None or (type(left) in COMPARABLE and type(right) in COMPARABLE): 
+                return left == right
+        except : raise SemanticError()
+        raise SemanticError()
+
+class NotEqualNode(Compare): # Numbers or Strings
+    __slots__ = ()
+
+    def __init__(self, left, right): 
+        super().__init__(left, right, '<>')
+
+    def eval(self, ctx): 
+        try: 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            if self.fast is not None or (type(left) in COMPARABLE and type(right) in COMPARABLE): 
+                return left != right
+        except : raise SemanticError()
+        raise SemanticError()
+
+class GreaterEqualNode(Compare): # Numbers or Strings
+    __slots__ = ()
+
+    def __init__(self, left, right): 
+        super().__init__(left, right, '>=')
+
+    def eval(self, ctx): 
+        try: 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            if self.fast is not None or (type(left) in COMPARABLE and type(right) in COMPARABLE): 
+                return left >= right
+        except : raise SemanticError()
+        raise SemanticError()
+
+class GreaterThanNode(Compare): # Numbers or Strings
+    __slots__ = ()
+
+    def __init__(self, left, right): 
+        super().__init__(left, right, '>')
+
+    def eval(self, ctx): 
+        try: 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx)
+            if self.fast is not None or (type(left) in COMPARABLE and type(right) in COMPARABLE): 
+                return left > right
+        except : raise SemanticError()
+        raise SemanticError()
+
+# Operator string -> node class, used by Parser.py 
+BINOP_NODES = {'+': AddNode, '-': SubNode, '*': MulNode, '/': DivNode, '**': PowNode, 
+               'div': IntDivNode, 'mod': ModNode}
+COMPARE_NODES = {'<=': LessEqualNode, '<': LessThanNode, '==': EqualNode, 
+                 '<>': NotEqualNode, '>=': GreaterEqualNode, '>': GreaterThanNode}
+        
 class UMinus(Node): 
+    __slots__ = ('child',)
+
     def __init__(self, expression):
         super().__init__()
         self.child = expression
@@ -201,57 +458,64 @@ class UMinus(Node):
             return False
         return True
         
-    def eval(self):
-        child = self.child.eval()      
+    def eval(self, ctx):
+        child = self.child.eval(ctx)      
         if self.typeCheck(child): return -1 * child
         
         raise SemanticError()
 
 class Membership(Node): 
+    __slots__ = ('left', 'right')
+
     def __init__(self, left, right): 
         super().__init__()
         self.left = left  # Expression to the left of "in"  
         self.right = right  # Expression to the right of "in"
     
     def typeCheck(self, left, right): 
-        if type(left) != str and type(right) == str: 
+        if not isString(left) and isString(right): 
             return False 
-        if type(right) != str and type(right) != list: 
+        if not isString(right) and not isList(right): 
             return False
         return True;
         
-    def eval(self): 
+    def eval(self, ctx): 
         try: 
-            left = self.left.eval()
-            right = self.right.eval() 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx) 
 
             if self.typeCheck(left, right): 
-                return left in right 
+                if isString(right): return str(left) in right 
+                return ctx.members.contains(right, left)
             else : raise SemanticError()
             
         except : raise SemanticError()
 
 class Cons(Node): 
+    __slots__ = ('left', 'right')
+
     def __init__(self, left, right): 
         super().__init__()
         self.left = left # Expression to the left of ::
         self.right = right # Expression to the right of ::
 
     def typeCheck(self, right): 
-        if type(right) != list: 
+        if not isList(right): 
             return False
         return True;
         
-    def eval(self): 
+    def eval(self, ctx): 
         try: 
-            left = self.left.eval()
-            right = self.right.eval() 
+            left = self.left.eval(ctx)
+            right = self.right.eval(ctx) 
 
-            if self.typeCheck(right): return [left] + right 
+            if self.typeCheck(right): return ConsList.cons(left, right) 
             else : raise SemanticError()
         except : raise SemanticError()
     
 class Index(Node): 
+    __slots__ = ('value', 'child')
+
     def __init__(self, indices, value): 
         super().__init__()
         self.value = indices # List of indexes 
@@ -262,18 +526,18 @@ class Index(Node):
             if type(i) != int: 
                 return False 
                 
-        if type(value) != list and type(value) != str: 
+        if not isList(value) and not isString(value): 
             return False
         return True;
         
-    def eval(self): 
+    def eval(self, ctx): 
         try: 
             indices = []
             for i in self.value: #Evaluate indices 
-                indices.append(i.eval())
+                indices.append(i.eval(ctx))
 
             # Evaluate the value 
-            if type(self.child) != str : value = self.child.eval() 
+            if type(self.child) != str : value = self.child.eval(ctx) 
             else : value = self.child
             
             # Get the desired indexed value 
@@ -290,6 +554,8 @@ class Index(Node):
 
         
 class Tuple_Index(Node): 
+    __slots__ = ('value', 'child', 'slot', 'gslot')
+
     def __init__(self, index, value): 
         super().__init__()
         self.value = index 
@@ -300,13 +566,13 @@ class Tuple_Index(Node):
             return False
         return True
         
-    def eval(self): 
+    def eval(self, ctx): 
         try: 
             if type(self.child) == str: 
-                if self.child in var_list[0]:
-                    value = var_list[0][self.child]
-                else: value = var_list[-1][self.child]
-            else : value = self.child.eval() 
+                value = ctx.var_list[-1][self.slot]
+                if value is UNSET: value = ctx.var_list[0][self.gslot]
+                if value is UNSET: raise SemanticError()
+            else : value = self.child.eval(ctx) 
             
             if self.typeCheck(value): 
                 return value[self.value - 1]
@@ -316,109 +582,159 @@ class Tuple_Index(Node):
    
         
 class AST_Boolean(Node): 
+    __slots__ = ('value',)
+
     def __init__(self, value):
         super().__init__()
         self.value = value
         
-    def eval(self):
+    def eval(self, ctx):
         return self.value
 
 class AST_Number(Node):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         super().__init__()
         self.value = value
         
-    def eval(self):
+    def eval(self, ctx):
         return self.value
 
 class AST_String(Node):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         super().__init__()
         self.value = value
 
-    def eval(self):
+    def eval(self, ctx):
         return self.value
 
 
 class AST_List(Node): 
+    __slots__ = ('value',)
+
     def __init__(self, element):
         super().__init__()
         self.value = element
         
-    def eval(self): 
+    def eval(self, ctx): 
         list = []
         for i in self.value:
-            list.append(i.eval())
+            list.append(i.eval(ctx))
 
+        if ctx.packed: return pack(list)
         return list
  
 class AST_Tuple(Node): 
+    __slots__ = ('value',)
+
     def __init__(self, element):
         super().__init__()
         self.value = element
         
-    def eval(self): 
+    def eval(self, ctx): 
         list = []
 
         for i in self.value:
-            list.append(i.eval())
+            list.append(i.eval(ctx))
         return tuple(list)
  
 # --- Statements 
 class AST_Assignment(Node): 
+    __slots__ = ('value', 'child')
+
     def __init__(self, variable, value): 
         super().__init__()
         self.value = variable 
         self.child = value 
         
-    def eval(self): 
+    def eval(self, ctx): 
         try: 
-            var_name = self.value.getName()
-            var_value = self.child.eval()
-
-            # Look for in local list 
-            if var_name in var_list[0]: 
-                var_list[0][var_name] = var_value
-            # Look for in global list                
-            elif var_name in var_list[-1]:
-                var_list[-1][var_name] = var_value
-            # Else add into the local list on stack 
+            var = self.value
+            var_value = self.child.eval(ctx)
+            frame = ctx.var_list[-1]
+
+            # Set in the local frame, or not set anywhere -> local 
+            if frame[var.slot] is not UNSET or ctx.var_list[0][var.gslot] is UNSET: 
+                frame[var.slot] = var_value
+            # Set in the global list only 
             else: 
-                var_list[0][var_name] = var_value
+                ctx.var_list[0][var.gslot] = var_value
 
             return var_value
         except: 
             raise SemanticError()
             
-class AST_IndexAssignment(Node): 
+# 'xs = xs + e', made by Parser.py. When xs and e are lists the result
+# is a Values.AppendList, which grows the list xs grew from in place
+# without changing xs. Anything else runs like AST_Assignment.
+class AST_AppendAssignment(AST_Assignment):
+    __slots__ = ()
+
+    def eval(self, ctx):
+        add = self.child
+        # The optimizer may have replaced the addition
+        if type(add) is not AddNode: return AST_Assignment.eval(self, ctx)
+        try:
+            var = self.value
+            # Where xs is read from is where it gets assigned
+            array = ctx.var_list[-1]
+            index = var.slot
+            if array[index] is UNSET:
+                array = ctx.var_list[0]
+                index = var.gslot
+            value = array[index]
+            if value is UNSET: raise SemanticError()
+            right = add.right.eval(ctx)
+
+            if type(value) is AppendList and isList(right): value = value.extend(right)
+            elif isList(value) and isList(right): value = AppendList.grow(value, right)
+            else:
+                if add.fast is None and not (addable(value) and addable(right)): raise SemanticError()
+                if type(value) is str and type(right) is str: value = Rope.concat(value, right)
+                else: value = value + right
+            array[index] = value
+            return value
+        except:
+            raise SemanticError()
+
+class AST_IndexAssignment(Node):
+    __slots__ = ('value', 'left', 'right')
+
     def __init__(self, variable, assignement_value, index_values): 
         super().__init__()
         self.value = index_values
         self.left = variable 
         self.right = assignement_value 
 
-    # Iterate through list recursively and change the desired index 
+    # Iterate through list recursively and change the desired index, 
+    # returns the list that changed 
     def indexAssignment(self, variable, index_values, assignement_value): 
         if len(index_values) > 1: 
-            self.indexAssignment(variable[index_values[0]], index_values[1:], assignement_value)
+            return self.indexAssignment(variable[index_values[0]], index_values[1:], assignement_value)
         else:
             variable[index_values[0]] = assignement_value # End recursive function 
+            return variable
         
-    def eval(self): 
+    def eval(self, ctx): 
         try: 
             index_values = []
             for i in self.value: 
-                index_values.append(i.eval())
+                index_values.append(i.eval(ctx))
             
-            if self.left.getName() in var_list[0]:
-                self.indexAssignment(var_list[0][self.left.getName()], index_values, self.right.eval())
-            else: 
-                self.indexAssignment(var_list[-1][self.left.getName()], index_values, self.right.eval())
+            variable = ctx.var_list[-1][self.left.slot]
+            if variable is UNSET: variable = ctx.var_list[0][self.left.gslot]
+            if variable is UNSET: raise SemanticError()
+            ctx.members.invalidate(self.indexAssignment(variable, index_values, self.right.eval(ctx)))
         except: 
             raise SemanticError()
             
  
 class AST_Variable(Node): 
+    __slots__ = ('value', 'slot', 'gslot')
+
     def __init__(self, name): 
         super().__init__()
         self.value = name
@@ -426,47 +742,51 @@ class AST_Variable(Node):
     def getName(self): 
         return self.value 
         
-    def eval(self):
+    def eval(self, ctx):
         try: 
-            var_name = self.value 
-
-            # Look for in local list 
-            if var_name in var_list[0]:
-                return var_list[0][var_name] 
+            # Look for in local frame 
+            value = ctx.var_list[-1][self.slot]
             # Look for in global list 
-            else:           
-                return var_list[-1][var_name] 
+            if value is UNSET: value = ctx.var_list[0][self.gslot]
+            if value is UNSET: raise SemanticError()
+            return value 
         except: 
             raise SemanticError()
 
 class AST_Block(Node): 
+    __slots__ = ('value',)
+
     def __init__ (self, statements): 
         super().__init__()
         if type(statements) == list : self.value = statements 
         else :  self.value = [statements]
             
-    def eval(self):        
+    def eval(self, ctx):        
         # Evaluate each line of code in the block
         try: 
             for i in self.value:
-                i.eval()
+                i.eval(ctx)
         except: 
             raise SemanticError()
          
 class AST_Print(Node): 
+    __slots__ = ('value',)
+
     def __init__ (self, element): 
         super().__init__()
         self.value = element 
 
-    def eval(self): 
+    def eval(self, ctx): 
         try: 
-            value = self.value.eval()
-            print(value)
+            value = self.value.eval(ctx)
+            ctx.sink.write(value)
             return value
         except: 
             raise SemanticError()
 
 class AST_If(Node):
+    __slots__ = ('value', 'child')
+
     def __init__(self, expression, block): 
         super().__init__()
         self.value = expression 
@@ -477,58 +797,69 @@ class AST_If(Node):
             return False
         return True
     
-    def eval(self):
-        expr = self.value.eval() 
+    def eval(self, ctx):
+        expr = self.value.eval(ctx) 
         try: 
             
             if self.typeCheck(expr):
-                if expr == True: return self.child.eval() 
+                if expr == True: return self.child.eval(ctx) 
                 else : return False
             raise SemanticError()
         except: 
             raise SemanticError()
 
 class AST_IfElse(Node): 
+    __slots__ = ('left', 'right')
+
     def __init__(self, if_block, else_block): 
         super().__init__()
         self.left = if_block
         self.right = else_block
-    def eval(self):
+    def eval(self, ctx):
         try: 
-            result = self.left.eval()
+            result = self.left.eval(ctx)
  
-            if result == False: result = self.right.eval()
+            if result == False: result = self.right.eval(ctx)
             return result
         except: 
             raise SemanticError() 
         
 class AST_While(Node): 
+    __slots__ = ('value', 'child')
+
     def __init__(self, expression, block):
         super().__init__()
         self.value = expression
         self.child = block 
     
-    def eval(self): 
+    def eval(self, ctx): 
         try: 
-            while self.value.eval() != False: 
-                self.child.eval()
+            while self.value.eval(ctx) != False: 
+                self.child.eval(ctx)
         except: 
             raise SemanticError()
 
 class AST_Execute(Node): 
+    __slots__ = ('left', 'right', 'nglobals', 'pure')
+
     def __init__(self, function_list, block): 
         super().__init__()
         self.left = function_list
         self.right = block 
+        self.pure = None # Names of the pure functions, found by Memo.enable 
         
-    def eval(self): 
+    def eval(self, ctx): 
+        # Fresh global array, sized by Resolver.py 
+        ctx.var_list[:] = [[UNSET] * self.nglobals]
         for func in self.left: 
-            func.eval() 
+            func.eval(ctx) 
 
-        self.right.eval() 
+        self.right.eval(ctx) 
         
  #-- Functions --> Make a copy of the original variable. After executing block, revert variable back to original value 
 class AST_Function(Node): 
+    __slots__ = ('value', 'left', 'right', 'child', 'nlocals')
+
     def __init__(self, name, parameter_list, block, expression ): 
         super().__init__() 
         self.value = name 
@@ -536,47 +867,57 @@ class AST_Function(Node):
         self.right = block 
         self.child = expression 
         
-    def eval(self): 
+    def eval(self, ctx): 
         try: 
-            # [parameter_list, block, expression]
-            fun_list[self.value] = [self.left, self.right, self.child]
-            return fun_list[self.value]
+            # [parameter_list, block, expression, frame size, result cache]
+            ctx.fun_list[self.value] = [self.left, self.right, self.child, self.nlocals, 
+                                        ctx.memos.get(self.value)]
+            return ctx.fun_list[self.value]
         except: 
             raise SemanticError()
 
       
 class AST_FunctionCall(Node): 
+    __slots__ = ('value', 'child')
+
     def __init__(self, name, parameter_list): 
         super().__init__()
         self.value = name 
         self.child = parameter_list
         
-    def eval(self): 
+    def eval(self, ctx): 
         try: 
-            func = fun_list[self.value]
+            func = ctx.fun_list[self.value]
             param = func[0]
             expr = func[2]
+            local_var = [UNSET] * func[3]
+            memo = func[4]
             func = func[1] 
 
             #Check arguments 
             if len(param) != len(self.child): 
                 raise SemanticError() 
                 
-            local_var = dict() 
-            #Add the parameter values into the local variable list 
+            #Add the parameter values into the local frame 
             for i in range(0, len(param)): 
-                var_name = param[i].getName()
-                var_value = self.child[i].eval() 
-                local_var[var_name] = var_value
+                local_var[param[i].slot] = self.child[i].eval(ctx) 
+
+            # Pure function already called with these arguments 
+            if memo is not None: 
+                key = memo.key([local_var[p.slot] for p in param])
+                if key is not None: 
+                    result = memo.lookup(key)
+                    if result is not MISSING: return result 
                 
-            #Push the local variable list into the stack 
-            var_list.insert(0, local_var) 
+            #Push the local frame onto the stack 
+            ctx.var_list.append(local_var) 
                             
-            func.eval() 
-            result = expr.eval()
-            #Pop the local variable list from the stack 
-            var_list.pop(0)
+            func.eval(ctx) 
+            result = expr.eval(ctx)
+            #Pop the local frame from the stack 
+            ctx.var_list.pop()
 
+            if memo is not None and key is not None: memo.store(key, result)
             return result
 
         except: 
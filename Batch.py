@@ -0,0 +1,144 @@
+# -------------------------------------------------------------- #
+# ------------------------- Batch.py --------------------------- #
+# -------------------------------------------------------------- #
+
+# Runs many SBML programs over a pool of worker processes:
+#
+#   python Batch.py [--jobs N] [--engine E] [-O N] FILE|DIRECTORY|PATTERN ...
+#
+# A directory stands for the .txt files in it, a pattern is expanded
+# like a shell glob (** included). Every worker builds the lexer and
+# the parser once and then runs programs one after the other, each
+# with its output captured. The outputs are written in the order of
+# the files, each after a "==> file <==" header; the result and the
+# time of every file and the throughput go to stderr.
+
+import argparse
+import glob
+import multiprocessing
+import os
+import sys
+import time
+import AST_Nodes as nodes
+import Engines as engines
+import Output as output
+
+OK = 'ok'
+SYNTAX = 'SYNTAX ERROR'
+SEMANTIC = 'SEMANTIC ERROR'
+
+class Result():
+    def __init__(self, path, text, status, errors, seconds):
+        self.path = path
+        self.text = text       # Captured output, error message included
+        self.status = status   # OK, SYNTAX, SEMANTIC or another error message
+        self.errors = errors   # Statically certain errors (-O)
+        self.seconds = seconds # Parse and run time
+
+# Settings of this worker, set by startWorker
+settings = None
+
+def startWorker(engine, level, memo):
+    global settings
+    import Lexer, Parser
+    Lexer.getLexer()
+    Parser.getParser()
+    settings = (engine, level, memo)
+
+# Run the program in path like sbml.py --no-cache would
+def runFile(path):
+    import Parser as parser
+    engine, level, memo = settings
+    capture = output.Capture()
+    errors = []
+    status = OK
+    start = time.perf_counter()
+    try:
+        with open(path) as f:
+            contents = f.read()
+        tree, changes, errors = parser.prepare(contents, level)
+        if tree is not None:
+            memos = None
+            if memo is not None:
+                import Memo
+                memos = Memo.enable(tree, memo)
+            engines.execute(tree, engine, capture, None, memos)
+    except nodes.Error as e:
+        status = e.message
+    except ValueError as e:
+        status = str(e)
+    except OSError as e:
+        status = "cannot read: %s" % e.strerror
+    except Exception as e:
+        status = SYNTAX
+    seconds = time.perf_counter() - start
+    if status != OK and not status.startswith("cannot read"):
+        capture.write(status)
+    return Result(path, capture.getvalue(), status, errors, seconds)
+
+# Files named by the arguments, in order
+def expand(arguments):
+    paths = []
+    for argument in arguments:
+        if os.path.isdir(argument):
+            paths.extend(sorted(glob.glob(os.path.join(argument, '*.txt'))))
+        elif glob.has_magic(argument):
+            paths.extend(sorted(glob.glob(argument, recursive=True)))
+        else:
+            paths.append(argument)
+    return paths
+
+# Results of every file, in order, as they are done
+def runAll(paths, engine='tree', level=0, memo=None, jobs=None):
+    jobs = jobs or os.cpu_count() or 1
+    # Small batches keep the workers busy without much messaging
+    chunk = max(1, min(16, len(paths) // (jobs * 4)))
+    with multiprocessing.Pool(jobs, startWorker, (engine, level, memo)) as pool:
+        for result in pool.imap(runFile, paths, chunk):
+            yield result
+
+def getOptions():
+    options = argparse.ArgumentParser(description="Run many SBML programs over a process pool")
+    options.add_argument('files', nargs='+', metavar='FILE',
+                         help="SBML source files, directories or glob patterns")
+    options.add_argument('--jobs', '-j', type=int, default=None,
+                         help="worker processes (default: one per CPU)")
+    options.add_argument('--engine', choices=sorted(engines.ENGINES), default='tree',
+                         help="execution engine (default: tree)")
+    options.add_argument('-O', type=int, choices=[0, 1, 2], default=0, dest='level',
+                         help="optimization level (default: 0)")
+    options.add_argument('--memo', type=int, default=None, metavar='SIZE',
+                         help="cache SIZE results per pure function (tree engine only)")
+    options.add_argument('--quiet', '-q', action='store_true',
+                         help="don't write the program outputs, only the results")
+    return options
+
+def main():
+    options = getOptions()
+    args = options.parse_args()
+    if args.memo is not None and args.engine != 'tree':
+        options.error("--memo requires --engine=tree")
+    paths = expand(args.files)
+    if not paths:
+        options.error("no files")
+    counts = dict()
+    busy = 0.0
+    start = time.perf_counter()
+    for result in runAll(paths, args.engine, args.level, args.memo, args.jobs):
+        if not args.quiet:
+            sys.stdout.write("==> %s <==\n%s" % (result.path, result.text))
+        for error in result.errors:
+            sys.stderr.write("%s: %s\n" % (result.path, error))
+        sys.stderr.write("%10.2f ms  %-14s %s\n" % (result.seconds * 1000, result.status, result.path))
+        key = result.status if result.status in (OK, SYNTAX, SEMANTIC) else 'other errors'
+        counts[key] = counts.get(key, 0) + 1
+        busy += result.seconds
+    sys.stdout.flush()
+    elapsed = time.perf_counter() - start
+    sys.stderr.write("%d files in %.2f s: %.1f files/s, %.2f s in the programs\n" %
+                     (len(paths), elapsed, len(paths) / elapsed, busy))
+    sys.stderr.write(", ".join("%s %d" % (key, counts[key]) for key in sorted(counts)) + "\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
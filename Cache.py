@@ -0,0 +1,78 @@
+# -------------------------------------------------------------- #
+# ------------------------- Cache.py --------------------------- #
+# -------------------------------------------------------------- #
+
+# On-disk cache of parsed programs, like __pycache__. The prepared
+# tree of source.txt (parsed, resolved and optimized) is pickled to
+# __sbmlcache__/source.txt.O<level>.pickle next to the source file.
+#
+# An entry stores the key it was built for: a hash of the program
+# text and of the modules that build the tree. A changed program or
+# a changed interpreter gives another key, the entry is then stale
+# and gets rebuilt. This module must not import Parser.py so that a
+# cache hit never loads PLY.
+
+import hashlib
+import os
+import pickle
+import sys
+
+CACHE_DIRECTORY = '__sbmlcache__'
+
+# Modules whose source decides what the cached tree looks like
+MODULES = ('Lexer.py', 'Parser.py', 'AST_Nodes.py', 'Values.py', 'Resolver.py',
+           'Operators.py', 'Optimizer.py', 'TypeInference.py', 'Cache.py')
+
+interpreterVersion = None
+
+def version():
+    global interpreterVersion
+    if interpreterVersion is None:
+        digest = hashlib.sha256(sys.version.encode())
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for module in MODULES:
+            with open(os.path.join(directory, module), 'rb') as f:
+                digest.update(f.read())
+        interpreterVersion = digest.hexdigest()
+    return interpreterVersion
+
+def key(contents, level):
+    digest = hashlib.sha256(contents.encode())
+    digest.update(("%s %d" % (version(), level)).encode())
+    return digest.hexdigest()
+
+def cachePath(path, level):
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, CACHE_DIRECTORY, "%s.O%d.pickle" % (name, level))
+
+class Entry():
+    def __init__(self, key, tree, changes, errors):
+        self.key = key
+        self.tree = tree       # AST_Execute ready to run
+        self.changes = changes # Optimizer changes
+        self.errors = errors   # Statically certain errors
+
+# Entry for the program in path, None when missing or stale
+def load(path, contents, level=0):
+    try:
+        with open(cachePath(path, level), 'rb') as f:
+            entry = pickle.load(f)
+    except Exception:
+        return None
+    if type(entry) != Entry or entry.key != key(contents, level):
+        return None
+    return entry
+
+# Write the entry, a failure only means the next run parses again
+def store(path, contents, level, tree, changes, errors):
+    target = cachePath(path, level)
+    temporary = "%s.%d.tmp" % (target, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(temporary, 'wb') as f:
+            pickle.dump(Entry(key(contents, level), tree, changes, errors), f,
+                        pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, target)
+    except Exception:
+        try: os.remove(temporary)
+        except OSError: pass
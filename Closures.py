@@ -0,0 +1,311 @@
+# -------------------------------------------------------------- #
+# ----------------------- Closures.py -------------------------- #
+# -------------------------------------------------------------- #
+
+# Closure-compiling engine. The tree is walked once and every node is
+# turned into a Python closure taking the local variable dictionary.
+# Operator choice, type-check strategy and children are bound when
+# the closure is built, so evaluating it does no string comparisons.
+
+from AST_Nodes import *
+import Operators as ops
+import Output as output
+import operator
+
+# Python operator used when both operands are ints, where Python and
+# SBML agree
+INT_OPERATORS = {'+': operator.add,
+                 '-': operator.sub,
+                 '*': operator.mul,
+                 '/': operator.truediv,
+                 '**': operator.pow,
+                 'div': operator.floordiv,
+                 'mod': operator.mod,
+                 '<=': operator.le,
+                 '<': operator.lt,
+                 '==': operator.eq,
+                 '<>': operator.ne,
+                 '>=': operator.ge,
+                 '>': operator.gt
+                }
+
+LITERALS = (AST_Number, AST_String, AST_Boolean)
+
+def fail(local):
+    raise SemanticError()
+
+class Compiler():
+    def __init__(self, sink=None):
+        self.sink = sink if sink is not None else output.sink
+        self.globals = dict()
+        self.functions = dict() # Function name -> [parameter names, block, expression]
+        self.inMain = False
+
+    def compileProgram(self, tree):
+        # Functions are all registered before the main block runs, the
+        # last definition of a name wins. Entries are filled in after
+        # all of them exist so that calls can be resolved statically.
+        definitions = dict()
+        for func in tree.left:
+            definitions[func.value] = func
+        for name in definitions:
+            self.functions[name] = [[p.getName() for p in definitions[name].left], None, None]
+
+        self.inMain = False
+        for name in definitions:
+            func = definitions[name]
+            self.functions[name][1] = self.statement(func.right)
+            self.functions[name][2] = self.expression(func.child)
+
+        self.inMain = True
+        main = self.statement(tree.right)
+        glob = self.globals
+        return lambda: main(glob)
+
+    def dispatch(self, table, node):
+        for cls in type(node).__mro__:
+            if cls in table:
+                return table[cls](self, node)
+        raise SemanticError()
+
+    # --- Statements
+    def statement(self, node):
+        return self.dispatch(STATEMENTS, node)
+
+    def block(self, node):
+        statements = tuple(self.statement(s) for s in node.value)
+        if len(statements) == 1:
+            return statements[0]
+        def block(local):
+            for statement in statements:
+                statement(local)
+        return block
+
+    def printStatement(self, node):
+        expression = self.expression(node.value)
+        write = self.sink.write
+        def printStatement(local):
+            write(expression(local))
+        return printStatement
+
+    # Assign following AST_Assignment: local list first, then global
+    # list, else a new local. In the main block both lists are the same
+    # dictionary.
+    def assignment(self, node):
+        name = node.value.getName()
+        expression = self.expression(node.child)
+        glob = self.globals
+        if self.inMain:
+            def assignment(local):
+                glob[name] = expression(local)
+        else:
+            def assignment(local):
+                value = expression(local)
+                if name in local or name not in glob: local[name] = value
+                else: glob[name] = value
+        return assignment
+
+    def indexAssignment(self, node):
+        indices = tuple(self.expression(i) for i in node.value)
+        variable = self.variable(node.left)
+        expression = self.expression(node.right)
+        def indexAssignment(local):
+            values = [i(local) for i in indices]
+            ops.indexAssign(variable(local), values, expression(local))
+        return indexAssignment
+
+    def ifStatement(self, node):
+        condition = self.expression(node.value)
+        block = self.statement(node.child)
+        def ifStatement(local):
+            value = condition(local)
+            if value is True: block(local)
+            elif value is not False: raise SemanticError()
+        return ifStatement
+
+    def ifElse(self, node):
+        condition = self.expression(node.left.value)
+        block = self.statement(node.left.child)
+        elseBlock = self.statement(node.right)
+        def ifElse(local):
+            value = condition(local)
+            if value is True: block(local)
+            elif value is False: elseBlock(local)
+            else: raise SemanticError()
+        return ifElse
+
+    def whileStatement(self, node):
+        condition = self.expression(node.value)
+        block = self.statement(node.child)
+        def whileStatement(local):
+            while condition(local) != False:
+                block(local)
+        return whileStatement
+
+    # --- Expressions
+    def expression(self, node):
+        return self.dispatch(EXPRESSIONS, node)
+
+    def literal(self, node):
+        value = node.value
+        return lambda local: value
+
+    def variable(self, node):
+        name = node.getName()
+        glob = self.globals
+        if self.inMain:
+            def variable(local):
+                return glob[name]
+        else:
+            def variable(local):
+                try: return local[name]
+                except KeyError: return glob[name]
+        return variable
+
+    def binary(self, node, function, intFunction):
+        # Operand types proven by TypeInference.py
+        if getattr(node, 'fast', None) is not None:
+            function = node.fast
+            intFunction = None
+        left = self.expression(node.left)
+        if type(node.right) in LITERALS:
+            # Literal right operand, its type is known now
+            right = node.right.value
+            if intFunction is not None and type(right) is int:
+                def binary(local):
+                    value = left(local)
+                    if type(value) is int: return intFunction(value, right)
+                    return function(value, right)
+            else:
+                def binary(local):
+                    return function(left(local), right)
+            return binary
+
+        right = self.expression(node.right)
+        if intFunction is None:
+            def binary(local):
+                return function(left(local), right(local))
+        else:
+            def binary(local):
+                l = left(local)
+                r = right(local)
+                if type(l) is int and type(r) is int: return intFunction(l, r)
+                return function(l, r)
+        return binary
+
+    def operation(self, node):
+        return self.binary(node, ops.BINARY[node.value], INT_OPERATORS[node.value])
+
+    def disjunction(self, node):
+        return self.binary(node, ops.disjunction, None)
+
+    def conjunction(self, node):
+        return self.binary(node, ops.conjunction, None)
+
+    def membership(self, node):
+        return self.binary(node, ops.membership, None)
+
+    def cons(self, node):
+        return self.binary(node, ops.cons, None)
+
+    def negation(self, node):
+        child = self.expression(node.child)
+        if node.fast is not None:
+            return lambda local: not child(local)
+        return lambda local: ops.negation(child(local))
+
+    def uminus(self, node):
+        child = self.expression(node.child)
+        return lambda local: ops.uminus(child(local))
+
+    def index(self, node):
+        # Indices are evaluated before the indexed value
+        indices = tuple(self.expression(i) for i in node.value)
+        if type(node.child) == str:
+            child = node.child
+            value = lambda local: child
+        else: value = self.expression(node.child)
+        def index(local):
+            values = [i(local) for i in indices]
+            return ops.index(value(local), values)
+        return index
+
+    def tupleIndex(self, node):
+        if type(node.child) == str: value = self.variable(AST_Variable(node.child))
+        else: value = self.expression(node.child)
+        position = node.value
+        return lambda local: ops.tupleIndex(value(local), position)
+
+    def listLiteral(self, node):
+        elements = tuple(self.expression(e) for e in node.value)
+        return lambda local: [e(local) for e in elements]
+
+    def tupleLiteral(self, node):
+        # A tuple built from a single expression is not iterable and
+        # fails in AST_Tuple.eval
+        if type(node.value) != tuple and type(node.value) != list:
+            return fail
+        elements = tuple(self.expression(e) for e in node.value)
+        return lambda local: tuple([e(local) for e in elements])
+
+    def functionCall(self, node):
+        # The function table is fixed before the main block runs, an
+        # unknown name or a wrong argument count fails before the
+        # arguments are evaluated
+        if node.value not in self.functions:
+            return fail
+        func = self.functions[node.value]
+        params = func[0]
+        if len(params) != len(node.child):
+            return fail
+        args = tuple(self.expression(a) for a in node.child)
+        def functionCall(local):
+            # Add the parameter values into a new local variable list
+            frame = dict(zip(params, [a(local) for a in args]))
+            func[1](frame)
+            return func[2](frame)
+        return functionCall
+
+    def callStatement(self, node):
+        return self.functionCall(node)
+
+STATEMENTS = {AST_Block: Compiler.block,
+              AST_Print: Compiler.printStatement,
+              AST_Assignment: Compiler.assignment,
+              AST_IndexAssignment: Compiler.indexAssignment,
+              AST_IfElse: Compiler.ifElse,
+              AST_If: Compiler.ifStatement,
+              AST_While: Compiler.whileStatement,
+              AST_FunctionCall: Compiler.callStatement
+             }
+
+EXPRESSIONS = {AST_Number: Compiler.literal,
+               AST_String: Compiler.literal,
+               AST_Boolean: Compiler.literal,
+               AST_Variable: Compiler.variable,
+               BinOp: Compiler.operation,
+               Compare: Compiler.operation,
+               Disjunction: Compiler.disjunction,
+               Conjunction: Compiler.conjunction,
+               Membership: Compiler.membership,
+               Cons: Compiler.cons,
+               Negation: Compiler.negation,
+               UMinus: Compiler.uminus,
+               Index: Compiler.index,
+               Tuple_Index: Compiler.tupleIndex,
+               AST_List: Compiler.listLiteral,
+               AST_Tuple: Compiler.tupleLiteral,
+               AST_FunctionCall: Compiler.functionCall
+              }
+
+def compileTree(tree, sink=None):
+    return Compiler(sink).compileProgram(tree)
+
+def run(tree, sink=None):
+    try:
+        program = compileTree(tree, sink)
+        program()
+    except SemanticError:
+        raise
+    except Exception:
+        raise SemanticError()
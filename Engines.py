@@ -0,0 +1,60 @@
+# -------------------------------------------------------------- #
+# ------------------------ Engines.py -------------------------- #
+# -------------------------------------------------------------- #
+
+# Execution engines for a parsed program. 'tree' is the reference
+# tree-walking evaluator in AST_Nodes.py, the others must produce the
+# same output and the same SYNTAX ERROR / SEMANTIC ERROR results.
+
+from AST_Nodes import Error, Interpreter
+import Output as output
+
+# sink: where print goes, the current sink of Output.py by default.
+# packed: pack numeric list literals, Values.packing by default; only
+# the tree-walker packs lists. memos: result caches of Memo.enable,
+# only used by the tree-walker.
+def runTree(tree, sink=None, packed=None, memos=None):
+    Interpreter(sink, packed, memos).run(tree)
+
+def runVM(tree, sink=None, packed=None, memos=None):
+    import VM
+    VM.run(tree, sink)
+
+def runClosures(tree, sink=None, packed=None, memos=None):
+    import Closures
+    Closures.run(tree, sink)
+
+def runNative(tree, sink=None, packed=None, memos=None):
+    import Native
+    Native.run(tree, sink)
+
+ENGINES = {'tree': runTree,
+           'vm': runVM,
+           'closure': runClosures,
+           'native': runNative
+          }
+
+def execute(tree, engine='tree', sink=None, packed=None, memos=None):
+    ENGINES[engine](tree, sink, packed, memos)
+
+# Execute a prepared program and print its error like Parser.parseAll.
+# memo: cache size for the pure functions (tree engine), None disables it
+# sink, packed: see runTree, the error goes to the same sink
+# Returns the caches of Memo.enable, None without memo
+def run(tree, engine='tree', memo=None, sink=None, packed=None):
+    if sink is None: sink = output.sink
+    memos = None
+    try:
+        if memo is not None:
+            import Memo
+            memos = Memo.enable(tree, memo)
+        execute(tree, engine, sink, packed, memos)
+    except Error as e:
+        sink.write(e.message)
+    except ValueError as e:
+        sink.write(e)
+    except Exception as e:
+        sink.write("SYNTAX ERROR")
+    finally:
+        sink.flush()
+    return memos
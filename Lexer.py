@@ -113,11 +113,61 @@ def t_newline(t):
     r'\n+'
     t.lexer.lineno += t.value.count("\n")    
     
-# Build the lexer
+# The lexer is built on first use. The prebuilt table sbml_lextab.py 
+# (see build_tables.py) is used when it was built from the rules of 
+# this file; build_tables.py --check tells when it is out of date. 
+# A lexer holds the input it scans: Parser.parse scans with a clone. 
 import ply.lex as lex
-lexer = lex.lex()
+import importlib
+import hashlib
+import os
+import sys
+import threading
+LEXTAB = 'sbml_lextab'
+lexer = None
+lock = threading.Lock()
+
+# Hash of what the table is built from: the tokens, the states and the 
+# t_ rules, the strings and the regexes of the functions in the order 
+# they are defined. Comments and the code in the functions don't count. 
+def sourceHash(): 
+    module = sys.modules[__name__]
+    functions = []
+    strings = []
+    for name in dir(module): 
+        if not name.startswith('t_'): continue
+        rule = getattr(module, name)
+        if callable(rule): functions.append((rule.__code__.co_firstlineno, name, rule.__doc__))
+        else: strings.append((name, rule))
+    functions = [(name, regex) for line, name, regex in sorted(functions)]
+    source = (tokens, getattr(module, 'literals', ''), getattr(module, 'states', ()), 
+              functions, sorted(strings))
+    return hashlib.sha256(repr(source).encode()).hexdigest()
+
+# Whether sbml_lextab.py was built from the rules of this file 
+def tableCurrent(): 
+    try: 
+        table = importlib.import_module(LEXTAB)
+    except ImportError: 
+        return False
+    return getattr(table, '_source', None) == sourceHash()
+
+def getLexer(): 
+    global lexer
+    with lock: 
+        if lexer is None: 
+            lexer = lex.lex(module=sys.modules[__name__], optimize=tableCurrent(), lextab=LEXTAB)
+    return lexer
+
+# Write sbml_lextab.py into directory 
+def buildTable(directory): 
+    table = lex.lex(module=sys.modules[__name__])
+    table.writetab(LEXTAB, directory)
+    with open(os.path.join(directory, LEXTAB + '.py'), 'a') as f: 
+        f.write("_source = %r\n" % sourceHash())
 
 def tokenize(inp):
+    lexer = getLexer()
     lexer.input(inp)
     while True:
         try: 
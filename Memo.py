@@ -0,0 +1,148 @@
+# -------------------------------------------------------------- #
+# ------------------------- Memo.py ---------------------------- #
+# -------------------------------------------------------------- #
+
+# Memoization of pure functions for the tree-walker (--memo).
+#
+# A function is pure when its result only depends on its arguments:
+# it does not print, does not assign into a list, only uses its
+# parameters and variables the main block never creates (any other
+# name may be a global), and only calls pure functions. Calls to a
+# pure function whose arguments are all ints, floats, strings or
+# booleans are looked up in a per-function LRU cache first. Only
+# results that cannot be changed later (no lists) are stored.
+
+from AST_Nodes import *
+from collections import OrderedDict
+
+DEFAULT_SIZE = 4096
+
+SCALARS = (int, float, str, bool)
+
+class Memo():
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # Cache key of the argument values, None if they can't be cached.
+    # The type is part of the key so 1, 1.0 and True stay apart.
+    def key(self, args):
+        key = []
+        for arg in args:
+            if type(arg) not in SCALARS: return None
+            if type(arg) == float: key.append((float, arg.hex()))
+            else: key.append((type(arg), arg))
+        return tuple(key)
+
+    def lookup(self, key):
+        value = self.cache.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.cache.move_to_end(key)
+        return value
+
+    def store(self, key, value):
+        if not immutable(value): return
+        self.cache[key] = value
+        if len(self.cache) > self.size:
+            self.cache.popitem(last=False)
+
+def immutable(value):
+    if type(value) in SCALARS: return True
+    if type(value) == tuple:
+        for element in value:
+            if not immutable(element): return False
+        return True
+    return False
+
+# ------------------------- Purity ----------------------------- #
+class Summary():
+    def __init__(self):
+        self.names = set() # Variables read or assigned
+        self.calls = set() # Names of the called functions
+        self.effects = False # Prints or assigns into a list
+
+def summarize(node, summary):
+    if isinstance(node, AST_Variable):
+        summary.names.add(node.getName())
+    elif isinstance(node, Tuple_Index) and type(node.child) == str:
+        summary.names.add(node.child)
+    elif isinstance(node, AST_FunctionCall):
+        summary.calls.add(node.value)
+    elif isinstance(node, (AST_Print, AST_IndexAssignment)):
+        summary.effects = True
+
+    for attribute in ('value', 'left', 'right', 'child'):
+        child = getattr(node, attribute, None)
+        if isinstance(child, Node):
+            summarize(child, summary)
+        elif type(child) == list or type(child) == tuple:
+            for element in child:
+                if isinstance(element, Node): summarize(element, summary)
+    return summary
+
+# Names assigned by the main block, the only place globals are created
+def mainNames(node, names):
+    if isinstance(node, AST_Assignment):
+        names.add(node.value.getName())
+    for attribute in ('value', 'left', 'right', 'child'):
+        child = getattr(node, attribute, None)
+        if isinstance(child, Node):
+            mainNames(child, names)
+        elif type(child) == list:
+            for element in child:
+                if isinstance(element, Node): mainNames(element, names)
+    return names
+
+# Names of the pure functions of the program
+def pureFunctions(tree):
+    # The last definition of a name wins
+    definitions = dict()
+    for func in tree.left:
+        definitions[func.value] = func
+    mainAssigned = mainNames(tree.right, set())
+
+    candidates = dict()
+    for name in definitions:
+        func = definitions[name]
+        summary = summarize(func.right, Summary())
+        summarize(func.child, summary)
+        params = set(p.getName() for p in func.left)
+        if summary.effects or (summary.names - params) & mainAssigned:
+            continue
+        candidates[name] = summary.calls
+
+    # Drop functions calling anything but a pure function until
+    # nothing changes
+    changed = True
+    while changed:
+        changed = False
+        for name in list(candidates):
+            for call in candidates[name]:
+                if call not in candidates:
+                    del candidates[name]
+                    changed = True
+                    break
+    return set(candidates)
+
+# New caches for the pure functions of tree by name, for one run: the
+# Interpreter given them registers each with its function (see
+# Engines.run), report prints them. The pure functions of a tree are
+# found on the first call only, the tree is not changed otherwise.
+def enable(tree, size=DEFAULT_SIZE):
+    if tree.pure is None: tree.pure = frozenset(pureFunctions(tree))
+    memos = dict()
+    for name in tree.pure:
+        memos[name] = Memo(name, size)
+    return memos
+
+def report(out, memos):
+    for name in sorted(memos):
+        memo = memos[name]
+        out.write("memo %s: %d hits, %d misses, %d cached\n" %
+                  (name, memo.hits, memo.misses, len(memo.cache)))
@@ -0,0 +1,458 @@
+# -------------------------------------------------------------- #
+# ------------------------ Native.py --------------------------- #
+# -------------------------------------------------------------- #
+
+# Native engine. The tree is translated into Python source: SBML
+# functions become Python functions, while loops become Python while
+# loops, and the result is compiled with compile() so that CPython's
+# own bytecode interpreter runs the program.
+#
+# Variables are named v_<name> and functions f_<name>. The main block
+# is the function _main whose variables are Python globals. Inside a
+# function a variable is a Python local, except for names that the
+# main block also assigns and the function assigns before knowing
+# whether the global exists. Those follow AST_Assignment at runtime:
+# they start as _UNSET and fall back to the global dictionary _G.
+#
+# Operations whose operands may both be ints get an inline Python
+# fast path, everything else goes through Operators.py so the usual
+# typeCheck rules apply.
+
+from AST_Nodes import *
+import Operators as ops
+import Output as output
+import builtins
+
+# Python spelling of the operators with an int x int fast path
+PYTHON_OPERATORS = {'+': '+',
+                    '-': '-',
+                    '*': '*',
+                    '/': '/',
+                    '**': '**',
+                    'div': '//',
+                    'mod': '%',
+                    '<=': '<=',
+                    '<': '<',
+                    '==': '==',
+                    '<>': '!=',
+                    '>=': '>=',
+                    '>': '>'
+                   }
+
+# Operator helper names in the generated code
+HELPERS = {'+': '_add',
+           '-': '_subtract',
+           '*': '_multiply',
+           '/': '_divide',
+           '**': '_power',
+           'div': '_intDivide',
+           'mod': '_modulus',
+           '<=': '_lessEqual',
+           '<': '_lessThan',
+           '==': '_equals',
+           '<>': '_notEqual',
+           '>=': '_greaterEqual',
+           '>': '_greaterThan'
+          }
+
+# Nodes whose value is always a boolean when evaluation succeeds
+BOOLEAN_NODES = (Compare, Conjunction, Disjunction, Negation, Membership)
+
+class _Unset():
+    def __repr__(self):
+        return '_UNSET'
+
+UNSET = _Unset()
+
+def fail():
+    raise SemanticError()
+
+# Argument order follows the evaluation order of the tree-walker:
+# indices first, then the indexed value
+def index(indices, value):
+    return ops.index(value, indices)
+
+def indexAssign(indices, variable, value):
+    ops.indexAssign(variable, indices, value)
+
+def namespace(sink=None):
+    if sink is None: sink = output.sink
+    ns = {'_add': ops.add,
+          '_subtract': ops.subtract,
+          '_multiply': ops.multiply,
+          '_divide': ops.divide,
+          '_power': ops.power,
+          '_intDivide': ops.intDivide,
+          '_modulus': ops.modulus,
+          '_lessEqual': ops.lessEqual,
+          '_lessThan': ops.lessThan,
+          '_equals': ops.equals,
+          '_notEqual': ops.notEqual,
+          '_greaterEqual': ops.greaterEqual,
+          '_greaterThan': ops.greaterThan,
+          '_conjunction': ops.conjunction,
+          '_disjunction': ops.disjunction,
+          '_negation': ops.negation,
+          '_uminus': ops.uminus,
+          '_membership': ops.membership,
+          '_cons': ops.cons,
+          '_tupleIndex': ops.tupleIndex,
+          '_index': index,
+          '_indexAssign': indexAssign,
+          '_fail': fail,
+          '_print': sink.write,
+          '_UNSET': UNSET
+         }
+    ns['_G'] = ns
+    return ns
+
+# Names assigned by the AST_Assignment statements below node
+def assignedNames(node, names):
+    if isinstance(node, AST_Assignment):
+        names.add(node.value.getName())
+    elif isinstance(node, AST_Block):
+        for statement in node.value:
+            assignedNames(statement, names)
+    elif isinstance(node, AST_IfElse):
+        assignedNames(node.left, names)
+        assignedNames(node.right, names)
+    elif isinstance(node, (AST_If, AST_While)):
+        assignedNames(node.child, names)
+    return names
+
+# Names of every variable read or written below node
+def usedNames(node, names):
+    if isinstance(node, AST_Variable):
+        names.add(node.getName())
+    elif isinstance(node, Tuple_Index) and type(node.child) == str:
+        names.add(node.child)
+    for attribute in ('value', 'left', 'right', 'child'):
+        child = getattr(node, attribute, None)
+        if isinstance(child, Node):
+            usedNames(child, names)
+        elif type(child) == list or type(child) == tuple:
+            for element in child:
+                if isinstance(element, Node): usedNames(element, names)
+    return names
+
+class Generator():
+    def __init__(self):
+        self.lines = []
+        self.depth = 0
+        self.temps = 0
+        self.constants = []
+        self.functions = dict() # Function name -> number of parameters
+        self.mainNames = set()  # Names the main block assigns
+        self.dual = set()       # Names looked up local first, then global
+
+    def emit(self, line):
+        self.lines.append("    " * self.depth + line)
+
+    def temp(self):
+        self.temps += 1
+        return "_t%d" % self.temps
+
+    def generate(self, tree):
+        # Functions are all registered before the main block runs, the
+        # last definition of a name wins
+        definitions = dict()
+        for func in tree.left:
+            definitions[func.value] = func
+        for name in definitions:
+            self.functions[name] = len(definitions[name].left)
+        assignedNames(tree.right, self.mainNames)
+
+        for name in definitions:
+            self.function(definitions[name])
+
+        self.dual = set()
+        names = usedNames(tree.right, set())
+        self.emit("def _main():")
+        self.depth += 1
+        if names:
+            self.emit("global " + ", ".join(sorted("v_" + n for n in names)))
+        self.statement(tree.right)
+        self.depth -= 1
+        return "\n".join(self.lines) + "\n"
+
+    def function(self, node):
+        params = [p.getName() for p in node.left]
+        assigned = assignedNames(node.right, set())
+        # A parameter is always set locally, so are names the main block
+        # never creates. The remaining assigned names may be global.
+        self.dual = (assigned & self.mainNames) - set(params)
+
+        if len(set(params)) == len(params):
+            self.emit("def f_%s(%s):" % (node.value, ", ".join("v_" + p for p in params)))
+            self.depth += 1
+        else:
+            # Repeated parameter names, the last argument wins
+            args = ["_a%d" % i for i in range(len(params))]
+            self.emit("def f_%s(%s):" % (node.value, ", ".join(args)))
+            self.depth += 1
+            for i in range(len(params)):
+                self.emit("v_%s = %s" % (params[i], args[i]))
+        for name in sorted(self.dual):
+            self.emit("v_%s = _UNSET" % name)
+        self.statement(node.right)
+        self.emit("return " + self.expression(node.child))
+        self.depth -= 1
+        self.emit("")
+
+    def dispatch(self, table, node):
+        for cls in type(node).__mro__:
+            if cls in table:
+                return table[cls](self, node)
+        raise SemanticError()
+
+    # --- Statements
+    def statement(self, node):
+        self.dispatch(STATEMENTS, node)
+
+    def block(self, node):
+        if len(node.value) == 0:
+            self.emit("pass")
+        for statement in node.value:
+            self.statement(statement)
+
+    def printStatement(self, node):
+        self.emit("_print(%s)" % self.expression(node.value))
+
+    def assignment(self, node):
+        name = node.value.getName()
+        value = self.expression(node.child)
+        if name not in self.dual:
+            self.emit("v_%s = %s" % (name, value))
+            return
+        self.emit("_v = " + value)
+        self.emit("if v_%s is _UNSET and 'v_%s' in _G: _G['v_%s'] = _v" % (name, name, name))
+        self.emit("else: v_%s = _v" % name)
+
+    def indexAssignment(self, node):
+        indices = ", ".join(self.expression(i) for i in node.value)
+        self.emit("_indexAssign([%s], %s, %s)" % (indices, self.variable(node.left),
+                                                  self.expression(node.right)))
+
+    # Emit the header of an if statement on node, the condition must be
+    # a boolean. Returns the header of the matching else clause.
+    def condition(self, node):
+        if isinstance(node, BOOLEAN_NODES):
+            self.emit("if %s:" % self.expression(node))
+            return "else:"
+        self.emit("_c = " + self.expression(node))
+        self.emit("if _c is True:")
+        return "elif _c is False:"
+
+    def checkCondition(self, node):
+        if not isinstance(node, BOOLEAN_NODES):
+            self.emit("elif _c is not False:")
+            self.emit("    _fail()")
+
+    def ifStatement(self, node):
+        self.condition(node.value)
+        self.depth += 1
+        self.statement(node.child)
+        self.depth -= 1
+        self.checkCondition(node.value)
+
+    def ifElse(self, node):
+        elseClause = self.condition(node.left.value)
+        self.depth += 1
+        self.statement(node.left.child)
+        self.depth -= 1
+        self.emit(elseClause)
+        self.depth += 1
+        self.statement(node.right)
+        self.depth -= 1
+        if not isinstance(node.left.value, BOOLEAN_NODES):
+            self.emit("else:")
+            self.emit("    _fail()")
+
+    def whileStatement(self, node):
+        if isinstance(node.value, BOOLEAN_NODES):
+            self.emit("while %s:" % self.expression(node.value))
+        else:
+            self.emit("while %s != False:" % self.expression(node.value))
+        self.depth += 1
+        self.statement(node.child)
+        self.depth -= 1
+
+    def callStatement(self, node):
+        self.emit(self.functionCall(node))
+
+    # --- Expressions
+    def expression(self, node):
+        return self.dispatch(EXPRESSIONS, node)
+
+    def literal(self, node):
+        value = node.value
+        if type(value) == float and value - value != 0:
+            pass # inf and nan have no literal
+        elif type(value) != int or abs(value) < 10 ** 100:
+            # A folded negative number is one operand: (-3) ** n, not -(3 ** n)
+            text = repr(value)
+            if text.startswith('-'): return "(%s)" % text
+            return text
+        self.constants.append(value)
+        return "_C[%d]" % (len(self.constants) - 1)
+
+    def variable(self, node):
+        name = node.getName()
+        if name in self.dual:
+            return "(v_%s if v_%s is not _UNSET else _G['v_%s'])" % (name, name, name)
+        return "v_" + name
+
+    # A variable can be read again instead of going through a temporary
+    # when the other operand cannot run a function that assigns it
+    def isSimple(self, node, other):
+        if isinstance(node, (AST_Number, AST_String, AST_Boolean)):
+            return True
+        if not isinstance(node, AST_Variable) or node.getName() in self.dual:
+            return False
+        return isinstance(other, (AST_Number, AST_String, AST_Boolean, AST_Variable))
+
+    def operation(self, node):
+        helper = HELPERS[node.value]
+        pythonOperator = PYTHON_OPERATORS[node.value]
+        left = self.expression(node.left)
+        right = self.expression(node.right)
+        # Operand types proven by TypeInference.py
+        if node.fast is not None:
+            return "(%s %s %s)" % (left, pythonOperator, right)
+        checks = []
+        operands = []
+        for child, other, code in ((node.left, node.right, left), (node.right, node.left, right)):
+            if isinstance(child, (AST_Number, AST_String, AST_Boolean)):
+                if type(child.value) != int:
+                    # Never two ints, no fast path
+                    return "%s(%s, %s)" % (helper, left, right)
+                operands.append(code)
+            elif self.isSimple(child, other):
+                checks.append("type(%s) is int" % code)
+                operands.append(code)
+            else:
+                temp = self.temp()
+                checks.append("(type(%s := %s) is int)" % (temp, code))
+                operands.append(temp)
+        fast = "%s %s %s" % (operands[0], pythonOperator, operands[1])
+        if not checks:
+            return "(%s)" % fast
+        if len(checks) == 1:
+            return "(%s if %s else %s(%s, %s))" % (fast, checks[0], helper, operands[0], operands[1])
+        # Both checks must run so that both temporaries are assigned
+        return "(%s if (%s) & (%s) else %s(%s, %s))" % (fast, checks[0], checks[1], helper,
+                                                       operands[0], operands[1])
+
+    def call(self, helper, *children):
+        return "%s(%s)" % (helper, ", ".join(self.expression(c) for c in children))
+
+    def disjunction(self, node):
+        if node.fast is not None:
+            return "(%s | %s)" % (self.expression(node.left), self.expression(node.right))
+        return self.call("_disjunction", node.left, node.right)
+
+    def conjunction(self, node):
+        if node.fast is not None:
+            return "(%s & %s)" % (self.expression(node.left), self.expression(node.right))
+        return self.call("_conjunction", node.left, node.right)
+
+    def membership(self, node):
+        return self.call("_membership", node.left, node.right)
+
+    def cons(self, node):
+        return self.call("_cons", node.left, node.right)
+
+    def negation(self, node):
+        if node.fast is not None:
+            return "(not %s)" % self.expression(node.child)
+        return self.call("_negation", node.child)
+
+    def uminus(self, node):
+        return self.call("_uminus", node.child)
+
+    def index(self, node):
+        indices = ", ".join(self.expression(i) for i in node.value)
+        if type(node.child) == str: value = repr(node.child)
+        else: value = self.expression(node.child)
+        return "_index([%s], %s)" % (indices, value)
+
+    def tupleIndex(self, node):
+        if type(node.child) == str: value = self.variable(AST_Variable(node.child))
+        else: value = self.expression(node.child)
+        return "_tupleIndex(%s, %d)" % (value, node.value)
+
+    def listLiteral(self, node):
+        return "[%s]" % ", ".join(self.expression(e) for e in node.value)
+
+    def tupleLiteral(self, node):
+        # A tuple built from a single expression is not iterable and
+        # fails in AST_Tuple.eval
+        if type(node.value) != tuple and type(node.value) != list:
+            return "_fail()"
+        return "(%s,)" % ", ".join(self.expression(e) for e in node.value)
+
+    def functionCall(self, node):
+        # The function table is fixed before the main block runs, an
+        # unknown name or a wrong argument count fails before the
+        # arguments are evaluated
+        if self.functions.get(node.value) != len(node.child):
+            return "_fail()"
+        return "f_%s(%s)" % (node.value, ", ".join(self.expression(a) for a in node.child))
+
+STATEMENTS = {AST_Block: Generator.block,
+              AST_Print: Generator.printStatement,
+              AST_Assignment: Generator.assignment,
+              AST_IndexAssignment: Generator.indexAssignment,
+              AST_IfElse: Generator.ifElse,
+              AST_If: Generator.ifStatement,
+              AST_While: Generator.whileStatement,
+              AST_FunctionCall: Generator.callStatement
+             }
+
+EXPRESSIONS = {AST_Number: Generator.literal,
+               AST_String: Generator.literal,
+               AST_Boolean: Generator.literal,
+               AST_Variable: Generator.variable,
+               BinOp: Generator.operation,
+               Compare: Generator.operation,
+               Disjunction: Generator.disjunction,
+               Conjunction: Generator.conjunction,
+               Membership: Generator.membership,
+               Cons: Generator.cons,
+               Negation: Generator.negation,
+               UMinus: Generator.uminus,
+               Index: Generator.index,
+               Tuple_Index: Generator.tupleIndex,
+               AST_List: Generator.listLiteral,
+               AST_Tuple: Generator.tupleLiteral,
+               AST_FunctionCall: Generator.functionCall
+              }
+
+# Python source of the program and the constants it refers to as _C
+def generate(tree):
+    generator = Generator()
+    source = generator.generate(tree)
+    return source, generator.constants
+
+def compileTree(tree, sink=None):
+    source, constants = generate(tree)
+    code = compile(source, "<sbml>", "exec")
+    ns = namespace(sink)
+    ns['_C'] = constants
+    exec(code, ns)
+    return ns['_main']
+
+def run(tree, sink=None):
+    try:
+        main = compileTree(tree, sink)
+    except (builtins.SyntaxError, RecursionError, MemoryError, ValueError):
+        # Python refuses some shapes of code (for instance loops nested
+        # more than 20 deep), run those programs with the closures
+        import Closures
+        main = Closures.compileTree(tree, sink)
+    try:
+        main()
+    except SemanticError:
+        raise
+    except Exception:
+        raise SemanticError()
@@ -0,0 +1,160 @@
+# -------------------------------------------------------------- #
+# ----------------------- Operators.py ------------------------- #
+# -------------------------------------------------------------- #
+
+# SBML operator semantics as plain functions. These mirror the
+# typeCheck rules of the nodes in AST_Nodes.py so that the compiled
+# engines behave exactly like the tree-walker. Python errors raised
+# by an operation (TypeError, ZeroDivisionError, IndexError, ...) are
+# left to propagate, the engines report them as a SEMANTIC ERROR.
+
+from AST_Nodes import SemanticError
+from Values import isList, ConsList
+
+NUMBERS = (int, float)
+COMPARABLE = (int, float, str)
+ADDABLE = (int, float, str, list)
+
+def addable(value):
+    return type(value) in ADDABLE or isList(value)
+
+# ------------------------ Booleans ---------------------------- #
+def disjunction(left, right):
+    if type(left) == bool and type(right) == bool:
+        return left or right
+    raise SemanticError()
+
+def conjunction(left, right):
+    if type(left) == bool and type(right) == bool:
+        return left and right
+    raise SemanticError()
+
+def negation(child):
+    if type(child) == bool:
+        return not child
+    raise SemanticError()
+
+# ----------------------- Comparisons -------------------------- #
+def lessEqual(left, right):
+    if type(left) in COMPARABLE and type(right) in COMPARABLE:
+        return left <= right
+    raise SemanticError()
+
+def lessThan(left, right):
+    if type(left) in COMPARABLE and type(right) in COMPARABLE:
+        return left < right
+    raise SemanticError()
+
+def equals(left, right):
+    if type(left) in COMPARABLE and type(right) in COMPARABLE:
+        return left == right
+    raise SemanticError()
+
+def notEqual(left, right):
+    if type(left) in COMPARABLE and type(right) in COMPARABLE:
+        return left != right
+    raise SemanticError()
+
+def greaterEqual(left, right):
+    if type(left) in COMPARABLE and type(right) in COMPARABLE:
+        return left >= right
+    raise SemanticError()
+
+def greaterThan(left, right):
+    if type(left) in COMPARABLE and type(right) in COMPARABLE:
+        return left > right
+    raise SemanticError()
+
+# ------------------------ Arithmetic -------------------------- #
+def add(left, right):
+    if addable(left) and addable(right):
+        return left + right
+    raise SemanticError()
+
+def subtract(left, right):
+    if type(left) in NUMBERS and type(right) in NUMBERS:
+        return left - right
+    raise SemanticError()
+
+def multiply(left, right):
+    if type(left) in NUMBERS and type(right) in NUMBERS:
+        return left * right
+    raise SemanticError()
+
+def divide(left, right):
+    if type(left) in NUMBERS and type(right) in NUMBERS:
+        return left / right
+    raise SemanticError()
+
+def power(left, right):
+    if type(left) in NUMBERS and type(right) in NUMBERS:
+        return left ** right
+    raise SemanticError()
+
+# Div and mod only allows Integers
+def intDivide(left, right):
+    if type(left) == int and type(right) == int:
+        return left // right
+    raise SemanticError()
+
+def modulus(left, right):
+    if type(left) == int and type(right) == int:
+        return left % right
+    raise SemanticError()
+
+def uminus(child):
+    if type(child) in NUMBERS:
+        return -1 * child
+    raise SemanticError()
+
+# ------------------------- Sequences -------------------------- #
+def membership(left, right):
+    if type(left) != str and type(right) == str:
+        raise SemanticError()
+    if type(right) != str and not isList(right):
+        raise SemanticError()
+    return left in right
+
+def cons(left, right):
+    if not isList(right):
+        raise SemanticError()
+    return ConsList.cons(left, right)
+
+def index(value, indices):
+    for i in indices:
+        if type(i) != int:
+            raise SemanticError()
+    if not isList(value) and type(value) != str:
+        raise SemanticError()
+
+    for i in indices:
+        if i >= len(value): raise SemanticError() # Index of of Bounds
+        value = value[i]
+    return value
+
+def tupleIndex(value, index):
+    if type(value) != tuple:
+        raise SemanticError()
+    return value[index - 1]
+
+# Walk down the nested lists and change the desired index
+def indexAssign(variable, indices, value):
+    for i in indices[:-1]:
+        variable = variable[i]
+    variable[indices[-1]] = value
+
+# Operator string -> function, as stored in BinOp.value / Compare.value
+BINARY = {'+': add,
+          '-': subtract,
+          '*': multiply,
+          '/': divide,
+          '**': power,
+          'div': intDivide,
+          'mod': modulus,
+          '<=': lessEqual,
+          '<': lessThan,
+          '==': equals,
+          '<>': notEqual,
+          '>=': greaterEqual,
+          '>': greaterThan
+         }
@@ -0,0 +1,211 @@
+# -------------------------------------------------------------- #
+# ----------------------- Optimizer.py ------------------------- #
+# -------------------------------------------------------------- #
+
+# Tree rewriting passes run between Parser.parse and the engines
+# (sbml.py -O LEVEL). Each pass rewrites the node tree in place and
+# records a line per change. A rewrite never changes what a program
+# prints or whether it fails: an operation that would raise is left
+# for runtime, and identities are only used where the operand is
+# known to be a number (or a boolean).
+#
+#   -O1  constant folding, dead branch elimination
+#   -O2  -O1 and algebraic simplification
+
+from AST_Nodes import *
+import Operators as ops
+
+# Folding results larger than this are left for runtime
+MAX_BITS = 4096
+MAX_LENGTH = 4096
+
+LITERALS = (AST_Number, AST_String, AST_Boolean)
+
+# Short description of a node for the change report
+def describe(node):
+    if isinstance(node, LITERALS): return repr(node.value)
+    if isinstance(node, AST_Variable): return node.getName()
+    if isinstance(node, (BinOp, Compare)):
+        return "(%s %s %s)" % (describe(node.left), node.value, describe(node.right))
+    if isinstance(node, Conjunction):
+        return "(%s andalso %s)" % (describe(node.left), describe(node.right))
+    if isinstance(node, Disjunction):
+        return "(%s orelse %s)" % (describe(node.left), describe(node.right))
+    if isinstance(node, Membership):
+        return "(%s in %s)" % (describe(node.left), describe(node.right))
+    if isinstance(node, Negation): return "not %s" % describe(node.child)
+    if isinstance(node, UMinus): return "-%s" % describe(node.child)
+    return type(node).__name__
+
+def literal(value):
+    if type(value) == bool: return AST_Boolean(value)
+    if type(value) == int or type(value) == float: return AST_Number(value)
+    if type(value) == str: return AST_String(value)
+    return None
+
+def isLiteral(node):
+    return type(node) in LITERALS
+
+class Pass():
+    name = 'pass'
+
+    def __init__(self):
+        self.changes = []
+
+    def change(self, message):
+        self.changes.append("%s: %s" % (self.name, message))
+
+    def run(self, tree):
+        for func in tree.left:
+            func.right = self.visit(func.right)
+            func.child = self.visit(func.child)
+        tree.right = self.visit(tree.right)
+        return tree
+
+    # Rewrite the children first, then the node itself
+    def visit(self, node):
+        self.visitChildren(node)
+        return self.rewrite(node)
+
+    def visitChildren(self, node):
+        if isinstance(node, AST_IfElse):
+            # The if part must stay an AST_If, AST_IfElse.eval relies on
+            # its False result
+            self.visitChildren(node.left)
+            node.right = self.visit(node.right)
+            return
+        for attribute in ('value', 'left', 'right', 'child'):
+            child = getattr(node, attribute, None)
+            if isinstance(child, Node):
+                setattr(node, attribute, self.visit(child))
+            elif type(child) == list:
+                setattr(node, attribute, [self.visit(c) if isinstance(c, Node) else c for c in child])
+
+    def rewrite(self, node):
+        return node
+
+# ---------------------- Constant folding ---------------------- #
+class ConstantFolding(Pass):
+    name = 'fold'
+
+    def compute(self, node):
+        if isinstance(node, (BinOp, Compare)):
+            if node.value == '**' and not self.smallPower(node.left.value, node.right.value):
+                return None
+            return ops.BINARY[node.value](node.left.value, node.right.value)
+        if isinstance(node, Conjunction):
+            return ops.conjunction(node.left.value, node.right.value)
+        if isinstance(node, Disjunction):
+            return ops.disjunction(node.left.value, node.right.value)
+        if isinstance(node, Membership):
+            return ops.membership(node.left.value, node.right.value)
+        if isinstance(node, Negation):
+            return ops.negation(node.child.value)
+        if isinstance(node, UMinus):
+            return ops.uminus(node.child.value)
+        return None
+
+    def smallPower(self, base, exponent):
+        if type(base) == int and type(exponent) == int and exponent > 0:
+            return abs(base).bit_length() * exponent <= MAX_BITS
+        return True
+
+    def rewrite(self, node):
+        if isinstance(node, (BinOp, Compare, Conjunction, Disjunction, Membership)):
+            if not (isLiteral(node.left) and isLiteral(node.right)): return node
+        elif isinstance(node, (Negation, UMinus)):
+            if not isLiteral(node.child): return node
+        else: return node
+
+        try: value = self.compute(node)
+        except Exception: return node # Fails at runtime
+        if type(value) == int and value.bit_length() > MAX_BITS: return node
+        if type(value) == str and len(value) > MAX_LENGTH: return node
+
+        result = literal(value)
+        if result is None: return node
+        self.change("%s -> %r" % (describe(node), value))
+        return result
+
+# -------------------- Dead branch elimination ----------------- #
+class DeadBranches(Pass):
+    name = 'prune'
+
+    def rewrite(self, node):
+        if isinstance(node, AST_IfElse):
+            condition = node.left.value
+            if type(condition) == AST_Boolean:
+                self.change("if (%s) ... else ... -> %s branch" %
+                            (describe(condition), "if" if condition.value else "else"))
+                return node.left.child if condition.value else node.right
+        elif isinstance(node, AST_If):
+            condition = node.value
+            if type(condition) == AST_Boolean:
+                self.change("if (%s) ... -> %s" %
+                            (describe(condition), "block" if condition.value else "removed"))
+                return node.child if condition.value else AST_Block([])
+        elif isinstance(node, AST_While):
+            # The loop runs while the condition != False, 0 stops it too
+            condition = node.value
+            if isLiteral(condition) and condition.value == False:
+                self.change("while (%s) ... -> removed" % describe(condition))
+                return AST_Block([])
+        return node
+
+# ------------------- Algebraic simplification ----------------- #
+# Operations whose result is always a number, and always an int
+NUMERIC_OPERATORS = ('-', '*', '/', 'div', 'mod')
+INT_OPERATORS = ('div', 'mod')
+BOOLEAN_NODES = (Compare, Conjunction, Disjunction, Negation, Membership)
+
+def isNumeric(node):
+    if type(node) == AST_Number: return True
+    if type(node) == UMinus: return True
+    return isinstance(node, BinOp) and node.value in NUMERIC_OPERATORS
+
+def isInt(node):
+    if type(node) == AST_Number: return type(node.value) == int
+    return isinstance(node, BinOp) and node.value in INT_OPERATORS
+
+def isLiteralInt(node, value):
+    return type(node) == AST_Number and type(node.value) == int and node.value == value
+
+class Simplification(Pass):
+    name = 'simplify'
+
+    def rewrite(self, node):
+        if isinstance(node, BinOp):
+            left, right = node.left, node.right
+            result = None
+            if node.value == '*':
+                if isLiteralInt(right, 1) and isNumeric(left): result = left
+                elif isLiteralInt(left, 1) and isNumeric(right): result = right
+            elif node.value == '-':
+                if isLiteralInt(right, 0) and isNumeric(left): result = left
+            elif node.value == '+':
+                # x + 0 turns -0.0 into 0.0, only ints are safe
+                if isLiteralInt(right, 0) and isInt(left): result = left
+                elif isLiteralInt(left, 0) and isInt(right): result = right
+            if result is not None:
+                self.change("%s -> %s" % (describe(node), describe(result)))
+                return result
+        elif type(node) == Negation and type(node.child) == Negation:
+            if isinstance(node.child.child, BOOLEAN_NODES):
+                self.change("%s -> %s" % (describe(node), describe(node.child.child)))
+                return node.child.child
+        return node
+
+# Passes run at each optimization level
+LEVELS = {0: [],
+          1: [ConstantFolding, DeadBranches],
+          2: [ConstantFolding, DeadBranches, Simplification]
+         }
+
+# Run the passes of level over tree, returns the list of changes
+def optimize(tree, level):
+    changes = []
+    for passClass in LEVELS[level]:
+        optimizer = passClass()
+        optimizer.run(tree)
+        changes.extend(optimizer.changes)
+    return changes
@@ -0,0 +1,83 @@
+# -------------------------------------------------------------- #
+# ------------------------ Output.py --------------------------- #
+# -------------------------------------------------------------- #
+
+# Where SBML print statements and error messages go. Every engine
+# writes the printed value to the current sink, or to the sink given to
+# Engines.run, which formats it like Python's print(value): str(value)
+# and a newline.
+#
+#   Stdout    writes each line to sys.stdout right away (the default)
+#   Buffered  keeps the lines until threshold characters are pending
+#   Capture   keeps the lines in a list, for embedding the interpreter
+#   Null      drops everything, for benchmarking
+#
+# Engines.run flushes the sink when the program ends, also on an
+# error, after writing the error message to it.
+
+import sys
+
+DEFAULT_THRESHOLD = 1 << 16
+
+class Sink():
+    def write(self, value):
+        pass
+
+    def flush(self):
+        pass
+
+class Stdout(Sink):
+    # sys.stdout is looked up on every write, like print()
+    def write(self, value):
+        sys.stdout.write(str(value) + "\n")
+
+class Buffered(Sink):
+    # stream: None writes to sys.stdout
+    def __init__(self, threshold=DEFAULT_THRESHOLD, stream=None):
+        self.threshold = threshold
+        self.stream = stream
+        self.lines = []
+        self.size = 0
+
+    def write(self, value):
+        text = str(value)
+        self.lines.append(text)
+        self.size += len(text) + 1
+        if self.size >= self.threshold: self.flush()
+
+    def flush(self):
+        stream = self.stream if self.stream is not None else sys.stdout
+        if self.lines:
+            self.lines.append('')
+            stream.write("\n".join(self.lines))
+            self.lines = []
+            self.size = 0
+        stream.flush()
+
+class Capture(Sink):
+    def __init__(self):
+        self.lines = [] # Printed lines, without their newline
+
+    def write(self, value):
+        self.lines.append(str(value))
+
+    def getvalue(self):
+        return "".join(line + "\n" for line in self.lines)
+
+class Null(Sink):
+    pass
+
+sink = Stdout()
+
+# Make newSink the current sink, returns the previous one
+def use(newSink):
+    global sink
+    previous = sink
+    sink = newSink
+    return previous
+
+def write(value):
+    sink.write(value)
+
+def flush():
+    sink.flush()
@@ -4,6 +4,9 @@
 
 import Lexer as lexer 
 from AST_Nodes import *
+import Engines as engines
+import Resolver as resolver
+import Output as output
 import sys 
 
 tokens = lexer.getTokens()
@@ -38,12 +41,15 @@ def p_block(p):
              | LEFT_BRACE RIGHT_BRACE'''
     if len(p) == 4 : p[0] = AST_Block(p[2])
     else : p[0] = AST_Block([])
+    p[0].lineno = p.lineno(1)
    
 def p_statement_list(p):
     '''statement_list : statement_list statement
                       | statement'''
+    # Appended in place, copying the list is quadratic on long programs
     if len(p) == 3: 
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
     elif len(p) == 2: 
         p[0] = [p[1]]
 
@@ -61,11 +67,14 @@ def p_statement(p):
 def p_variable(p): 
     'variable : VARIABLE'
     p[0] = AST_Assignment(AST_Variable(p[1]))
+    p[0].lineno = p.lineno(1)
 
 def p_function_list(p): 
     '''function_list : function_list function SEMICOLON
                      | function SEMICOLON '''
-    if len(p) == 4 : p[0] = p[1] + [p[2]]
+    if len(p) == 4 : 
+        p[1].append(p[2])
+        p[0] = p[1]
     else : p[0] = [p[1]]     
     
 def p_function(p): 
@@ -75,6 +84,7 @@ def p_function(p):
         p[0] = AST_Function(p[2], p[4], p[7], p[8])
     else : 
         p[0] = AST_Function(p[2], [], p[6], p[7])
+    p[0].lineno = p.lineno(1)
         
 def p_parameter_list(p): 
     '''parameter_list : parameter_list COMMA VARIABLE 
@@ -89,6 +99,7 @@ def p_function_call(p):
         p[0] = AST_FunctionCall(p[1],p[3])
     else : 
         p[0] = AST_FunctionCall(p[1], [])
+    p[0].lineno = p.lineno(1)
 
 def p_input_list(p): 
     '''input_list : input_list COMMA expr
@@ -99,32 +110,47 @@ def p_input_list(p):
 def p_print(p):
     'print : PRINT LEFT_PARENTHESIS expr RIGHT_PARENTHESIS'        
     p[0] = AST_Print(p[3])
+    p[0].lineno = p.lineno(1)
 
 def p_assignment(p): 
     '''assignment : VARIABLE index_list ASSIGNMENT expr
                   | VARIABLE ASSIGNMENT expr'''
-    if len(p) == 4: p[0] = AST_Assignment(AST_Variable(p[1]), p[3])
-    else : p[0] = AST_IndexAssignment(AST_Variable(p[1]), p[4], p[2])
+    if len(p) == 4: 
+        # xs = xs + e can grow the list of xs in place 
+        if type(p[3]) == AddNode and type(p[3].left) == AST_Variable and p[3].left.value == p[1]: 
+            p[0] = AST_AppendAssignment(AST_Variable(p[1]), p[3])
+        else: 
+            p[0] = AST_Assignment(AST_Variable(p[1]), p[3])
+        p[0].value.lineno = p.lineno(1)
+    else : 
+        p[0] = AST_IndexAssignment(AST_Variable(p[1]), p[4], p[2])
+        p[0].left.lineno = p.lineno(1)
+    p[0].lineno = p.lineno(1)
 
 def p_while(p): 
     'while : WHILE LEFT_PARENTHESIS expr RIGHT_PARENTHESIS block'
     p[0] = AST_While(p[3], p[5])
+    p[0].lineno = p.lineno(1)
     
 def p_if_else(p):
     'if_else : if ELSE block' 
     p[0] = AST_IfElse(p[1], p[3])
+    p[0].lineno = p[1].lineno
 
 def p_if(p):
     'if : IF LEFT_PARENTHESIS expr RIGHT_PARENTHESIS block'
     p[0] = AST_If(p[3],p[5])
+    p[0].lineno = p.lineno(1)
 
 def p_index_statement(p): 
     'index_statement : expr index_list'
     p[0] = Index(p[2],p[1])
+    p[0].lineno = p[1].lineno
     
 def p_prop_variable(p):
     'prop : VARIABLE'
     p[0] = AST_Variable(p[1])
+    p[0].lineno = p.lineno(1)
 
 def p_expr(p):
     '''expr : prop
@@ -138,22 +164,27 @@ def p_expr(p):
 def p_prop_disjunction(p):
     'prop : expr DISJUNCTION expr'
     p[0] = Disjunction(p[1], p[3])
+    p[0].lineno = p.lineno(2)
 
 def p_prop_conjunction(p):
     'prop : expr CONJUNCTION expr'
     p[0] = Conjunction(p[1], p[3])
+    p[0].lineno = p.lineno(2)
 
 def p_prop_negation(p):
     'prop : NEGATION expr'
     p[0] = Negation(p[2])
+    p[0].lineno = p.lineno(1)
 
 def p_prop_membership(p): 
     'prop : expr MEMBERSHIP expr'
     p[0] = Membership(p[1], p[3])
+    p[0].lineno = p.lineno(2)
 
 def p_prop_cons(p): 
     'prop : expr CONS expr'
     p[0] = Cons(p[1], p[3])
+    p[0].lineno = p.lineno(2)
     
 def p_prop_comparison(p):
     '''prop : expr LESS_THAN_EQUAL expr 
@@ -162,11 +193,13 @@ def p_prop_comparison(p):
             | expr NOT_EQUAL expr 
             | expr GREATER_THAN_EQUAL expr
             | expr GREATER_THAN expr '''
-    p[0] = Compare(p[1], p[3], p[2])
+    p[0] = COMPARE_NODES[p[2]](p[1], p[3])
+    p[0].lineno = p.lineno(2)
     
 def p_prop_uminus(p):
     'prop : SUBTRACTION expr %prec UMINUS'
     p[0] = UMinus(p[2])
+    p[0].lineno = p.lineno(1)
     
 def p_prop_binop(p):
     '''prop : expr ADDITION expr 
@@ -176,7 +209,8 @@ def p_prop_binop(p):
             | expr INTEGER_DIVISION expr 
             | expr MODULUS expr
             | expr EXPONENTIATION expr '''
-    p[0] = BinOp(p[1], p[3], p[2])
+    p[0] = BINOP_NODES[p[2]](p[1], p[3])
+    p[0].lineno = p.lineno(2)
 
 # --- Indexing production functions 
 def p_index_tuple(p): 
@@ -190,6 +224,7 @@ def p_index_tuple(p):
         p[0] = Tuple_Index(p[2], AST_Variable(p[3]))
     else : 
         p[0] = Tuple_Index(p[2], p[3])
+    p[0].lineno = p.lineno(1)
 
 def p_index_list(p):
     '''index_list : index_list index
@@ -208,15 +243,18 @@ def p_prop_boolean(p):
             | FALSE '''
     if p[1] == 'True' : p[0] = AST_Boolean(True)
     elif p[1] == 'False' : p[0] = AST_Boolean(False)
+    p[0].lineno = p.lineno(1)
 
 def p_prop_number(p):
     '''prop : REAL   
             | INTEGER'''
     p[0] = AST_Number(p[1])        
+    p[0].lineno = p.lineno(1)
    
 def p_prop_string(p):
     'prop : STRING'
     p[0] = AST_String(p[1])
+    p[0].lineno = p.lineno(1)
 
 # --- List production functions 
 def p_list(p):
@@ -225,6 +263,7 @@ def p_list(p):
     if len(p) == 3 : p[0] = AST_List([])
     else : 
         p[0] = AST_List(p[2])
+    p[0].lineno = p.lineno(1)
     
 def p_element(p):
     '''element : expr 
@@ -241,6 +280,7 @@ def p_tuple(p):
     '''tuple : LEFT_PARENTHESIS expr COMMA RIGHT_PARENTHESIS
              | LEFT_PARENTHESIS tup RIGHT_PARENTHESIS'''
     p[0] = AST_Tuple(p[2])
+    p[0].lineno = p.lineno(1)
 
 def p_tup(p):
     '''tup : expr 
@@ -264,25 +304,102 @@ def p_prop_parenthetical(p):
 def p_error(p):
     raise SyntaxError()
 
+# The parser is built on first use from the prebuilt tables in 
+# sbml_parsetab.py (see build_tables.py). When the grammar no longer 
+# matches them, yacc builds the tables in memory, no file is written. 
+# A PLY parser keeps its stacks in itself while it parses, so every 
+# thread parses with a copy of its own; the copies share the LR 
+# tables, which nothing changes once they are built. 
+import copy
+import importlib
+import threading
 import ply.yacc as yacc
-parser = yacc.yacc()
+PARSETAB = 'sbml_parsetab'
+parser = None 
+lock = threading.Lock()
+local = threading.local()
 
-def parse(inp):
-    result = parser.parse(inp)
+def getParser(): 
+    global parser 
+    own = getattr(local, 'parser', None)
+    if own is None: 
+        with lock: 
+            if parser is None: 
+                parser = yacc.yacc(module=sys.modules[__name__], tabmodule=PARSETAB, 
+                                   debug=False, write_tables=False)
+        own = local.parser = copy.copy(parser)
+    return own
+
+# Whether sbml_parsetab.py was built from the grammar of this file, 
+# compared like yacc does 
+def tableCurrent(): 
+    try: 
+        table = importlib.import_module(PARSETAB)
+    except ImportError: 
+        return False
+    module = sys.modules[__name__]
+    grammar = yacc.ParserReflect(dict((name, getattr(module, name)) for name in dir(module)))
+    grammar.get_all()
+    return getattr(table, '_lr_signature', None) == grammar.signature()
+
+# Write sbml_parsetab.py into directory 
+def buildTable(directory): 
+    yacc.yacc(module=sys.modules[__name__], tabmodule=PARSETAB, outputdir=directory, 
+              debug=False, write_tables=True)
+
+# scanner: token source with the interface of a PLY lexer, a clone of 
+# the PLY lexer of Lexer.py by default. A Scanner.Scanner reads large 
+# files in chunks: parse(None, Scanner(Scanner.mapped(path))) 
+def parse(inp, scanner=None):
+    if scanner is None: scanner = lexer.getLexer().clone()
+    scanner.lineno = 1
+    result = getParser().parse(inp, lexer=scanner)
+    if result is not None: resolver.resolve(result)
     return result
 
-def parseAll(contents): 
+# Parse and optimize contents: the program, the optimizer changes and the 
+# statically certain errors 
+def prepare(contents, level=0): 
+    result = parse(contents) 
+    changes = []
+    errors = []
+    if result is not None and level: 
+        import Optimizer, TypeInference
+        changes = Optimizer.optimize(result, level)
+        errors = TypeInference.infer(result)
+    return result, changes, errors
+
+# memo: cache size for the pure functions (tree engine), None disables it 
+# level: optimization level, report: stream the optimizer changes go to 
+# cache: path of the source file to cache the prepared program for 
+# sink, packed: see Engines.runTree, errors go to the same sink 
+# Returns the caches of Memo.enable, None without memo or a program 
+def parseAll(contents, engine='tree', memo=None, level=0, report=None, cache=None, 
+             sink=None, packed=None): 
+    if sink is None: sink = output.sink
+    memos = None
     try: 
-        result = parse(contents) 
+        result, changes, errors = prepare(contents, level)
+        if report is not None: 
+            for change in changes: report.write(change + "\n")
+        # Statically certain errors, the program still runs 
+        for error in errors: 
+            sys.stderr.write(error + "\n")
 
         if result is not None: 
-            r = result.eval()
+            if cache is not None: 
+                import Cache
+                Cache.store(cache, contents, level, result, changes, errors)
+            memos = engines.run(result, engine, memo, sink, packed)
     except SyntaxError as e:
-        print(e.message)
+        sink.write(e.message)
     except SemanticError as e:
-        print(e.message)
+        sink.write(e.message)
     except ValueError as e:
-        print(e)
+        sink.write(e)
     except Exception as e: 
-        print("SYNTAX ERROR")        
+        sink.write("SYNTAX ERROR")
+    finally: 
+        sink.flush()
+    return memos        
             
\ No newline at end of file
@@ -0,0 +1,170 @@
+# -------------------------------------------------------------- #
+# ----------------------- Profiler.py -------------------------- #
+# -------------------------------------------------------------- #
+
+# Deterministic profiler for the tree-walker (sbml.py --profile).
+#
+# enable() replaces the eval method of every node class in
+# AST_Nodes.py with a wrapper that times the evaluation, disable()
+# puts the original methods back; nothing is wrapped otherwise. Every
+# evaluation is counted and its time is added up three ways:
+#
+#   node type   the class of the node
+#   line        the source line of the node (0 when unknown)
+#   function    the SBML function being run, <main> for the main block
+#
+# Inclusive time contains the evaluations below a node, exclusive
+# time does not. A recursive node type, line or function only adds the
+# inclusive time of its outermost evaluation. The arguments of a call
+# are run by the caller, the function body by the called function.
+
+import json
+import sys
+import time
+import AST_Nodes as nodes
+
+MAIN = '<main>'
+
+class Stats():
+    def __init__(self):
+        self.calls = 0
+        self.inclusive = 0.0
+        self.exclusive = 0.0
+        self.active = 0 # Evaluations of this entry on the stack
+
+# Stack entry of a node being evaluated
+class Frame():
+    __slots__ = ('node', 'start', 'children', 'function', 'stats', 'call')
+
+    def __init__(self, node, start, function, stats, call):
+        self.node = node
+        self.start = start
+        self.children = 0.0 # Inclusive time of the evaluations below
+        self.function = function # Name of the function the node runs in
+        self.stats = stats  # Stats of the node type and the line
+        self.call = call    # Stats of the called function, of <main> at the top
+
+class Profile():
+    def __init__(self):
+        self.types = dict()     # Node class name -> Stats
+        self.lines = dict()     # Line -> Stats
+        self.functions = dict() # Function name -> Stats
+        self.stack = []
+        self.total = 0.0
+        self.evaluations = 0
+
+    def entry(self, table, key):
+        stats = table.get(key)
+        if stats is None:
+            stats = table[key] = Stats()
+        return stats
+
+    def enter(self, node):
+        stack = self.stack
+        if stack:
+            parent = stack[-1]
+            function = parent.function
+            call = parent.node
+            # Below a call, everything but the arguments is the function
+            if type(call) is nodes.AST_FunctionCall and not any(a is node for a in call.child):
+                function = call.value
+        else: function = MAIN
+        stats = (self.entry(self.types, type(node).__name__),
+                 self.entry(self.lines, getattr(node, 'lineno', 0)))
+        call = None
+        if type(node) is nodes.AST_FunctionCall: call = self.entry(self.functions, node.value)
+        elif not stack: call = self.entry(self.functions, MAIN)
+        for s in stats:
+            s.active += 1
+        if call is not None: call.active += 1
+        stack.append(Frame(node, time.perf_counter(), function, stats, call))
+
+    def exit(self):
+        frame = self.stack.pop()
+        inclusive = time.perf_counter() - frame.start
+        exclusive = inclusive - frame.children
+        self.evaluations += 1
+        if self.stack: self.stack[-1].children += inclusive
+        else: self.total += inclusive
+        for s in frame.stats:
+            s.calls += 1
+            s.exclusive += exclusive
+            s.active -= 1
+            if s.active == 0: s.inclusive += inclusive
+        # A function's exclusive time is the time of the nodes run in it
+        self.entry(self.functions, frame.function).exclusive += exclusive
+        call = frame.call
+        if call is not None:
+            call.calls += 1
+            call.active -= 1
+            if call.active == 0: call.inclusive += inclusive
+
+    # Rows of table, most exclusive time first
+    def rows(self, table):
+        return sorted(table.items(), key=lambda item: (-item[1].exclusive, str(item[0])))
+
+    def report(self, out, limit=20):
+        out.write("profile: %.6f s in %d node evaluations\n" % (self.total, self.evaluations))
+        for title, table, label in (("function", self.functions, str),
+                                    ("line", self.lines, lambda line: "line %d" % line),
+                                    ("node type", self.types, str)):
+            out.write("\n%-24s %10s %12s %12s\n" % (title, "calls", "inclusive", "exclusive"))
+            for key, stats in self.rows(table)[:limit]:
+                out.write("%-24s %10d %12.6f %12.6f\n" %
+                          (label(key), stats.calls, stats.inclusive, stats.exclusive))
+
+    def toJSON(self):
+        def rows(table, name):
+            return [{name: key, 'calls': stats.calls, 'inclusive': stats.inclusive,
+                     'exclusive': stats.exclusive} for key, stats in self.rows(table)]
+        return {'total': self.total,
+                'evaluations': self.evaluations,
+                'functions': rows(self.functions, 'name'),
+                'lines': rows(self.lines, 'line'),
+                'types': rows(self.types, 'type')}
+
+    def writeJSON(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.toJSON(), f, indent=1)
+
+# Original eval methods, class -> method, while enabled
+originals = dict()
+recursionLimit = None
+
+def wrap(method, profile):
+    enter = profile.enter
+    exit = profile.exit
+    def eval(self, ctx):
+        enter(self)
+        try:
+            return method(self, ctx)
+        finally:
+            exit()
+    return eval
+
+def nodeClasses():
+    for value in vars(nodes).values():
+        if isinstance(value, type) and issubclass(value, nodes.Node) and 'eval' in vars(value):
+            yield value
+
+# Start profiling every evaluation, returns the Profile the times go to
+def enable():
+    global recursionLimit
+    disable()
+    profile = Profile()
+    for cls in nodeClasses():
+        originals[cls] = cls.eval
+        cls.eval = wrap(cls.eval, profile)
+    # Every evaluation takes one more Python frame
+    recursionLimit = sys.getrecursionlimit()
+    sys.setrecursionlimit(recursionLimit * 2)
+    return profile
+
+def disable():
+    global recursionLimit
+    for cls in originals:
+        cls.eval = originals[cls]
+    originals.clear()
+    if recursionLimit is not None:
+        sys.setrecursionlimit(recursionLimit)
+        recursionLimit = None
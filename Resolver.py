@@ -0,0 +1,64 @@
+# -------------------------------------------------------------- #
+# ----------------------- Resolver.py -------------------------- #
+# -------------------------------------------------------------- #
+
+# Slot resolution pass, run once after parsing. Every variable gets a
+# fixed index into the global array and, inside a function, into the
+# function's local array, so the tree-walker never looks names up.
+#
+#   node.slot   index in the current frame (the global array in main)
+#   node.gslot  index in the global array
+#
+# The slots are set on AST_Variable nodes and on Tuple_Index nodes
+# that name their tuple directly. Each AST_Function gets nlocals, the
+# size of its frame, with the parameters in the first slots.
+
+from AST_Nodes import *
+
+class Scope():
+    def __init__(self, glob=None):
+        self.names = dict() # Variable name -> slot
+        self.glob = glob    # Global scope, None for the main block
+
+    def slot(self, name):
+        if name not in self.names:
+            self.names[name] = len(self.names)
+        return self.names[name]
+
+    def resolve(self, node, name):
+        if self.glob is None:
+            node.slot = node.gslot = self.slot(name)
+        else:
+            node.slot = self.slot(name)
+            node.gslot = self.glob.slot(name)
+
+def resolveNode(node, scope):
+    if isinstance(node, AST_Variable):
+        scope.resolve(node, node.getName())
+    elif isinstance(node, Tuple_Index) and type(node.child) == str:
+        scope.resolve(node, node.child)
+
+    for attribute in ('value', 'left', 'right', 'child'):
+        child = getattr(node, attribute, None)
+        if isinstance(child, Node):
+            resolveNode(child, scope)
+        elif type(child) == list or type(child) == tuple:
+            for element in child:
+                if isinstance(element, Node): resolveNode(element, scope)
+
+def resolveFunction(func, glob):
+    scope = Scope(glob)
+    # Parameters first, a repeated name shares its slot
+    for param in func.left:
+        scope.resolve(param, param.getName())
+    resolveNode(func.right, scope)
+    resolveNode(func.child, scope)
+    func.nlocals = len(scope.names)
+
+def resolve(tree):
+    glob = Scope()
+    for func in tree.left:
+        resolveFunction(func, glob)
+    resolveNode(tree.right, glob)
+    tree.nglobals = len(glob.names)
+    return tree
@@ -0,0 +1,94 @@
+# -------------------------------------------------------------- #
+# ------------------------ Sampler.py -------------------------- #
+# -------------------------------------------------------------- #
+
+# Sampling profiler for the tree-walker (sbml.py --sample FILE).
+#
+# A background thread wakes up every interval, takes the Python stack
+# of the thread running the program (sys._current_frames) and turns
+# it into the SBML stack: <main>, the function of every active
+# AST_FunctionCall and the line of the statement being run. The
+# program itself is not instrumented. The stacks are counted and
+# written in the folded format of flamegraph.pl and speedscope:
+#
+#   <main>;fib;fib;line 1 42
+#
+# While sampling, the interpreter switches threads at least every
+# interval (sys.setswitchinterval) so the samples come on time.
+
+import sys
+import threading
+import AST_Nodes as nodes
+
+DEFAULT_INTERVAL = 0.001
+
+MAIN = '<main>'
+
+STATEMENTS = (nodes.AST_Assignment, nodes.AST_IndexAssignment, nodes.AST_Print, nodes.AST_If,
+              nodes.AST_IfElse, nodes.AST_While, nodes.AST_FunctionCall)
+
+# Code objects of the eval methods of the node classes
+def evalCodes():
+    codes = set()
+    for value in vars(nodes).values():
+        if isinstance(value, type) and issubclass(value, nodes.Node) and 'eval' in vars(value):
+            codes.add(value.eval.__code__)
+    return codes
+
+class Sampler():
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        self.interval = interval
+        self.samples = dict() # Folded stack -> count
+        self.thread = None
+
+    # Sample the calling thread until stop()
+    def start(self):
+        self.target = threading.get_ident()
+        self.codes = evalCodes()
+        self.switchInterval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self.switchInterval, self.interval))
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.thread is None: return
+        self.stopped.set()
+        self.thread.join()
+        self.thread = None
+        sys.setswitchinterval(self.switchInterval)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.target)
+            if frame is not None: self.sample(frame)
+
+    def sample(self, frame):
+        codes = self.codes
+        names = []       # Called functions, innermost first
+        statement = None # Innermost statement of the innermost function
+        innermost = None # Innermost node
+        previous = None  # Node of the frame below
+        while frame is not None:
+            if frame.f_code in codes:
+                node = frame.f_locals.get('self')
+                if innermost is None: innermost = node
+                if type(node) is nodes.AST_FunctionCall and previous is not None and \
+                   not any(a is previous for a in node.child):
+                    # In the body, not evaluating the arguments
+                    names.append(node.value)
+                    if statement is None: statement = previous
+                if not names and statement is None and isinstance(node, STATEMENTS):
+                    statement = node
+                previous = node
+            frame = frame.f_back
+        if innermost is None: return # Not running the program
+        if statement is None: statement = innermost
+        names.reverse()
+        stack = ";".join([MAIN] + names + ["line %d" % getattr(statement, 'lineno', 0)])
+        self.samples[stack] = self.samples.get(stack, 0) + 1
+
+    def write(self, out):
+        for stack in sorted(self.samples):
+            out.write("%s %d\n" % (stack, self.samples[stack]))
@@ -0,0 +1,221 @@
+# -------------------------------------------------------------- #
+# ------------------------ Scanner.py -------------------------- #
+# -------------------------------------------------------------- #
+
+# Tokenizer for the SBML token set that reads its input in chunks, an
+# alternative to the PLY lexer of Lexer.py for very large files. It
+# gives the same token stream as Lexer.py: same types, values, lineno
+# and lexpos, the same SyntaxError on an unknown character and the
+# same ValueError on a number Python can't convert. Tokens also carry
+# the column (from 1) of their first character.
+#
+# The source is a string, a text file, or anything whose read(size)
+# returns bytes (a binary file, an mmap, see mapped()). Bytes are
+# decoded as UTF-8 with \r\n and \r read as \n, like open(path, 'r').
+# Only the current chunk and the token being read are kept in memory.
+#
+# The scanner looks at the first character of a token to know its
+# rule, the rules of Lexer.py never start with the same character
+# except t_REAL and t_INTEGER, which share one expression here.
+
+import codecs
+import io
+import itertools
+import mmap
+import re
+from Lexer import reserved
+
+CHUNK_SIZE = 1 << 20
+
+# A token ending this close to the end of the buffer may be the start
+# of a longer one: "1.5e-" needs the next character to know if the
+# REAL is "1.5" or "1.5e-3"
+MARGIN = 3
+
+# Character classes, the rule a token starting with the character is for
+SPACE, NAME, OPERATOR, NEWLINE, PAIR, QUOTE, NUMBER = range(7)
+
+CLASSES = {' ': SPACE, '\t': SPACE, '\n': NEWLINE, '"': QUOTE, '\'': QUOTE}
+for c in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ':
+    CLASSES[c] = NAME
+for c in '0123456789.':
+    CLASSES[c] = NUMBER
+for c in '(),#[]{}/+-;':
+    CLASSES[c] = OPERATOR
+for c in '*<>=:':
+    CLASSES[c] = PAIR # May be the first of two characters
+
+OPERATORS = {'(': 'LEFT_PARENTHESIS',
+             ')': 'RIGHT_PARENTHESIS',
+             ',': 'COMMA',
+             '#': 'HASHTAG',
+             '[': 'LEFT_BRACKET',
+             ']': 'RIGHT_BRACKET',
+             '{': 'LEFT_BRACE',
+             '}': 'RIGHT_BRACE',
+             '/': 'DIVISION',
+             '+': 'ADDITION',
+             '-': 'SUBTRACTION',
+             ';': 'SEMICOLON',
+             '*': 'MULTIPLICATION',
+             '<': 'LESS_THAN',
+             '>': 'GREATER_THAN',
+             '=': 'ASSIGNMENT'
+            }
+
+PAIRS = {'**': 'EXPONENTIATION',
+         '::': 'CONS',
+         '<=': 'LESS_THAN_EQUAL',
+         '==': 'EQUALS',
+         '<>': 'NOT_EQUAL',
+         '>=': 'GREATER_THAN_EQUAL'
+        }
+
+# t_REAL, then t_INTEGER as group 1
+NUMBERS = re.compile(r'\d*[.]\d*(?:e-?)?\d+|\d+[.]\d*(?:e-?)?\d*|(\d+)')
+NAMES = re.compile(r'[a-zA-Z][a-zA-Z0-9_]*')
+
+class Token():
+    # yacc sets lexer on the token of a syntax error
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'column', 'lexer')
+
+    def __init__(self, type, value, lineno, lexpos, column):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+        self.column = column
+
+    def __repr__(self):
+        return "LexToken(%s,%r,%d,%d)" % (self.type, self.value, self.lineno, self.lexpos)
+
+# Text chunks of source, bytes are decoded on the way
+def chunks(source, size):
+    if type(source) == str:
+        yield source
+        return
+    decoder = None
+    while True:
+        data = source.read(size)
+        if not data: break
+        if type(data) != str:
+            if decoder is None:
+                decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), True)
+            data = decoder.decode(data)
+        yield data
+    if decoder is not None:
+        yield decoder.decode(b'', True)
+
+# Read-only mapping of the file at path, for Scanner(mapped(path))
+def mapped(path):
+    with open(path, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return io.BytesIO(b'') # An empty file can't be mapped
+
+class Scanner():
+    def __init__(self, source=None, chunkSize=CHUNK_SIZE):
+        self.chunkSize = chunkSize
+        self.lineno = 1
+        self.stream = iter(())
+        if source is not None: self.input(source)
+
+    # Same interface as a PLY lexer, the parser calls input() and token()
+    def input(self, source):
+        self.lineno = 1
+        self.stream = self.scan(source)
+
+    def token(self):
+        return next(self.stream, None)
+
+    def __iter__(self):
+        return self.stream
+
+    def scan(self, source):
+        buffer = ''
+        offset = 0    # Position of buffer[0] in the input
+        lineStart = 0 # Position of the first character of the line
+        lineno = 1
+        classes = CLASSES.get
+        operators = OPERATORS
+        pairs = PAIRS
+        names = NAMES.match
+        numbers = NUMBERS.match
+        get = reserved.get
+        # None marks the end of the input
+        for chunk in itertools.chain(chunks(source, self.chunkSize), (None,)):
+            final = chunk is None
+            if not final:
+                buffer = buffer + chunk if buffer else chunk
+            end = len(buffer)
+            # Tokens ending after limit wait for the next chunk
+            limit = end if final else end - MARGIN
+            pos = 0
+            while pos < end:
+                c = buffer[pos]
+                k = classes(c)
+                if k == SPACE:
+                    pos += 1
+                elif k == NAME:
+                    m = names(buffer, pos)
+                    stop = m.end()
+                    if stop > limit: break
+                    value = m.group()
+                    yield Token(get(value, 'VARIABLE'), value, lineno, offset + pos,
+                                offset + pos - lineStart + 1)
+                    pos = stop
+                elif k == OPERATOR:
+                    yield Token(operators[c], c, lineno, offset + pos, offset + pos - lineStart + 1)
+                    pos += 1
+                elif k == NEWLINE:
+                    pos += 1
+                    lineno += 1
+                    lineStart = offset + pos
+                    self.lineno = lineno
+                elif k == PAIR:
+                    if pos + 1 == end and not final: break
+                    pair = buffer[pos:pos + 2]
+                    if pair in pairs:
+                        yield Token(pairs[pair], pair, lineno, offset + pos, offset + pos - lineStart + 1)
+                        pos += 2
+                    elif c in operators:
+                        yield Token(operators[c], c, lineno, offset + pos, offset + pos - lineStart + 1)
+                        pos += 1
+                    else: raise SyntaxError() # A single ':'
+                elif k == QUOTE:
+                    stop = buffer.find(c, pos + 1)
+                    if stop < 0:
+                        if final: raise SyntaxError() # No closing quote
+                        break
+                    yield Token('STRING', buffer[pos + 1:stop], lineno, offset + pos,
+                                offset + pos - lineStart + 1)
+                    pos = stop + 1
+                else:
+                    # \d is any decimal digit, not only 0-9
+                    if k is None and not c.isdecimal(): raise SyntaxError() # As Lexer.t_error
+                    m = numbers(buffer, pos)
+                    if m is None:
+                        if pos >= limit: break # A '.' the next chunk may complete
+                        raise SyntaxError()
+                    stop = m.end()
+                    if stop > limit: break
+                    if m.lastindex: kind, value = 'INTEGER', integer(m.group())
+                    else: kind, value = 'REAL', real(m.group())
+                    yield Token(kind, value, lineno, offset + pos, offset + pos - lineStart + 1)
+                    pos = stop
+            offset += pos
+            buffer = buffer[pos:]
+
+# Conversions of Lexer.t_INTEGER and Lexer.t_REAL
+def integer(text):
+    try:
+        return int(text)
+    except ValueError:
+        raise ValueError("Integer value too large " + text)
+
+def real(text):
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError("Decimal value too large " + text)
@@ -0,0 +1,116 @@
+# -------------------------------------------------------------- #
+# ------------------------ Stream.py --------------------------- #
+# -------------------------------------------------------------- #
+
+# Streaming execution for very large programs (sbml.py --stream).
+#
+# The source is read by Scanner.py and cut into units: each function
+# definition, then each statement of the main block. A unit is parsed
+# on its own, resolved against the global scope of the program so far,
+# run by the tree-walker and dropped, so memory does not grow with the
+# number of statements.
+#
+# The output is the one of a normal run except for errors: a syntax
+# error only stops the program when its unit is reached, after the
+# statements before it have run. Optimizer.py passes are applied to
+# each unit, TypeInference.py needs the whole program and is skipped.
+
+from AST_Nodes import *
+import Parser as parser
+import Resolver as resolver
+import Scanner as scanner
+
+# Token source for the parser over the tokens of one unit
+class Unit():
+    def __init__(self, tokens):
+        self.tokens = iter(tokens)
+        self.lineno = 1
+
+    def token(self):
+        return next(self.tokens, None)
+
+def brace(kind, value, token):
+    return scanner.Token(kind, value, token.lineno, token.lexpos, token.column)
+
+# Cut the token stream into units: (False, tokens) for each function
+# definition, then (True, tokens) for each statement of the main block
+def units(tokens):
+    pending = None # Token read ahead
+    unit = []
+    # Functions end with a ';' outside of their block
+    depth = 0
+    while True:
+        token = next(tokens, None)
+        if token is None: raise SyntaxError() # No main block
+        if depth == 0 and not unit and token.type == 'LEFT_BRACE': break
+        unit.append(token)
+        if token.type == 'LEFT_BRACE': depth += 1
+        elif token.type == 'RIGHT_BRACE': depth -= 1
+        elif token.type == 'SEMICOLON' and depth == 0:
+            yield False, unit
+            unit = []
+
+    # Statements end with a ';' or a '}' directly in the main block,
+    # unless an else follows
+    depth = 1
+    while True:
+        token = pending if pending is not None else next(tokens, None)
+        pending = None
+        if token is None: raise SyntaxError() # Main block not closed
+        if token.type == 'RIGHT_BRACE' and depth == 1:
+            if unit: yield True, unit # Incomplete, fails to parse
+            break
+        unit.append(token)
+        if token.type == 'LEFT_BRACE': depth += 1
+        elif token.type == 'RIGHT_BRACE':
+            depth -= 1
+            if depth == 1:
+                pending = next(tokens, None)
+                if pending is None or pending.type != 'ELSE':
+                    yield True, unit
+                    unit = []
+        elif token.type == 'SEMICOLON' and depth == 1:
+            yield True, unit
+            unit = []
+    if next(tokens, None) is not None: raise SyntaxError() # After the main block
+
+# Parse one unit as a whole program: a function with an empty main
+# block, or a main block of one statement
+def parseUnit(statement, tokens):
+    if statement:
+        tokens = [brace('LEFT_BRACE', '{', tokens[0])] + tokens + [brace('RIGHT_BRACE', '}', tokens[-1])]
+    else:
+        tokens = tokens + [brace('LEFT_BRACE', '{', tokens[-1]), brace('RIGHT_BRACE', '}', tokens[-1])]
+    return parser.getParser().parse(lexer=Unit(tokens))
+
+# Run the program read from source (see Scanner.Scanner), errors are
+# printed like Parser.parseAll. level: optimization level, report:
+# stream the optimizer changes go to, sink and packed: see Engines.runTree
+def run(source, level=0, report=None, sink=None, packed=None):
+    ctx = Interpreter(sink, packed)
+    try:
+        glob = resolver.Scope()
+        globalArray = ctx.var_list[0]
+        for statement, tokens in units(iter(scanner.Scanner(source))):
+            tree = parseUnit(statement, tokens)
+            if level:
+                import Optimizer
+                changes = Optimizer.optimize(tree, level)
+                if report is not None:
+                    for change in changes: report.write(change + "\n")
+            if statement: resolver.resolveNode(tree.right, glob)
+            else: resolver.resolveFunction(tree.left[0], glob)
+            # New globals start unset
+            globalArray.extend([UNSET] * (len(glob.names) - len(globalArray)))
+            if statement: tree.right.eval(ctx)
+            else: tree.left[0].eval(ctx)
+    except SyntaxError as e:
+        ctx.sink.write(e.message)
+    except SemanticError as e:
+        ctx.sink.write(e.message)
+    except ValueError as e:
+        ctx.sink.write(e)
+    except Exception as e:
+        ctx.sink.write("SYNTAX ERROR")
+    finally:
+        ctx.sink.flush()
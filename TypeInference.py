@@ -0,0 +1,330 @@
+# -------------------------------------------------------------- #
+# --------------------- TypeInference.py ----------------------- #
+# -------------------------------------------------------------- #
+
+# Static type inference, run with the optimizer (-O1 and up).
+#
+# Every expression gets the set of types its value can have. A
+# variable's set is the union of everything assigned to it, function
+# parameters get the union of the arguments at every call site, and
+# a call gets the set of the function's return expression. Sets only
+# grow, so the program is walked until nothing changes.
+#
+# Operator nodes whose operand sets are proven to pass the node's
+# typeCheck get node.fast, the Python operator to apply without
+# checking. Nodes that fail for every possible operand type are
+# reported before the program runs.
+
+from AST_Nodes import *
+from Optimizer import describe
+import operator
+
+ALL = frozenset(['int', 'float', 'str', 'bool', 'list', 'tuple', 'complex'])
+NONE = frozenset()
+NUMBERS = frozenset(['int', 'float'])
+INT = frozenset(['int'])
+STR = frozenset(['str'])
+BOOL = frozenset(['bool'])
+LIST = frozenset(['list'])
+TUPLE = frozenset(['tuple'])
+
+ORDERINGS = ('<=', '<', '>=', '>')
+
+# Python operators applied by the fast paths
+OPERATORS = {'+': operator.add,
+             '-': operator.sub,
+             '*': operator.mul,
+             '/': operator.truediv,
+             '**': operator.pow,
+             'div': operator.floordiv,
+             'mod': operator.mod,
+             '<=': operator.le,
+             '<': operator.lt,
+             '==': operator.eq,
+             '<>': operator.ne,
+             '>=': operator.ge,
+             '>': operator.gt
+            }
+
+def literalType(value):
+    return frozenset([type(value).__name__])
+
+# Result types of a BinOp on one pair of operand types, NONE when the
+# pair fails
+def binOpResult(op, left, right):
+    if op == '+':
+        if left in NUMBERS and right in NUMBERS:
+            return INT if left == right == 'int' else frozenset(['float'])
+        if left == right and left in ('str', 'list'): return frozenset([left])
+        return NONE
+    if left not in NUMBERS or right not in NUMBERS: return NONE
+    if op in ('div', 'mod'):
+        return INT if left == right == 'int' else NONE
+    if op == '/': return frozenset(['float'])
+    if op == '**':
+        # A negative exponent gives a float, a negative base a complex
+        if left == right == 'int': return frozenset(['int', 'float'])
+        return frozenset(['float', 'complex'])
+    return INT if left == right == 'int' else frozenset(['float'])
+
+def compareResult(op, left, right):
+    if left in NUMBERS and right in NUMBERS: return BOOL
+    if left == right == 'str': return BOOL
+    # str and number: == and <> are False / True, the orderings raise
+    if op not in ORDERINGS and left in ('int', 'float', 'str') and right in ('int', 'float', 'str'):
+        return BOOL
+    return NONE
+
+def pairs(function, left, right):
+    result = NONE
+    for l in left:
+        for r in right:
+            result = result | function(l, r)
+    return result
+
+class Inference():
+    def __init__(self, tree):
+        self.tree = tree
+        self.types = dict()  # ('g', name) or (function, name) -> type set
+        self.returns = dict() # Function name -> type set
+        self.changed = False
+        self.errors = dict() # Node -> message, for the final walk
+        self.final = False
+        self.function = None # Name of the function being walked, None in main
+
+        self.definitions = dict()
+        for func in tree.left:
+            self.definitions[func.value] = func
+        self.mainNames = set()
+        self.assignedNames(tree.right, self.mainNames)
+        self.assigned = dict() # Function name -> names it assigns
+        for name in self.definitions:
+            self.assigned[name] = self.assignedNames(self.definitions[name].right, set())
+
+    def assignedNames(self, node, names):
+        if isinstance(node, AST_Assignment):
+            names.add(node.value.getName())
+        for attribute in ('value', 'left', 'right', 'child'):
+            child = getattr(node, attribute, None)
+            if isinstance(child, Node):
+                self.assignedNames(child, names)
+            elif type(child) == list:
+                for element in child:
+                    if isinstance(element, Node): self.assignedNames(element, names)
+        return names
+
+    def add(self, key, types):
+        current = self.types.get(key, NONE)
+        if not types <= current:
+            self.types[key] = current | types
+            self.changed = True
+
+    def error(self, node, message):
+        if self.final: self.errors[node] = message
+
+    def run(self):
+        self.changed = True
+        while self.changed:
+            self.changed = False
+            self.walk()
+        # Last walk with the final sets: mark the nodes
+        self.final = True
+        self.walk()
+        return self
+
+    def walk(self):
+        for name in self.definitions:
+            func = self.definitions[name]
+            self.function = name
+            self.statement(func.right)
+            types = self.expression(func.child)
+            if not types <= self.returns.get(name, NONE):
+                self.returns[name] = self.returns.get(name, NONE) | types
+                self.changed = True
+        self.function = None
+        self.statement(self.tree.right)
+
+    # --- Variables
+    def isParam(self, name):
+        func = self.definitions[self.function]
+        for param in func.left:
+            if param.getName() == name: return True
+        return False
+
+    def readType(self, name):
+        if self.function is None:
+            return self.types.get(('g', name), NONE)
+        types = NONE
+        if self.isParam(name) or name in self.assigned[self.function]:
+            types = self.types.get((self.function, name), NONE)
+        # Only the main block creates globals
+        if not self.isParam(name) and name in self.mainNames:
+            types = types | self.types.get(('g', name), NONE)
+        return types
+
+    def assign(self, name, types):
+        if self.function is None:
+            self.add(('g', name), types)
+            return
+        self.add((self.function, name), types)
+        if not self.isParam(name) and name in self.mainNames:
+            self.add(('g', name), types)
+
+    # --- Statements
+    def statement(self, node):
+        if isinstance(node, AST_Block):
+            for statement in node.value:
+                self.statement(statement)
+        elif isinstance(node, AST_Print):
+            self.expression(node.value)
+        elif isinstance(node, AST_Assignment):
+            self.assign(node.value.getName(), self.expression(node.child))
+        elif isinstance(node, AST_IndexAssignment):
+            for i in node.value:
+                self.expression(i)
+            self.expression(node.left)
+            self.expression(node.right)
+        elif isinstance(node, AST_IfElse):
+            self.condition(node.left.value)
+            self.statement(node.left.child)
+            self.statement(node.right)
+        elif isinstance(node, AST_If):
+            self.condition(node.value)
+            self.statement(node.child)
+        elif isinstance(node, AST_While):
+            self.expression(node.value)
+            self.statement(node.child)
+        elif isinstance(node, AST_FunctionCall):
+            self.expression(node)
+
+    def condition(self, node):
+        types = self.expression(node)
+        if types and 'bool' not in types:
+            self.error(node, "condition is never a boolean")
+
+    # --- Expressions
+    def expression(self, node):
+        if isinstance(node, (AST_Number, AST_String, AST_Boolean)):
+            return literalType(node.value)
+        if isinstance(node, AST_Variable):
+            return self.readType(node.getName())
+        if isinstance(node, BinOp):
+            return self.binOp(node)
+        if isinstance(node, Compare):
+            return self.compare(node)
+        if isinstance(node, (Conjunction, Disjunction)):
+            left = self.expression(node.left)
+            right = self.expression(node.right)
+            if left <= BOOL and right <= BOOL: self.mark(node, operator.and_ if isinstance(node, Conjunction) else operator.or_)
+            return self.check(node, left and right, 'bool' in left and 'bool' in right, BOOL)
+        if isinstance(node, Negation):
+            child = self.expression(node.child)
+            if child <= BOOL: self.mark(node, operator.not_)
+            return self.check(node, child, 'bool' in child, BOOL)
+        if isinstance(node, UMinus):
+            child = self.expression(node.child)
+            return self.check(node, child, child & NUMBERS, child & NUMBERS)
+        if isinstance(node, Membership):
+            left = self.expression(node.left)
+            right = self.expression(node.right)
+            valid = 'list' in right or ('str' in right and 'str' in left)
+            return self.check(node, left and right, valid, BOOL)
+        if isinstance(node, Cons):
+            left = self.expression(node.left)
+            right = self.expression(node.right)
+            return self.check(node, left and right, 'list' in right, LIST)
+        if isinstance(node, Index):
+            return self.index(node)
+        if isinstance(node, Tuple_Index):
+            if type(node.child) == str: value = self.readType(node.child)
+            else: value = self.expression(node.child)
+            return self.check(node, value, 'tuple' in value, ALL)
+        if isinstance(node, AST_List):
+            for element in node.value:
+                self.expression(element)
+            return LIST
+        if isinstance(node, AST_Tuple):
+            if type(node.value) != tuple and type(node.value) != list:
+                self.expression(node.value)
+                self.error(node, "one element tuple")
+                return NONE
+            for element in node.value:
+                self.expression(element)
+            return TUPLE
+        if isinstance(node, AST_FunctionCall):
+            return self.functionCall(node)
+        return ALL
+
+    # Result of an operation whose operands can be operands: NONE and a
+    # reported error when no operand type is valid
+    def check(self, node, operands, valid, result):
+        if not operands: return NONE
+        if not valid:
+            self.error(node, "%s fails for every operand type" % describe(node))
+            return NONE
+        return result
+
+    def mark(self, node, function):
+        if self.final: node.fast = function
+
+    def binOp(self, node):
+        left = self.expression(node.left)
+        right = self.expression(node.right)
+        op = node.value
+        if op == '+':
+            proven = (left <= NUMBERS and right <= NUMBERS) or (left <= STR and right <= STR)
+        elif op in ('div', 'mod'):
+            proven = left <= INT and right <= INT
+        else:
+            proven = left <= NUMBERS and right <= NUMBERS
+        if proven: self.mark(node, OPERATORS[op])
+        result = pairs(lambda l, r: binOpResult(op, l, r), left, right)
+        return self.check(node, left and right, result, result)
+
+    def compare(self, node):
+        left = self.expression(node.left)
+        right = self.expression(node.right)
+        op = node.value
+        proven = (left <= NUMBERS and right <= NUMBERS) or (left <= STR and right <= STR)
+        if op not in ORDERINGS:
+            proven = left <= frozenset(['int', 'float', 'str']) and right <= frozenset(['int', 'float', 'str'])
+        if proven: self.mark(node, OPERATORS[op])
+        result = pairs(lambda l, r: compareResult(op, l, r), left, right)
+        return self.check(node, left and right, result, result)
+
+    def index(self, node):
+        indices = [self.expression(i) for i in node.value]
+        if type(node.child) == str: value = STR
+        else: value = self.expression(node.child)
+        for i in indices:
+            if not i: return NONE
+            if 'int' not in i:
+                self.error(node, "index is never an int")
+                return NONE
+        if not value: return NONE
+        if not value & frozenset(['list', 'str']):
+            self.error(node, "indexed value is never a list or string")
+            return NONE
+        return ALL if 'list' in value else STR
+
+    def functionCall(self, node):
+        # The arity and the function table are checked before the
+        # arguments are evaluated
+        func = self.definitions.get(node.value)
+        if func is None:
+            self.error(node, "unknown function %s" % node.value)
+            return NONE
+        if len(func.left) != len(node.child):
+            self.error(node, "%s takes %d arguments" % (node.value, len(func.left)))
+            return NONE
+        args = [self.expression(a) for a in node.child]
+        # Arguments of a repeated parameter name: the last one wins
+        for param, types in zip(func.left, args):
+            self.add((node.value, param.getName()), types)
+        return self.returns.get(node.value, NONE)
+
+# Annotate tree, returns the statically certain errors as messages
+def infer(tree):
+    inference = Inference(tree).run()
+    errors = sorted(inference.errors.items(), key=lambda item: item[0].lineno)
+    return ["line %d: semantic error: %s" % (node.lineno, message) for node, message in errors]
@@ -0,0 +1,594 @@
+# -------------------------------------------------------------- #
+# -------------------------- VM.py ----------------------------- #
+# -------------------------------------------------------------- #
+
+# Bytecode engine. The tree returned by Parser.parse is lowered into
+# flat code lists of (opcode, argument) pairs which are then run by a
+# single dispatch loop, instead of one Python method call (and one
+# try/except) per node as in AST_Nodes.py.
+
+from AST_Nodes import *
+import Operators as ops
+import Output as output
+import operator
+
+# ------------------------- Opcodes ---------------------------- #
+# Instructions are variable length: the opcode followed by its
+# arguments. Opcodes are numbered roughly by how often they run since
+# the dispatch loop tests them in this order.
+# An operand argument names a variable when it is >= 0 (name index)
+# and a constant when it is < 0 (~constant index). The BINARY_OPERAND
+# forms take simple operands straight from the instruction instead of
+# going through separate LOAD / LOAD_CONST instructions.
+BINARY_OPERANDS = 0 # operator, left operand, right operand
+ASSIGN_OPERANDS = 1 # operator, left operand, right operand, name index
+LOAD = 2            # name index
+STORE = 3           # name index
+BINARY_OPERAND = 4  # operator, right operand (left operand on the stack)
+JUMP_UNLESS_OPERANDS = 5 # comparison operator, left operand, right operand, target
+LOAD_CONST = 6      # constant index
+BINARY = 7          # operator
+JUMP_IF_FALSE = 8   # target, condition must be a boolean
+JUMP = 9            # target
+JUMP_IF_EQ_FALSE = 10 # target, while condition (value == False)
+CALL = 11           # function index
+RETURN = 12
+POP = 13
+PRINT = 14
+INDEX = 15          # number of indices
+STORE_INDEX = 16    # number of indices
+BUILD_LIST = 17     # number of elements
+BUILD_TUPLE = 18    # number of elements
+TUPLE_INDEX = 19    # tuple index (1-based)
+NEGATION = 20
+UMINUS = 21
+FAIL = 22           # Statically known semantic error
+HALT = 23
+TAIL_CALL = 24      # function index, call in a function's return expression
+
+OPNAMES = ['BINARY_OPERANDS', 'ASSIGN_OPERANDS', 'LOAD', 'STORE',
+           'BINARY_OPERAND', 'JUMP_UNLESS_OPERANDS', 'LOAD_CONST', 'BINARY',
+           'JUMP_IF_FALSE', 'JUMP', 'JUMP_IF_EQ_FALSE', 'CALL', 'RETURN',
+           'POP', 'PRINT', 'INDEX', 'STORE_INDEX', 'BUILD_LIST',
+           'BUILD_TUPLE', 'TUPLE_INDEX', 'NEGATION', 'UMINUS', 'FAIL', 'HALT',
+           'TAIL_CALL']
+
+# Number of arguments following each opcode
+OPSIZES = [3, 4, 1, 1, 2, 4, 1, 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1]
+
+# ------------------------ Operators --------------------------- #
+# BinOp / Compare operator string, and the andalso, orelse, in and ::
+# operators -> operator index used by the BINARY instructions
+OPERATORS = ['+', '-', '*', '/', '**', 'div', 'mod',
+             '<=', '<', '==', '<>', '>=', '>',
+             'andalso', 'orelse', 'in', '::']
+COMPARISONS = ('<=', '<', '==', '<>', '>=', '>')
+
+# SBML semantics of each operator
+BINARY_FUNCTIONS = [ops.BINARY[o] for o in OPERATORS[:13]] + \
+                   [ops.conjunction, ops.disjunction, ops.membership, ops.cons]
+
+# Fast path used when both operands are ints, where Python and SBML
+# agree. The operators that reject two ints keep their SBML function.
+INT_FUNCTIONS = [operator.add, operator.sub, operator.mul, operator.truediv,
+                 operator.pow, operator.floordiv, operator.mod,
+                 operator.le, operator.lt, operator.eq, operator.ne,
+                 operator.ge, operator.gt] + BINARY_FUNCTIONS[13:]
+
+# ------------------------ Code Objects ------------------------ #
+class Code():
+    def __init__(self, name):
+        self.name = name
+        self.ops = []      # Flat list: opcode, arguments, opcode, arguments ...
+        self.consts = []
+        self.names = []
+
+    def emit(self, opcode, *args):
+        position = len(self.ops)
+        self.ops.append(opcode)
+        self.ops.extend(args)
+        return position
+
+    # Set the jump target, the last argument of the instruction at position
+    def patch(self, position, target):
+        self.ops[position + OPSIZES[self.ops[position]]] = target
+
+    def here(self):
+        return len(self.ops)
+
+    def constIndex(self, value):
+        # Compare types as well, 1 == 1.0 == True must stay distinct.
+        # Floats are never shared so that -0.0 and 0.0 stay apart
+        if type(value) != float:
+            for i, c in enumerate(self.consts):
+                if type(c) == type(value) and c == value:
+                    return i
+        self.consts.append(value)
+        return len(self.consts) - 1
+
+    def nameIndex(self, name):
+        if name not in self.names:
+            self.names.append(name)
+        return self.names.index(name)
+
+    def operandName(self, operand):
+        if operand >= 0: return self.names[operand]
+        return repr(self.consts[~operand])
+
+    def disassemble(self):
+        lines = []
+        pc = 0
+        while pc < len(self.ops):
+            op = self.ops[pc]
+            args = self.ops[pc + 1:pc + 1 + OPSIZES[op]]
+            if op == LOAD_CONST: args = [repr(self.consts[args[0]])]
+            elif op == LOAD or op == STORE: args = [self.names[args[0]]]
+            elif op == BINARY: args = [OPERATORS[args[0]]]
+            elif op == BINARY_OPERAND:
+                args = [OPERATORS[args[0]], self.operandName(args[1])]
+            elif op == BINARY_OPERANDS or op == ASSIGN_OPERANDS or op == JUMP_UNLESS_OPERANDS:
+                expression = [self.operandName(args[1]), OPERATORS[args[0]], self.operandName(args[2])]
+                if op == ASSIGN_OPERANDS: args = [self.names[args[3]], '='] + expression
+                elif op == JUMP_UNLESS_OPERANDS: args = expression + ['->', args[3]]
+                else: args = expression
+            lines.append("%4d %-16s %s" % (pc, OPNAMES[op], " ".join(str(a) for a in args)))
+            pc += 1 + OPSIZES[op]
+        return "\n".join(lines)
+
+class Function():
+    def __init__(self, name, params, code):
+        self.name = name
+        self.params = params # Parameter names
+        self.code = code
+
+class Program():
+    def __init__(self, functions, main):
+        self.functions = functions # List of Function, indexed by CALL
+        self.main = main
+
+# ------------------------- Compiler --------------------------- #
+class Compiler():
+    def __init__(self):
+        self.functions = []
+        self.index = dict() # Function name -> index in self.functions
+        self.code = None
+
+    def compileProgram(self, tree):
+        # Functions are all registered before the main block runs, the
+        # last definition of a name wins
+        definitions = dict()
+        for func in tree.left:
+            definitions[func.value] = func
+        for name in definitions:
+            self.index[name] = len(self.functions)
+            params = [p.getName() for p in definitions[name].left]
+            self.functions.append(Function(name, params, None))
+
+        for name in definitions:
+            func = definitions[name]
+            self.code = Code(name)
+            self.statement(func.right)
+            # A call as the return expression replaces the current frame
+            if isinstance(func.child, AST_FunctionCall):
+                self.functionCall(func.child, TAIL_CALL)
+            else: self.expression(func.child)
+            self.code.emit(RETURN)
+            self.functions[self.index[name]].code = self.code
+
+        self.code = Code('main')
+        self.statement(tree.right)
+        self.code.emit(HALT)
+        return Program(self.functions, self.code)
+
+    def dispatch(self, table, node):
+        for cls in type(node).__mro__:
+            if cls in table:
+                return table[cls](self, node)
+        raise SemanticError()
+
+    # --- Statements
+    def statement(self, node):
+        self.dispatch(STATEMENTS, node)
+
+    def block(self, node):
+        for statement in node.value:
+            self.statement(statement)
+
+    def printStatement(self, node):
+        self.expression(node.value)
+        self.code.emit(PRINT)
+
+    def assignment(self, node):
+        name = self.code.nameIndex(node.value.getName())
+        operands = self.simpleOperation(node.child)
+        if operands is not None:
+            self.code.emit(ASSIGN_OPERANDS, *(operands + (name,)))
+            return
+        self.expression(node.child)
+        self.code.emit(STORE, name)
+
+    def indexAssignment(self, node):
+        for i in node.value:
+            self.expression(i)
+        self.code.emit(LOAD, self.code.nameIndex(node.left.getName()))
+        self.expression(node.right)
+        self.code.emit(STORE_INDEX, len(node.value))
+
+    # Jump over what follows when the condition is False. Comparisons
+    # of two simple operands always produce a boolean (or fail), so the
+    # fused instruction serves both if and while conditions.
+    def condition(self, node, opcode):
+        operands = self.simpleOperation(node)
+        if operands is not None and isinstance(node, Compare):
+            return self.code.emit(JUMP_UNLESS_OPERANDS, *(operands + (0,)))
+        self.expression(node)
+        return self.code.emit(opcode, 0)
+
+    def ifStatement(self, node):
+        jump = self.condition(node.value, JUMP_IF_FALSE)
+        self.statement(node.child)
+        self.code.patch(jump, self.code.here())
+
+    def ifElse(self, node):
+        jump = self.condition(node.left.value, JUMP_IF_FALSE)
+        self.statement(node.left.child)
+        end = self.code.emit(JUMP, 0)
+        self.code.patch(jump, self.code.here())
+        self.statement(node.right)
+        self.code.patch(end, self.code.here())
+
+    def whileStatement(self, node):
+        top = self.code.here()
+        end = self.condition(node.value, JUMP_IF_EQ_FALSE)
+        self.statement(node.child)
+        self.code.emit(JUMP, top)
+        self.code.patch(end, self.code.here())
+
+    def callStatement(self, node):
+        self.functionCall(node)
+        self.code.emit(POP)
+
+    # --- Expressions
+    def expression(self, node):
+        self.dispatch(EXPRESSIONS, node)
+
+    def literal(self, node):
+        self.code.emit(LOAD_CONST, self.code.constIndex(node.value))
+
+    def variable(self, node):
+        self.code.emit(LOAD, self.code.nameIndex(node.getName()))
+
+    # Operand argument of a variable or literal node, None otherwise
+    def operand(self, node):
+        if type(node) in LITERALS: return ~self.code.constIndex(node.value)
+        if type(node) == AST_Variable: return self.code.nameIndex(node.getName())
+        return None
+
+    # (operator, left, right) arguments of a binary operation on two
+    # variables or literals, None for any other node
+    def simpleOperation(self, node):
+        operation = None
+        for cls in type(node).__mro__:
+            if cls in OPERATIONS:
+                operation = OPERATIONS[cls]
+                break
+        if operation is None:
+            return None
+        if operation == 'binary': operation = node.value
+        left = self.operand(node.left)
+        right = self.operand(node.right)
+        if left is None or right is None:
+            return None
+        return (OPERATORS.index(operation), left, right)
+
+    def binary(self, node, operation):
+        operands = self.simpleOperation(node)
+        if operands is not None:
+            self.code.emit(BINARY_OPERANDS, *operands)
+            return
+        operation = OPERATORS.index(operation)
+        self.expression(node.left)
+        right = self.operand(node.right)
+        if right is not None:
+            self.code.emit(BINARY_OPERAND, operation, right)
+        else:
+            self.expression(node.right)
+            self.code.emit(BINARY, operation)
+
+    def operation(self, node):
+        self.binary(node, node.value)
+
+    def disjunction(self, node):
+        self.binary(node, 'orelse')
+
+    def conjunction(self, node):
+        self.binary(node, 'andalso')
+
+    def membership(self, node):
+        self.binary(node, 'in')
+
+    def cons(self, node):
+        self.binary(node, '::')
+
+    def negation(self, node):
+        self.expression(node.child)
+        self.code.emit(NEGATION)
+
+    def uminus(self, node):
+        self.expression(node.child)
+        self.code.emit(UMINUS)
+
+    def index(self, node):
+        # Indices are evaluated before the indexed value
+        for i in node.value:
+            self.expression(i)
+        if type(node.child) == str: self.code.emit(LOAD_CONST, self.code.constIndex(node.child))
+        else: self.expression(node.child)
+        self.code.emit(INDEX, len(node.value))
+
+    def tupleIndex(self, node):
+        if type(node.child) == str: self.code.emit(LOAD, self.code.nameIndex(node.child))
+        else: self.expression(node.child)
+        self.code.emit(TUPLE_INDEX, node.value)
+
+    def listLiteral(self, node):
+        for element in node.value:
+            self.expression(element)
+        self.code.emit(BUILD_LIST, len(node.value))
+
+    def tupleLiteral(self, node):
+        # A tuple built from a single expression is not iterable and
+        # fails in AST_Tuple.eval
+        if type(node.value) != tuple and type(node.value) != list:
+            self.code.emit(FAIL)
+            return
+        for element in node.value:
+            self.expression(element)
+        self.code.emit(BUILD_TUPLE, len(node.value))
+
+    def functionCall(self, node, opcode=CALL):
+        # The function table is fixed before the main block runs, an
+        # unknown name or a wrong argument count fails before the
+        # arguments are evaluated
+        if node.value not in self.index:
+            self.code.emit(FAIL)
+            return
+        index = self.index[node.value]
+        if len(self.functions[index].params) != len(node.child):
+            self.code.emit(FAIL)
+            return
+        for arg in node.child:
+            self.expression(arg)
+        self.code.emit(opcode, index)
+
+LITERALS = (AST_Number, AST_String, AST_Boolean)
+
+# Node classes compiled to a BINARY instruction -> operator string,
+# 'binary' when the operator is the node value
+OPERATIONS = {BinOp: 'binary',
+              Compare: 'binary',
+              Disjunction: 'orelse',
+              Conjunction: 'andalso',
+              Membership: 'in',
+              Cons: '::'
+             }
+
+STATEMENTS = {AST_Block: Compiler.block,
+              AST_Print: Compiler.printStatement,
+              AST_Assignment: Compiler.assignment,
+              AST_IndexAssignment: Compiler.indexAssignment,
+              AST_IfElse: Compiler.ifElse,
+              AST_If: Compiler.ifStatement,
+              AST_While: Compiler.whileStatement,
+              AST_FunctionCall: Compiler.callStatement
+             }
+
+EXPRESSIONS = {AST_Number: Compiler.literal,
+               AST_String: Compiler.literal,
+               AST_Boolean: Compiler.literal,
+               AST_Variable: Compiler.variable,
+               BinOp: Compiler.operation,
+               Compare: Compiler.operation,
+               Disjunction: Compiler.disjunction,
+               Conjunction: Compiler.conjunction,
+               Membership: Compiler.membership,
+               Cons: Compiler.cons,
+               Negation: Compiler.negation,
+               UMinus: Compiler.uminus,
+               Index: Compiler.index,
+               Tuple_Index: Compiler.tupleIndex,
+               AST_List: Compiler.listLiteral,
+               AST_Tuple: Compiler.tupleLiteral,
+               AST_FunctionCall: Compiler.functionCall
+              }
+
+def compileTree(tree):
+    return Compiler().compileProgram(tree)
+
+# ---------------------- Virtual Machine ----------------------- #
+class VM():
+    def __init__(self, program, sink=None):
+        self.program = program
+        self.sink = sink if sink is not None else output.sink
+        self.functions = program.functions
+        self.globals = dict()
+
+    def run(self):
+        self.execute(self.program.main, self.globals)
+
+    # SBML calls do not recurse in Python: the caller's code, position
+    # and local variables are saved on the frames list, so the call
+    # depth is only limited by memory. The value stack is shared, a
+    # call leaves its result where its arguments were.
+    def execute(self, code, local):
+        frames = []
+        instructions = code.ops
+        consts = code.consts
+        names = code.names
+        functions = self.functions
+        glob = self.globals
+        intFunctions = INT_FUNCTIONS
+        binaryFunctions = BINARY_FUNCTIONS
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        write = self.sink.write
+        pc = 0
+
+        # Variables are looked for in the local list, then in the global
+        # list. In the main block both are the same dictionary.
+        while True:
+            op = instructions[pc]
+
+            if op <= JUMP_UNLESS_OPERANDS:
+                if op == LOAD:
+                    name = names[instructions[pc + 1]]
+                    try: push(local[name])
+                    except KeyError: push(glob[name])
+                    pc += 2
+                    continue
+                if op == STORE:
+                    name = names[instructions[pc + 1]]
+                    if name in local or name not in glob: local[name] = pop()
+                    else: glob[name] = pop()
+                    pc += 2
+                    continue
+
+                # Binary operation, fetch the operands
+                if op == BINARY_OPERAND:
+                    left = stack[-1]
+                    operand = instructions[pc + 2]
+                else:
+                    operand = instructions[pc + 2]
+                    if operand >= 0:
+                        name = names[operand]
+                        try: left = local[name]
+                        except KeyError: left = glob[name]
+                    else: left = consts[~operand]
+                    operand = instructions[pc + 3]
+                if operand >= 0:
+                    name = names[operand]
+                    try: right = local[name]
+                    except KeyError: right = glob[name]
+                else: right = consts[~operand]
+
+                if type(left) is int and type(right) is int:
+                    value = intFunctions[instructions[pc + 1]](left, right)
+                else:
+                    value = binaryFunctions[instructions[pc + 1]](left, right)
+
+                if op == BINARY_OPERANDS:
+                    push(value)
+                    pc += 4
+                elif op == ASSIGN_OPERANDS:
+                    name = names[instructions[pc + 4]]
+                    if name in local or name not in glob: local[name] = value
+                    else: glob[name] = value
+                    pc += 5
+                elif op == BINARY_OPERAND:
+                    stack[-1] = value
+                    pc += 3
+                elif value: pc += 5
+                else: pc = instructions[pc + 4]
+            elif op == LOAD_CONST:
+                push(consts[instructions[pc + 1]])
+                pc += 2
+            elif op == BINARY:
+                right = pop()
+                left = stack[-1]
+                if type(left) is int and type(right) is int:
+                    stack[-1] = intFunctions[instructions[pc + 1]](left, right)
+                else:
+                    stack[-1] = binaryFunctions[instructions[pc + 1]](left, right)
+                pc += 2
+            elif op == JUMP_IF_FALSE:
+                value = pop()
+                if value is True: pc += 2
+                elif value is False: pc = instructions[pc + 1]
+                else: raise SemanticError()
+            elif op == JUMP:
+                pc = instructions[pc + 1]
+            elif op == JUMP_IF_EQ_FALSE:
+                if pop() == False: pc = instructions[pc + 1]
+                else: pc += 2
+            elif op == CALL or op == TAIL_CALL:
+                func = functions[instructions[pc + 1]]
+                # Add the parameter values into the local variable list
+                count = len(func.params)
+                if count:
+                    frame = dict(zip(func.params, stack[-count:]))
+                    del stack[-count:]
+                else: frame = dict()
+                # A tail call returns straight to the current caller
+                if op == CALL: frames.append((code, pc + 2, local))
+                code = func.code
+                instructions = code.ops
+                consts = code.consts
+                names = code.names
+                local = frame
+                pc = 0
+            elif op == RETURN:
+                if not frames: return pop()
+                code, pc, local = frames.pop()
+                instructions = code.ops
+                consts = code.consts
+                names = code.names
+            elif op == POP:
+                pop()
+                pc += 1
+            elif op == PRINT:
+                write(pop())
+                pc += 1
+            elif op == INDEX:
+                count = instructions[pc + 1]
+                pc += 2
+                value = pop()
+                indices = stack[-count:]
+                del stack[-count:]
+                push(ops.index(value, indices))
+            elif op == STORE_INDEX:
+                count = instructions[pc + 1]
+                pc += 2
+                value = pop()
+                variable = pop()
+                indices = stack[-count:]
+                del stack[-count:]
+                ops.indexAssign(variable, indices, value)
+            elif op == BUILD_LIST:
+                count = instructions[pc + 1]
+                pc += 2
+                if count:
+                    elements = stack[-count:]
+                    del stack[-count:]
+                    push(elements)
+                else: push([])
+            elif op == BUILD_TUPLE:
+                count = instructions[pc + 1]
+                pc += 2
+                if count:
+                    elements = tuple(stack[-count:])
+                    del stack[-count:]
+                    push(elements)
+                else: push(())
+            elif op == TUPLE_INDEX:
+                stack[-1] = ops.tupleIndex(stack[-1], instructions[pc + 1])
+                pc += 2
+            elif op == NEGATION:
+                stack[-1] = ops.negation(stack[-1])
+                pc += 1
+            elif op == UMINUS:
+                stack[-1] = ops.uminus(stack[-1])
+                pc += 1
+            elif op == FAIL:
+                raise SemanticError()
+            elif op == HALT:
+                return None
+
+def run(tree, sink=None):
+    try:
+        program = compileTree(tree)
+        VM(program, sink).run()
+    except SemanticError:
+        raise
+    except Exception:
+        raise SemanticError()
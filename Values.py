@@ -0,0 +1,485 @@
+# -------------------------------------------------------------- #
+# ------------------------ Values.py --------------------------- #
+# -------------------------------------------------------------- #
+
+# Runtime list representations other than the Python list. SBML code
+# sees them as ordinary lists: the type checks use isList, and they
+# index, concatenate, compare and print like a Python list.
+
+class ListValue():
+    pass
+
+def isList(value):
+    return type(value) == list or isinstance(value, ListValue)
+
+# --------------------------- Rope ----------------------------- #
+# Result of '+' on strings once it is ROPE_LENGTH characters long. The
+# pieces are kept in a list and 's = s + x' appends x to it, O(1)
+# amortized instead of copying s. Ropes made from one another share
+# the list: each covers its first count pieces, only the rope covering
+# all of them appends in place, the others copy their pieces first.
+# The text is joined once, when the rope is indexed, compared,
+# searched, hashed or printed, and kept. SBML code sees a string: the
+# type checks use isString.
+ROPE_LENGTH = 256
+
+class Rope():
+    __slots__ = ('pieces', 'count', 'length', 'text')
+
+    def __init__(self, pieces, count, length):
+        self.pieces = pieces # Strings, shared with other ropes
+        self.count = count   # Pieces of this rope
+        self.length = length
+        self.text = None     # Joined pieces, built on demand
+
+    @staticmethod
+    def concat(left, right):
+        if len(left) + len(right) < ROPE_LENGTH: return left + right
+        return Rope([left, right], 2, len(left) + len(right))
+
+    def toString(self):
+        if self.text is None:
+            pieces = self.pieces
+            if len(pieces) != self.count: pieces = pieces[:self.count]
+            self.text = "".join(pieces)
+            # The text replaces the pieces, in a list of this rope only
+            self.pieces = [self.text]
+            self.count = 1
+        return self.text
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        return self.toString()[index]
+
+    def __contains__(self, value):
+        if type(value) is Rope: value = value.toString()
+        return value in self.toString()
+
+    def __add__(self, other):
+        if type(other) is Rope: other = other.toString()
+        elif type(other) is not str: return NotImplemented
+        pieces = self.pieces
+        if len(pieces) != self.count: pieces = pieces[:self.count]
+        pieces.append(other)
+        return Rope(pieces, self.count + 1, self.length + len(other))
+
+    def __radd__(self, other):
+        if type(other) is not str: return NotImplemented
+        return Rope([other, self.toString()], 2, len(other) + self.length)
+
+    def __eq__(self, other):
+        if isString(other): return self.toString() == str(other)
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isString(other): return self.toString() < str(other)
+        return NotImplemented
+
+    def __le__(self, other):
+        if isString(other): return self.toString() <= str(other)
+        return NotImplemented
+
+    def __gt__(self, other):
+        if isString(other): return self.toString() > str(other)
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isString(other): return self.toString() >= str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.toString())
+
+    def __str__(self):
+        return self.toString()
+
+    def __repr__(self):
+        return repr(self.toString())
+
+def isString(value):
+    return type(value) is str or type(value) is Rope
+
+# ------------------------- ConsList --------------------------- #
+# Result of '::'. The elements are kept in a chain of immutable cells
+# ending in a tuple, so 'x :: xs' shares the cells of xs and takes
+# O(1) instead of copying the list. Reading anything but the first
+# element builds a Python list once and keeps it. Assigning into a
+# ConsList drops the chain, the handle then owns its list only, which
+# leaves every other list sharing the cells unchanged.
+class Cell():
+    __slots__ = ('value', 'next')
+
+    def __init__(self, value, next):
+        self.value = value
+        self.next = next # Cell, or tuple of the remaining elements
+
+class ConsList(ListValue):
+    __slots__ = ('cells', 'items', 'length')
+
+    def __init__(self, cells, length):
+        self.cells = cells   # Cell chain, None once the list was changed
+        self.items = None    # Python list of the elements, built on demand
+        self.length = length
+
+    # Cells for a list that is about to be shared by a new cell
+    @staticmethod
+    def share(value):
+        if type(value) == ConsList:
+            if value.cells is None:
+                # Snapshot the changed list, kept until it changes again
+                value.cells = tuple(value.items)
+            return value.cells
+        return tuple(value)
+
+    @staticmethod
+    def cons(head, tail):
+        return ConsList(Cell(head, ConsList.share(tail)), len(tail) + 1)
+
+    def toList(self):
+        if self.items is None:
+            items = []
+            cell = self.cells
+            while type(cell) == Cell:
+                items.append(cell.value)
+                cell = cell.next
+            items.extend(cell)
+            self.items = items
+        return self.items
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        # The head is read straight from the first cell
+        if index == 0 and type(self.cells) == Cell:
+            return self.cells.value
+        return self.toList()[index]
+
+    def __setitem__(self, index, value):
+        self.toList()[index] = value
+        self.cells = None
+
+    def __iter__(self):
+        return iter(self.toList())
+
+    def __contains__(self, value):
+        return value in self.toList()
+
+    def __add__(self, other):
+        if isList(other):
+            return self.toList() + list(other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isList(other):
+            return list(other) + self.toList()
+        return NotImplemented
+
+    def __eq__(self, other):
+        if isList(other):
+            return self.toList() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.toList())
+
+# ------------------------ PackedList -------------------------- #
+# List literal whose elements are all ints or all floats, with
+# sbml.py --packed-lists. The elements are kept unboxed in an array
+# ('q' for ints that fit in 64 bits, 'd' for floats): 8 bytes each
+# instead of a pointer and an int or float object. Concatenating two
+# packed lists of one kind gives a packed list again. Storing any other
+# value turns the array into a Python list for good, every name
+# sharing the handle sees the change like with an ordinary list.
+from array import array
+
+# Lists built by the tree-walker get packed, see AST_Nodes.Interpreter
+packing = False
+
+INT = 'q'
+FLOAT = 'd'
+TYPES = {INT: int, FLOAT: float}
+
+# PackedList of items when they are all ints or all floats, else items
+def pack(items):
+    if not items: return items
+    kind = type(items[0])
+    if kind is int: code = INT
+    elif kind is float: code = FLOAT
+    else: return items
+    for item in items:
+        if type(item) is not kind: return items
+    try:
+        return PackedList(array(code, items))
+    except OverflowError:
+        return items
+
+class PackedList(ListValue):
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data # array, Python list once something else was stored
+
+    # Elements as a Python list, a copy while packed
+    def toList(self):
+        if type(self.data) is array: return self.data.tolist()
+        return self.data
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def __setitem__(self, index, value):
+        data = self.data
+        if type(data) is array:
+            if type(value) is TYPES[data.typecode]:
+                try:
+                    data[index] = value
+                    return
+                except OverflowError:
+                    pass
+            data = self.data = data.tolist()
+        data[index] = value
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __contains__(self, value):
+        return value in self.data
+
+    def __add__(self, other):
+        if type(other) == PackedList and type(self.data) is array and \
+           type(other.data) is array and self.data.typecode == other.data.typecode:
+            return PackedList(self.data + other.data)
+        if isList(other):
+            return self.toList() + list(other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isList(other):
+            return list(other) + self.toList()
+        return NotImplemented
+
+    def __eq__(self, other):
+        if type(other) == PackedList and type(self.data) is array and type(other.data) is array:
+            return self.data == other.data
+        if isList(other):
+            return self.toList() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.toList())
+
+# ------------------------ AppendList -------------------------- #
+# Result of 'xs = xs + e' on lists (AST_AppendAssignment). Like the
+# pieces of a Rope, the elements are the first length items of a
+# buffer shared by the lists grown from one another: growing the list
+# that covers the whole buffer appends to it in place, O(1) amortized
+# instead of copying xs, and gives a new handle; the old handle still
+# covers its own elements only. Assigning into a list whose buffer
+# another live handle uses copies its elements to a buffer of its own
+# first. handles holds one entry per live handle of a buffer, added
+# when the handle is made and removed by __del__ once it is garbage,
+# so whatever refers to a list, nothing can see another list change.
+# A handle freed late only costs a copy. Grown from a packed list (or
+# an empty list by a packed one) the buffer is an array and stays one
+# while the elements appended are packed alike, like a PackedList.
+from itertools import islice
+
+# Elements of the list other as an array to extend the array items
+# with, None when they don't all fit in it
+def packable(items, other):
+    if type(other) == PackedList: other = other.data
+    elif type(other) == AppendList: other = other.items[:other.length]
+    if type(other) is array:
+        if other.typecode == items.typecode: return other
+        return None
+    kind = TYPES[items.typecode]
+    for value in other:
+        if type(value) is not kind: return None
+    try:
+        return array(items.typecode, other)
+    except OverflowError:
+        return None
+
+class AppendList(ListValue):
+    __slots__ = ('items', 'length', 'handles')
+
+    def __init__(self, items, length, handles):
+        self.items = items     # Buffer, shared with the lists grown from this one
+        self.length = length   # Elements of this list, the first of items
+        self.handles = handles # One entry per live handle on items
+        handles.append(None)
+
+    def __del__(self):
+        self.handles.pop()
+
+    # value + other for the lists value and other, value is unchanged
+    @staticmethod
+    def grow(value, other):
+        if type(value) == AppendList: return value.extend(other)
+        if not value and type(other) == PackedList:
+            value, other = other, ()
+        if type(value) == PackedList and type(value.data) is array: items = value.data[:]
+        else: items = list(value)
+        return AppendList(items, len(items), []).extend(other)
+
+    def extend(self, other):
+        items = self.items
+        if type(items) is array:
+            packed = packable(items, other)
+            if packed is None:
+                # A Python list from now on
+                items = items[:self.length].tolist()
+                items.extend(other)
+                return AppendList(items, len(items), [])
+            other = packed
+        if len(items) != self.length:
+            if len(self.handles) == 1:
+                # The lists that covered the rest are gone
+                del items[self.length:]
+            else:
+                items = items[:self.length]
+                items.extend(other)
+                return AppendList(items, len(items), [])
+        items.extend(other)
+        return AppendList(items, len(items), self.handles)
+
+    # Move to a buffer of this list only
+    def own(self, items):
+        self.handles.pop()
+        self.items = items
+        self.handles = [None]
+
+    # Elements as a Python list, not a copy when the buffer is a list of
+    # these elements only
+    def toList(self):
+        items = self.items
+        if len(items) != self.length: items = items[:self.length]
+        if type(items) is array: return items.tolist()
+        return items
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if index < 0: index += self.length
+        if index < 0 or index >= self.length: raise IndexError()
+        return self.items[index]
+
+    def __setitem__(self, index, value):
+        if index < 0: index += self.length
+        if index < 0 or index >= self.length: raise IndexError()
+        if len(self.handles) != 1: self.own(self.items[:self.length])
+        items = self.items
+        if type(items) is array:
+            if type(value) is TYPES[items.typecode]:
+                try:
+                    items[index] = value
+                    return
+                except OverflowError:
+                    pass
+            items = self.items = items.tolist()
+        items[index] = value
+
+    def __iter__(self):
+        return islice(self.items, self.length)
+
+    def __contains__(self, value):
+        items = self.items
+        if len(items) != self.length: items = items[:self.length]
+        return value in items
+
+    def __add__(self, other):
+        if type(self.items) is array and isList(other):
+            packed = packable(self.items, other)
+            if packed is not None: return PackedList(self.items[:self.length] + packed)
+        if isList(other):
+            return self.toList() + list(other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isList(other):
+            return list(other) + self.toList()
+        return NotImplemented
+
+    def __eq__(self, other):
+        if isList(other):
+            return self.toList() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.toList())
+
+# ---------------------- MembershipIndex ----------------------- #
+# Answers 'value in list' for the tree-walker. A list of at least
+# MIN_LENGTH elements tested MIN_QUERIES times gets a set of its
+# hashable elements, later tests of a hashable value are a set lookup.
+# Sets compare like 'in' (1, 1.0 and True are one element) and a
+# hashable value never equals an unhashable element (a list, a tuple
+# holding a list), those are kept apart and scanned when the value is
+# unhashable too; they are mutable but only ever compared at query
+# time. Only the list itself changing makes an index wrong, every
+# assignment into a list calls invalidate. The last size lists tested
+# are tracked by identity and kept alive while tracked.
+from collections import OrderedDict
+
+MIN_LENGTH = 16
+MIN_QUERIES = 2
+DEFAULT_SIZE = 64
+
+class Indexed():
+    __slots__ = ('values', 'queries', 'hashed', 'rest')
+
+    def __init__(self, values):
+        self.values = values # The list, keeps its id from being reused
+        self.queries = 0
+        self.hashed = None   # Set of the hashable elements, once built
+        self.rest = None     # The other elements
+
+    def build(self):
+        hashed = set()
+        rest = []
+        for value in self.values:
+            try:
+                hashed.add(value)
+            except TypeError:
+                rest.append(value)
+        self.hashed = hashed
+        self.rest = rest
+
+class MembershipIndex():
+    def __init__(self, size=DEFAULT_SIZE):
+        self.size = size
+        self.lists = OrderedDict() # id -> Indexed, least recently tested first
+
+    def contains(self, values, value):
+        if len(values) < MIN_LENGTH: return value in values
+        lists = self.lists
+        entry = lists.get(id(values))
+        if entry is None:
+            entry = lists[id(values)] = Indexed(values)
+            if len(lists) > self.size: lists.popitem(last=False)
+        else: lists.move_to_end(id(values))
+        if entry.hashed is None:
+            entry.queries += 1
+            if entry.queries < MIN_QUERIES: return value in values
+            entry.build()
+        try:
+            return value in entry.hashed
+        except TypeError:
+            return value in entry.rest
+
+    # values was changed
+    def invalidate(self, values):
+        if self.lists: self.lists.pop(id(values), None)
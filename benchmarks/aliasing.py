@@ -0,0 +1,189 @@
+# -------------------------------------------------------------- #
+# ------------------------ aliasing.py ------------------------- #
+# -------------------------------------------------------------- #
+
+# Differential check of 'xs = xs + e' (AST_AppendAssignment): a program
+# growing lists that are also held by another variable, a list
+# element, a tuple field, a function argument and the membership
+# index, then assigning into them, is run on every engine, with and
+# without --packed-lists and at every -O level. Every output must be
+# the one of the tree-walker with the rewrite undone (every
+# AST_AppendAssignment run as the AST_Assignment it replaced).
+# Exit status 1 when one differs.
+#
+#   python benchmarks/aliasing.py
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import AST_Nodes as nodes
+import Engines as engines
+import Output as output
+import Parser as parser
+
+PROGRAM = """
+fun grow(xs, n) =
+{
+ i = 0;
+ while (i < n) { xs = xs + [i]; i = i + 1; }
+}
+xs;
+fun setFirst(l, v) = { l[0] = v; } l;
+fun growAndSet(l) = { l = l + [8]; l[0] = 42; } l;
+fun sneaky(k) =
+{
+ ys = g;
+ g = [k];
+}
+0;
+{
+ a = [1];
+ a = a + [2];
+ b = a;
+ a = a + [3];
+ b[0] = 9;
+ print(a);
+ print(b);
+ a[1] = 7;
+ print(a);
+ print(b);
+ b = b + [4];
+ print(a);
+ print(b);
+
+ c = [1];
+ c = c + [2];
+ d = [c, c];
+ c = c + [3];
+ c[0] = 0;
+ print(c);
+ print(d);
+ d[0][1] = 5;
+ print(d);
+ print(c);
+
+ t = [1];
+ t = t + [2];
+ u = (t, 1);
+ t = t + [3];
+ t[1] = 0;
+ print(u);
+ print(t);
+
+ e = [7];
+ e = e + [1];
+ f = grow(e, 3);
+ print(e);
+ print(f);
+ h = setFirst(e, 0);
+ print(e);
+ print(h);
+ v = growAndSet(e);
+ print(e);
+ print(v);
+ print(grow([], 4));
+
+ m = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16];
+ m = m + [17];
+ print(17 in m);
+ print(17 in m);
+ keep = m;
+ m = m + [18];
+ print(18 in keep);
+ print(18 in m);
+ keep[0] = 100;
+ print(100 in keep);
+ print(100 in m);
+ m[1] = 200;
+ print(200 in m);
+ print(200 in keep);
+
+ g = [0];
+ ys = [];
+ g = g + [sneaky(1)];
+ print(g);
+ print(ys);
+
+ x = 0 :: [1];
+ x = x + [2];
+ y = 5 :: x;
+ x = x + [3];
+ x[0] = 9;
+ print(x);
+ print(y);
+
+ q = [1];
+ q = q + q;
+ q = q + q;
+ print(q);
+ r = [1];
+ r = r + [r];
+ print(r);
+
+ n = [];
+ i = 0;
+ while (i < 6) { n = n + [i]; n[0] = i; i = i + 1; }
+ print(n);
+ p = n;
+ n = n + [1.5];
+ n = n + [2.5];
+ p = p + [True];
+ print(n);
+ print(p);
+ n[2] = "s";
+ print(n);
+ print(p);
+ w = [0.5];
+ w = w + w;
+ w = w + [99999999999999999999];
+ print(w);
+ print(n[-1]);
+ print(n[-7]);
+
+ s = "a";
+ s = s + "b";
+ print(s);
+ z = z + [1];
+}
+"""
+
+# Run node and every node under it as an AST_Assignment where it is an
+# AST_AppendAssignment
+def undoRewrite(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, nodes.Node):
+            if type(node) is nodes.AST_AppendAssignment:
+                node.__class__ = nodes.AST_Assignment
+            for attribute in ('value', 'left', 'right', 'child'):
+                stack.append(getattr(node, attribute, None))
+        elif type(node) == list or type(node) == tuple:
+            stack.extend(node)
+
+def run(engine, level, packed, rewrite=True):
+    tree = parser.prepare(PROGRAM, level)[0]
+    if not rewrite: undoRewrite(tree)
+    capture = output.Capture()
+    engines.run(tree, engine, sink=capture, packed=packed)
+    return capture.getvalue()
+
+def main():
+    expected = run('tree', 0, False, rewrite=False)
+    failed = 0
+    runs = 0
+    for engine in sorted(engines.ENGINES):
+        for level in (0, 1, 2):
+            for packed in (False, True):
+                runs += 1
+                result = run(engine, level, packed)
+                if result != expected:
+                    failed += 1
+                    print("%s -O%d%s: output differs" %
+                          (engine, level, " --packed-lists" if packed else ""))
+    print("%d runs, %d differ" % (runs, failed))
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
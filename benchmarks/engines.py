@@ -0,0 +1,71 @@
+# -------------------------------------------------------------- #
+# ------------------------ engines.py -------------------------- #
+# -------------------------------------------------------------- #
+
+# Differential check of the engines and the optimizer: the programs in
+# benchmarks/programs and the small programs below are run on every
+# engine at every -O level, and every output must be the one of the
+# tree-walker at -O0. Exit status 1 when one differs.
+#
+#   python benchmarks/engines.py [program ...]
+
+import glob
+import os
+import sys
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(DIRECTORY))
+import Engines as engines
+import Output as output
+import Parser as parser
+
+PROGRAMS = os.path.join(DIRECTORY, 'programs')
+
+# Constant folding turns -3 into one negative literal, which every
+# engine must keep as one operand
+CONSTANTS = """
+{
+ n = 2;
+ print((-3) ** n);
+ print((-2.5) ** n);
+ print(-3 ** n);
+ print((-0.0) ** n);
+ print(2 ** (-1));
+ print((-2) ** 3 ** n);
+ print(-(-3) ** n);
+ print(((-7) div 2) mod 3);
+ print(-2 - -3);
+ print([-1, -2.5][0] ** n);
+ print((-3, 4));
+ print(-3 in [-3]);
+}
+"""
+
+SNIPPETS = {'constants': CONSTANTS}
+
+def run(contents, engine, level):
+    capture = output.Capture()
+    tree = parser.prepare(contents, level)[0]
+    engines.run(tree, engine, sink=capture)
+    return capture.getvalue()
+
+def main():
+    sources = dict(SNIPPETS)
+    for path in sys.argv[1:] or sorted(glob.glob(os.path.join(PROGRAMS, '*.txt'))):
+        with open(path) as f:
+            sources[os.path.basename(path)] = f.read()
+    failed = 0
+    runs = 0
+    for name in sorted(sources):
+        expected = run(sources[name], 'tree', 0)
+        for engine in sorted(engines.ENGINES):
+            for level in (0, 1, 2):
+                runs += 1
+                if run(sources[name], engine, level) != expected:
+                    failed += 1
+                    print("%s on %s -O%d: output differs" % (name, engine, level))
+    print("%d runs, %d differ" % (runs, failed))
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+# -------------------------------------------------------------- #
+# ------------------------ harness.py -------------------------- #
+# -------------------------------------------------------------- #
+
+# Regression harness for the programs in benchmarks/programs.
+#
+# Every program is lexed (PLY lexer), parsed from those tokens and
+# resolved, optimized with -O, and run on the chosen engine with its
+# output captured. Each phase is timed separately, best of several
+# runs, then run once more under tracemalloc for its memory peak.
+#
+# The results are compared with benchmarks/baseline.json: a phase
+# more than --threshold slower (and at least 5 ms), a memory peak
+# more than --threshold larger, or a changed output is a regression
+# and the exit status is 1. --update stores the results as the new
+# baseline; times only compare on the machine that wrote them. Prebuilt
+# lexer or parser tables that are out of date (build_tables.py --check)
+# are a regression too, the lex and parse times would be wrong.
+#
+#   python benchmarks/harness.py [--engine vm] [-O 1] [--runs 5] [--update] [program ...]
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(DIRECTORY))
+import build_tables
+import Engines as engines
+import Lexer as lexer
+import Output as output
+import Parser as parser
+import Resolver as resolver
+
+BASELINE = os.path.join(DIRECTORY, 'baseline.json')
+PROGRAMS = os.path.join(DIRECTORY, 'programs')
+
+# Smallest slowdown reported, below it timer noise dominates
+MIN_SECONDS = 0.005
+
+# Token source for the parser over already lexed tokens
+class Tokens():
+    def __init__(self, tokens):
+        self.tokens = iter(tokens)
+        self.lineno = 1
+
+    def token(self):
+        return next(self.tokens, None)
+
+def lex(contents):
+    scanner = lexer.getLexer()
+    scanner.lineno = 1
+    scanner.input(contents)
+    tokens = []
+    while True:
+        token = scanner.token()
+        if not token: return tokens
+        tokens.append(token)
+
+def parse(tokens):
+    return resolver.resolve(parser.getParser().parse(lexer=Tokens(tokens)))
+
+def optimize(tree, level):
+    if level:
+        import Optimizer, TypeInference
+        Optimizer.optimize(tree, level)
+        TypeInference.infer(tree)
+    return tree
+
+def evaluate(tree, engine):
+    capture = output.Capture()
+    previous = output.use(capture)
+    try:
+        engines.run(tree, engine)
+    finally:
+        output.use(previous)
+    return capture.getvalue()
+
+# One run of every phase: seconds per phase and the output
+def runPhases(contents, engine, level, phases):
+    times = dict()
+    start = time.perf_counter()
+    tokens = lex(contents)
+    times['lex'] = time.perf_counter() - start
+    start = time.perf_counter()
+    tree = parse(tokens)
+    times['parse'] = time.perf_counter() - start
+    if 'optimize' in phases:
+        start = time.perf_counter()
+        optimize(tree, level)
+        times['optimize'] = time.perf_counter() - start
+    start = time.perf_counter()
+    result = evaluate(tree, engine)
+    times['eval'] = time.perf_counter() - start
+    return times, result
+
+# Memory peak of every phase, in bytes
+def peaks(contents, engine, level, phases):
+    peak = dict()
+    tracemalloc.start()
+    tokens = lex(contents)
+    peak['lex'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    tree = parse(tokens)
+    peak['parse'] = tracemalloc.get_traced_memory()[1]
+    if 'optimize' in phases:
+        tracemalloc.reset_peak()
+        optimize(tree, level)
+        peak['optimize'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    evaluate(tree, engine)
+    peak['eval'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+def measure(path, engine, level, runs):
+    with open(path) as f:
+        contents = f.read()
+    phases = ['lex', 'parse', 'optimize', 'eval'] if level else ['lex', 'parse', 'eval']
+    best = dict()
+    for i in range(runs):
+        times, result = runPhases(contents, engine, level, phases)
+        for phase in times:
+            best[phase] = min(best.get(phase, times[phase]), times[phase])
+    return {'seconds': best,
+            'peak': peaks(contents, engine, level, phases),
+            'output': hashlib.sha256(result.encode()).hexdigest()}
+
+# Regression messages of result against base
+def compare(name, result, base, threshold):
+    problems = []
+    if result['output'] != base['output']:
+        problems.append("%s: output changed" % name)
+    for phase, seconds in result['seconds'].items():
+        before = base['seconds'].get(phase)
+        if before is not None and seconds > before * (1 + threshold) and seconds - before > MIN_SECONDS:
+            problems.append("%s: %s %.1f ms -> %.1f ms" % (name, phase, before * 1000, seconds * 1000))
+    for phase, peak in result['peak'].items():
+        before = base['peak'].get(phase)
+        if before is not None and peak > before * (1 + threshold):
+            problems.append("%s: %s peak %.1f KB -> %.1f KB" % (name, phase, before / 1024, peak / 1024))
+    return problems
+
+def getOptions():
+    options = argparse.ArgumentParser(description="Time the benchmark programs and compare with the baseline")
+    options.add_argument('programs', nargs='*', help="programs to run (default: benchmarks/programs/*.txt)")
+    options.add_argument('--engine', choices=sorted(engines.ENGINES), default='tree')
+    options.add_argument('-O', type=int, choices=[0, 1, 2], default=0, dest='level')
+    options.add_argument('--runs', type=int, default=3, help="timed runs per program, the best counts")
+    options.add_argument('--threshold', type=float, default=0.25,
+                         help="relative slowdown or memory growth reported (default: 0.25)")
+    options.add_argument('--update', action='store_true', help="store the results as the baseline")
+    return options
+
+def main():
+    args = getOptions().parse_args()
+    paths = args.programs or sorted(glob.glob(os.path.join(PROGRAMS, '*.txt')))
+    configuration = "%s -O%d" % (args.engine, args.level)
+    baseline = dict()
+    if os.path.exists(BASELINE):
+        with open(BASELINE) as f:
+            baseline = json.load(f)
+    bases = baseline.get(configuration, dict())
+
+    problems = ["%s is out of date, run python build_tables.py" % table
+                for table in build_tables.stale()]
+    results = dict()
+    print("%-14s %9s %9s %9s %9s %11s" % (configuration, "lex ms", "parse ms", "opt ms", "eval ms", "peak KB"))
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        result = results[name] = measure(path, args.engine, args.level, args.runs)
+        seconds = result['seconds']
+        print("%-14s %9.2f %9.2f %9s %9.2f %11.1f" %
+              (name, seconds['lex'] * 1000, seconds['parse'] * 1000,
+               "%.2f" % (seconds['optimize'] * 1000) if 'optimize' in seconds else "-",
+               seconds['eval'] * 1000, max(result['peak'].values()) / 1024))
+        if name in bases:
+            problems.extend(compare(name, result, bases[name], args.threshold))
+
+    if args.update:
+        bases.update(results)
+        baseline[configuration] = bases
+        with open(BASELINE, 'w') as f:
+            json.dump(baseline, f, indent=1, sort_keys=True)
+            f.write("\n")
+        print("baseline updated")
+        return 0
+    for problem in problems:
+        print("REGRESSION " + problem)
+    if not bases:
+        print("no baseline for %s, run with --update" % configuration)
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+# -------------------------------------------------------------- #
+# ------------------------- nodes.py --------------------------- #
+# -------------------------------------------------------------- #
+
+# Memory taken by the tree of a generated program of N statements
+# (see stream.py) once parsed and resolved, per node and in total,
+# and the time to parse it and to run it on the tree-walker.
+#
+#   python benchmarks/nodes.py [N]
+
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import AST_Nodes as nodes
+import Output as output
+import Parser as parser
+from stream import generate
+
+def countNodes(node):
+    count = 0
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, nodes.Node):
+            count += 1
+            for attribute in ('value', 'left', 'right', 'child'):
+                stack.append(getattr(node, attribute, None))
+        elif type(node) == list or type(node) == tuple:
+            stack.extend(node)
+    return count
+
+def main():
+    statements = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    path = os.path.join(tempfile.mkdtemp(), 'batch.txt')
+    generate(path, statements)
+    with open(path) as f:
+        contents = f.read()
+    parser.getParser()
+
+    start = time.perf_counter()
+    tree = parser.parse(contents)
+    seconds = time.perf_counter() - start
+    count = countNodes(tree)
+    del tree
+    gc.collect()
+
+    # The tree is what is left allocated after parsing
+    tracemalloc.start()
+    tree = parser.parse(contents)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    previous = output.use(output.Null())
+    start = time.perf_counter()
+    nodes.Interpreter().run(tree)
+    run = time.perf_counter() - start
+    output.use(previous)
+
+    print("%d statements: %d nodes, %.1f MB tree, %.0f bytes per node" %
+          (statements, count, size / 1e6, size / count))
+    print("parse %.2f s, run %.2f s" % (seconds, run))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# -------------------------------------------------------------- #
+# ------------------------ packed.py --------------------------- #
+# -------------------------------------------------------------- #
+
+# Time and peak memory of a numeric SBML workload on the tree-walker
+# with plain and with packed lists (sbml.py --packed-lists): a list of
+# 2**K ints and one of floats are grown by concatenation, filled
+# element by element, summed, searched with 'in' and compared
+# inside a membership test, and a third list is grown from empty one
+# element at a time with 'xs = xs + [e]'.
+#
+#   python benchmarks/packed.py [K]
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import AST_Nodes as nodes
+import Output as output
+import Parser as parser
+
+PROGRAM = """
+{
+ ints = [0];
+ reals = [0.5];
+ i = 0;
+ while (i < %(k)d) {
+  ints = ints + ints;
+  reals = reals + reals;
+  i = i + 1;
+ }
+ n = %(n)d;
+ i = 0;
+ while (i < n) {
+  ints[i] = i * 3;
+  reals[i] = i * 0.25;
+  i = i + 1;
+ }
+ total = 0;
+ i = 0;
+ while (i < n) {
+  total = total + ints[i] - reals[i];
+  i = i + 1;
+ }
+ print(total);
+ print((3 * n - 3) in ints);
+ print(-1 in ints);
+ copy = ints + [1];
+ print(copy in [ints + [1]]);
+ grown = [];
+ i = 0;
+ while (i < n) {
+  grown = grown + [i * 2];
+  i = i + 1;
+ }
+ print(grown[n - 1]);
+ print((2 * n - 2) in grown);
+}
+"""
+
+def run(tree, packed):
+    capture = output.Capture()
+    start = time.perf_counter()
+    nodes.Interpreter(capture, packed).run(tree)
+    return time.perf_counter() - start, capture.getvalue()
+
+def main():
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else 17
+    tree = parser.parse(PROGRAM % {'k': k, 'n': 1 << k})
+    results = []
+    for name, packed in (('plain', False), ('packed', True)):
+        seconds, result = run(tree, packed)
+        tracemalloc.start()
+        run(tree, packed)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.append(result)
+        print("%-8s %8.2f s %8.1f MB peak" % (name, seconds, peak / 1e6))
+    if results[0] != results[1]:
+        print("outputs differ")
+
+if __name__ == "__main__":
+    main()
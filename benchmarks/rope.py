@@ -0,0 +1,55 @@
+# -------------------------------------------------------------- #
+# ------------------------- rope.py ---------------------------- #
+# -------------------------------------------------------------- #
+
+# Time the tree-walker takes to build a report string of N lines with
+# 's = s + line' in a while loop and print it, with ropes and with
+# ropes disabled (every '+' copies the string), for growing N.
+#
+#   python benchmarks/rope.py [N ...]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import AST_Nodes as nodes
+import Output as output
+import Parser as parser
+import Values as values
+
+PROGRAM = """
+{
+ report = "";
+ i = 0;
+ while (i < %d) {
+  report = report + "line " + "of the report" + "\\n";
+  i = i + 1;
+ }
+ print(report);
+}
+"""
+
+def run(tree):
+    capture = output.Capture()
+    start = time.perf_counter()
+    nodes.Interpreter(capture).run(tree)
+    return time.perf_counter() - start, capture.getvalue()
+
+def main():
+    sizes = [int(n) for n in sys.argv[1:]] or [10000, 20000, 40000, 80000]
+    ropeLength = values.ROPE_LENGTH
+    print("%8s %10s %10s %10s" % ("lines", "MB", "rope s", "copy s"))
+    for n in sizes:
+        tree = parser.parse(PROGRAM % n)
+        seconds, result = run(tree)
+        values.ROPE_LENGTH = float('inf')
+        try:
+            copy, expected = run(tree)
+        finally:
+            values.ROPE_LENGTH = ropeLength
+        print("%8d %10.1f %10.2f %10.2f%s" % (n, len(result) / 1e6, seconds, copy,
+                                            "" if result == expected else "  outputs differ"))
+
+if __name__ == "__main__":
+    main()
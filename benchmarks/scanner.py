@@ -0,0 +1,169 @@
+# -------------------------------------------------------------- #
+# ----------------------- scanner.py --------------------------- #
+# -------------------------------------------------------------- #
+
+# Scanner.py against the PLY lexer of Lexer.py.
+#
+#   check  every file is tokenized by both, with several chunk sizes,
+#          and the token streams (type, value, lineno, lexpos) and
+#          errors must be identical. Without files a generated program
+#          and a set of edge cases are checked.
+#   speed  tokens per second and peak memory (tracemalloc) of the PLY
+#          lexer on the whole file and of the Scanner on an mmap of it.
+#          Without a file, a generated program of SIZE MB (10) is used.
+#
+#   python benchmarks/scanner.py check [file ...]
+#   python benchmarks/scanner.py speed [file | SIZE]
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import Lexer
+import Scanner
+
+CHUNK_SIZES = (1, 2, 3, 5, 64, 4096, Scanner.CHUNK_SIZE)
+
+EDGE_CASES = ["1.5e-3 1.5e- 1.5e 1.e 1.e5 1. .5 12.34.5 1e5 007",
+              "x::y ** * <= < <> >= > == = ; , # ( ) [ ] { } + - / :",
+              "'a\n\"b' \"c\n'd\" '' \"\"\n\n\t x",
+              "andalso orelse not in mod div True False print if else while fun Truex if2 a_b",
+              "1" * 5000,
+              "x = 'unterminated",
+              "x = 1 $ 2",
+              "x . y",
+              "x:",
+              "١.٢ é"]
+
+# Program in the shape of machine generated code, roughly size bytes
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    lines = ["fun f%d(a, b) = { c = a * b + %d; } c;" % (i, i) for i in range(10)]
+    lines.append("{")
+    length = sum(len(l) + 1 for l in lines)
+    while length < size:
+        n = rng.randrange(100)
+        line = rng.choice(["  x%d = %d + %d.%de-%d * (y - %d) div 3 mod 7;" % (n, n, n, n, n % 9, n),
+                           "  s%d = \"item %d\" + 'tail';" % (n, n),
+                           "  l%d = [%d, %d.5, \"z\", (1, 2), [True, False]];" % (n, n, n),
+                           "  if (x%d <= %d andalso not (y <> 2) orelse z >= 1) { print(#1(t)); }" % (n, n),
+                           "  while (i < %d) { i = i + 1; a[i] = f%d(i, 2) :: []; }" % (n, n % 10)])
+        lines.append(line)
+        length += len(line) + 1
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+def key(token):
+    return (token.type, token.value, type(token.value), token.lineno, token.lexpos)
+
+def plyTokens(text):
+    lexer = Lexer.getLexer()
+    lexer.lineno = 1
+    lexer.input(text)
+    tokens = []
+    try:
+        while True:
+            token = lexer.token()
+            if not token: break
+            tokens.append(key(token))
+    except Exception as e:
+        tokens.append(('error', type(e).__name__, str(e)))
+    return tokens
+
+def scannerTokens(source, chunkSize):
+    tokens = []
+    try:
+        for token in Scanner.Scanner(source, chunkSize):
+            tokens.append(key(token))
+    except Exception as e:
+        tokens.append(('error', type(e).__name__, str(e)))
+    return tokens
+
+# Name of the first chunk size giving another stream than PLY, None
+def compare(path):
+    with open(path) as f:
+        expected = plyTokens(f.read())
+    for size in CHUNK_SIZES:
+        if scannerTokens(Scanner.mapped(path), size) != expected:
+            return "bytes, chunk size %d" % size
+        with open(path) as f:
+            if scannerTokens(f, size) != expected:
+                return "text, chunk size %d" % size
+    return None
+
+def check(paths):
+    directory = tempfile.mkdtemp()
+    if not paths:
+        paths = []
+        for i, text in enumerate(EDGE_CASES + [generate(200000)]):
+            path = os.path.join(directory, "case%d.txt" % i)
+            with open(path, 'w') as f:
+                f.write(text)
+            paths.append(path)
+    failures = 0
+    for path in paths:
+        failure = compare(path)
+        if failure is not None:
+            failures += 1
+            print("%s: differs (%s)" % (path, failure))
+    print("%d of %d files identical" % (len(paths) - failures, len(paths)))
+    return 1 if failures else 0
+
+# Tokens and seconds of a run, then the peak memory of another run
+# (tracemalloc slows everything down)
+def measure(function):
+    start = time.perf_counter()
+    count = function()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, seconds, peak
+
+def runPly(path):
+    with open(path) as f:
+        text = f.read()
+    lexer = Lexer.getLexer()
+    lexer.input(text)
+    count = 0
+    while lexer.token():
+        count += 1
+    return count
+
+def runScanner(path):
+    count = 0
+    for token in Scanner.Scanner(Scanner.mapped(path)):
+        count += 1
+    return count
+
+def speed(argument):
+    if argument is None or not os.path.exists(argument):
+        size = float(argument) if argument else 10
+        path = os.path.join(tempfile.mkdtemp(), 'generated.txt')
+        with open(path, 'w') as f:
+            f.write(generate(int(size * 1000000)))
+    else:
+        path = argument
+    print("%s: %.1f MB" % (path, os.path.getsize(path) / 1e6))
+    Lexer.getLexer()
+    for name, function in (('ply', runPly), ('scanner', runScanner)):
+        count, seconds, peak = measure(lambda: function(path))
+        print("%-8s %10d tokens %8.2f s %10.0f tokens/s %8.1f MB peak" %
+              (name, count, seconds, count / seconds, peak / 1e6))
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('check', 'speed'):
+        print("usage: scanner.py check [file ...] | speed [file | SIZE]")
+        return 2
+    if sys.argv[1] == 'check':
+        return check(sys.argv[2:])
+    speed(sys.argv[2] if len(sys.argv) > 2 else None)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+# -------------------------------------------------------------- #
+# ----------------------- startup.py --------------------------- #
+# -------------------------------------------------------------- #
+
+# Startup time of sbml.py on a small program, best of several fresh
+# processes:
+#   tables   building the lexer and LALR tables at startup (the old
+#            behaviour, no prebuilt tables)
+#   prebuilt sbml_lextab.py / sbml_parsetab.py (--no-cache)
+#   cached   program loaded from __sbmlcache__, no parsing at all
+#
+#   python benchmarks/startup.py [program.txt] [runs]
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PACKAGE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROGRAM = """fun factorial(n) =
+{
+ if (n < 1) { output = 1; } else { output = n * factorial(n - 1); }
+}
+output;
+{
+ print(factorial(10));
+}
+"""
+
+# Same work as sbml.py --no-cache, with the tables generated in memory
+TABLES = """
+import sys
+sys.path.insert(0, %r)
+import Lexer, Parser, Engines
+from ply import lex, yacc
+Lexer.lexer = lex.lex(module=Lexer)
+Parser.parser = yacc.yacc(module=Parser, tabmodule='sbml_no_tables', debug=False,
+                          write_tables=False, errorlog=yacc.NullLogger())
+Engines.run(Parser.parse(open(%r).read()))
+"""
+
+def best(command, runs):
+    times = []
+    for i in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    directory = tempfile.mkdtemp()
+    if len(sys.argv) > 1:
+        path = os.path.abspath(sys.argv[1])
+    else:
+        path = os.path.join(directory, 'factorial.txt')
+        with open(path, 'w') as f:
+            f.write(PROGRAM)
+    sbml = os.path.join(PACKAGE, 'sbml.py')
+
+    results = [('python -c pass', best([sys.executable, '-c', 'pass'], runs)),
+               ('tables', best([sys.executable, '-c', TABLES % (PACKAGE, path)], runs)),
+               ('prebuilt', best([sys.executable, sbml, '--no-cache', path], runs))]
+    subprocess.run([sys.executable, sbml, path], stdout=subprocess.DEVNULL, check=True)
+    results.append(('cached', best([sys.executable, sbml, path], runs)))
+
+    for name, seconds in results:
+        print("%-16s %7.1f ms" % (name, seconds * 1000))
+
+if __name__ == "__main__":
+    main()
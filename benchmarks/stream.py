@@ -0,0 +1,61 @@
+# -------------------------------------------------------------- #
+# ------------------------ stream.py --------------------------- #
+# -------------------------------------------------------------- #
+
+# Time and peak memory (max RSS) of sbml.py on a generated batch
+# script of N statements, parsed whole (--no-cache) and streamed
+# (--stream), each in a fresh process.
+#
+#   python benchmarks/stream.py [N]
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PACKAGE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs sbml.py and prints its max RSS to stderr
+WRAPPER = """
+import resource, sys
+sys.path.insert(0, %r)
+sys.argv = ['sbml.py'] + sys.argv[1:]
+import sbml
+sbml.main()
+sys.stderr.write("%%d\\n" %% resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+def generate(path, statements):
+    with open(path, 'w') as f:
+        f.write("fun scale(x, k) = { y = x * k; } y;\n{\n total = 0;\n")
+        for i in range(statements):
+            if i % 4 == 0: f.write(" total = total + scale(%d, 3);\n" % i)
+            elif i % 4 == 1: f.write(" item%d = [%d, \"s%d\", %d.5];\n" % (i % 100, i, i, i))
+            elif i % 4 == 2: f.write(" if (total mod 7 == %d) { total = total - 1; } else { total = total + 1; }\n" % (i % 7))
+            else: f.write(" print(total);\n")
+        f.write("}\n")
+
+def measure(options, path):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', WRAPPER % PACKAGE] + options + [path],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    seconds = time.perf_counter() - start
+    rss = int(result.stderr.decode().split()[-1])
+    return seconds, rss, result.stdout
+
+def main():
+    statements = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    path = os.path.join(tempfile.mkdtemp(), 'batch.txt')
+    generate(path, statements)
+    print("%d statements, %.1f MB" % (statements, os.path.getsize(path) / 1e6))
+    outputs = []
+    for name, options in (('whole', ['--no-cache']), ('stream', ['--stream'])):
+        seconds, rss, output = measure(options, path)
+        outputs.append(output)
+        print("%-8s %8.2f s %8.1f MB max RSS" % (name, seconds, rss / 1024))
+    if outputs[0] != outputs[1]:
+        print("outputs differ")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# -------------------------------------------------------------- #
+# ------------------------ threads.py -------------------------- #
+# -------------------------------------------------------------- #
+
+# Parses and runs the programs in benchmarks/programs on every engine
+# from many threads at once, each run with its own Interpreter and
+# its output captured, and compares every output with the one of the
+# same program run alone. Exit status 1 when one differs.
+#
+#   python benchmarks/threads.py [--threads 40] [--rounds 2] [program ...]
+
+import argparse
+import concurrent.futures
+import glob
+import os
+import sys
+import time
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(DIRECTORY))
+import Engines as engines
+import Output as output
+import Parser as parser
+
+PROGRAMS = os.path.join(DIRECTORY, 'programs')
+
+def runProgram(contents, engine):
+    capture = output.Capture()
+    parser.parseAll(contents, engine, sink=capture)
+    return capture.getvalue()
+
+def main():
+    options = argparse.ArgumentParser(description="Run SBML programs from many threads")
+    options.add_argument('programs', nargs='*', help="programs (default: all)")
+    options.add_argument('--threads', type=int, default=40)
+    options.add_argument('--rounds', type=int, default=2,
+                         help="runs of every program on every engine (default: 2)")
+    args = options.parse_args()
+    paths = args.programs or sorted(glob.glob(os.path.join(PROGRAMS, '*.txt')))
+    sources = dict()
+    for path in paths:
+        with open(path) as f:
+            sources[os.path.basename(path)] = f.read()
+
+    expected = dict()
+    for name in sources:
+        expected[name] = runProgram(sources[name], 'tree')
+
+    tasks = [(name, engine) for name in sources for engine in sorted(engines.ENGINES)] * args.rounds
+    failed = 0
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(args.threads) as pool:
+        results = pool.map(lambda task: runProgram(sources[task[0]], task[1]), tasks)
+        for (name, engine), result in zip(tasks, results):
+            if result != expected[name]:
+                failed += 1
+                print("%s on %s: output differs" % (name, engine))
+    print("%d runs on %d threads in %.2f s, %d differ" %
+          (len(tasks), args.threads, time.perf_counter() - start, failed))
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
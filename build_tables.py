@@ -0,0 +1,33 @@
+# -------------------------------------------------------------- #
+# --------------------- build_tables.py ------------------------ #
+# -------------------------------------------------------------- #
+
+# Regenerate the prebuilt lexer and parser tables sbml_lextab.py and
+# sbml_parsetab.py. Run it after changing the rules in Lexer.py or the
+# grammar in Parser.py:
+#   python build_tables.py
+# With --check nothing is written, the exit status is 1 when a table
+# is out of date (the interpreter would then rebuild it on every run):
+#   python build_tables.py --check
+
+import Lexer as lexer
+import Parser as parser
+import os
+import sys
+
+# Names of the prebuilt tables that are out of date
+def stale():
+    tables = []
+    if not lexer.tableCurrent(): tables.append(lexer.LEXTAB + '.py')
+    if not parser.tableCurrent(): tables.append(parser.PARSETAB + '.py')
+    return tables
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ['--check']:
+        for table in stale():
+            print("%s is out of date, run python build_tables.py" % table)
+        sys.exit(1 if stale() else 0)
+    directory = os.path.dirname(os.path.abspath(__file__))
+    lexer.buildTable(directory)
+    parser.buildTable(directory)
+    print("wrote %s.py and %s.py" % (lexer.LEXTAB, parser.PARSETAB))
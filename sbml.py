@@ -1,17 +1,117 @@
-import Parser as parser 
-import sys 
+import Engines as engines
+import Cache as cache
+import Memo as memo
+import Output as output
+import Values as values
+import argparse
+import sys
+
+def getOptions():
+    options = argparse.ArgumentParser(description="Run an SBML program")
+    options.add_argument('file', help="SBML source file")
+    options.add_argument('--engine', choices=sorted(engines.ENGINES), default='tree',
+                         help="execution engine (default: tree)")
+    options.add_argument('--memo', action='store_true',
+                         help="cache the results of pure functions (tree engine only)")
+    options.add_argument('--memo-size', type=int, default=memo.DEFAULT_SIZE, metavar='SIZE',
+                         help="results cached per function (default: %d)" % memo.DEFAULT_SIZE)
+    options.add_argument('--memo-stats', action='store_true',
+                         help="print the cache hits and misses to stderr")
+    options.add_argument('--packed-lists', action='store_true',
+                         help="keep lists of only ints or only floats in compact arrays "
+                              "(tree engine only)")
+    options.add_argument('-O', type=int, choices=[0, 1, 2], default=0, dest='level',
+                         help="optimization level: 1 folds constants and removes dead "
+                              "branches, 2 also simplifies identities (default: 0)")
+    options.add_argument('--opt-report', action='store_true',
+                         help="print the optimizer changes to stderr")
+    options.add_argument('--no-cache', dest='cache', action='store_false',
+                         help="always parse the file, don't use or write __sbmlcache__")
+    options.add_argument('--stream', action='store_true',
+                         help="parse and run the program one statement at a time, "
+                              "for very large programs (tree engine only, no cache)")
+    options.add_argument('--profile', action='store_true',
+                         help="print the time spent per function, line and node type "
+                              "to stderr (tree engine only)")
+    options.add_argument('--profile-json', metavar='FILE',
+                         help="write the profile as JSON to FILE (tree engine only)")
+    options.add_argument('--sample', metavar='FILE',
+                         help="sample the SBML call stack while the program runs and write "
+                              "it to FILE as folded stacks for flame graphs (tree engine only)")
+    options.add_argument('--sample-interval', type=float, default=1.0, metavar='MS',
+                         help="milliseconds between two samples (default: 1)")
+    options.add_argument('--output', choices=['stdout', 'buffered', 'null'],
+                         help="stdout writes every print right away, buffered writes "
+                              "them in batches, null drops them (default: stdout on a "
+                              "terminal, buffered otherwise)")
+    options.add_argument('--flush-size', type=int, default=output.DEFAULT_THRESHOLD,
+                         metavar='SIZE',
+                         help="characters a buffered output holds before writing them "
+                              "(default: %d)" % output.DEFAULT_THRESHOLD)
+    return options
 
 def main():
-    if (len(sys.argv) != 2) :
-        print("Incorrect Input")      
-    try: 
-        # Read in text file 
-        f = open(sys.argv[1],"r+")
+    options = getOptions()
+    args = options.parse_args()
+    if args.memo and args.engine != 'tree':
+        options.error("--memo requires --engine=tree")
+    if args.packed_lists and args.engine != 'tree':
+        options.error("--packed-lists requires --engine=tree")
+    if args.stream and (args.engine != 'tree' or args.memo):
+        options.error("--stream requires --engine=tree and no --memo")
+    if (args.profile or args.profile_json) and args.engine != 'tree':
+        options.error("--profile requires --engine=tree")
+    if args.sample and (args.engine != 'tree' or args.profile or args.profile_json):
+        options.error("--sample requires --engine=tree and no --profile")
+    values.packing = args.packed_lists
+    if args.output is None:
+        args.output = 'stdout' if sys.stdout.isatty() else 'buffered'
+    if args.output == 'buffered': output.use(output.Buffered(args.flush_size))
+    elif args.output == 'null': output.use(output.Null())
+    profile = None
+    if args.profile or args.profile_json:
+        import Profiler
+        profile = Profiler.enable()
+    sampler = None
+    if args.sample:
+        import Sampler
+        sampler = Sampler.Sampler(args.sample_interval / 1000).start()
+    try:
+        if args.stream:
+            import Stream, Scanner
+            Stream.run(Scanner.mapped(args.file), args.level,
+                       sys.stderr if args.opt_report else None)
+            return
+
+        # Read in text file
+        f = open(args.file,"r+")
         contents = f.read()
-        parser.parseAll(contents)
         f.close()
-    except Exception as e: 
-        print(e)
-            
+        memoSize = args.memo_size if args.memo else None
+        report = sys.stderr if args.opt_report else None
+
+        # A cached program skips the lexer and parser, PLY isn't loaded
+        entry = cache.load(args.file, contents, args.level) if args.cache else None
+        if entry is not None:
+            if report is not None:
+                for change in entry.changes: report.write(change + "\n")
+            for error in entry.errors: sys.stderr.write(error + "\n")
+            memos = engines.run(entry.tree, args.engine, memoSize)
+        else:
+            import Parser as parser
+            memos = parser.parseAll(contents, args.engine, memoSize, args.level, report,
+                            args.file if args.cache else None)
+        if args.memo_stats and memos is not None: memo.report(sys.stderr, memos)
+    except Exception as e:
+        output.write(e)
+    finally:
+        output.flush()
+        if sampler is not None:
+            sampler.stop()
+            with open(args.sample, 'w') as f: sampler.write(f)
+        if profile is not None:
+            if args.profile: profile.report(sys.stderr)
+            if args.profile_json: profile.writeJSON(args.profile_json)
+
 if __name__ == "__main__":
     main()
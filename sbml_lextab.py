@@ -0,0 +1,11 @@
+# sbml_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ADDITION', 'ASSIGNMENT', 'COMMA', 'CONJUNCTION', 'CONS', 'DISJUNCTION', 'DIVISION', 'ELSE', 'EQUALS', 'EXPONENTIATION', 'FALSE', 'FUNCTION', 'GREATER_THAN', 'GREATER_THAN_EQUAL', 'HASHTAG', 'IF', 'INTEGER', 'INTEGER_DIVISION', 'LEFT_BRACE', 'LEFT_BRACKET', 'LEFT_PARENTHESIS', 'LESS_THAN', 'LESS_THAN_EQUAL', 'MEMBERSHIP', 'MODULUS', 'MULTIPLICATION', 'NEGATION', 'NOT_EQUAL', 'PRINT', 'REAL', 'RIGHT_BRACE', 'RIGHT_BRACKET', 'RIGHT_PARENTHESIS', 'SEMICOLON', 'STRING', 'SUBTRACTION', 'TRUE', 'VARIABLE', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_REAL>(\\d*[.]\\d*([e][-]?)?\\d+) | (\\d+[.]\\d*([e][-]?)?\\d*))|(?P<t_INTEGER>\\d+)|(?P<t_STRING>(["] ([^"])* ["]) | ([\\\'] [^\\\']* [\\\']))|(?P<t_ID>[a-zA-Z][a-zA-Z0-9_]*)|(?P<t_newline>\\n+)|(?P<t_EXPONENTIATION>\\*\\*)|(?P<t_ADDITION>\\+)|(?P<t_CONS>::)|(?P<t_EQUALS>==)|(?P<t_GREATER_THAN_EQUAL>>=)|(?P<t_HASHTAG>\\#)|(?P<t_LEFT_BRACE>\\{)|(?P<t_LEFT_BRACKET>\\[)|(?P<t_LEFT_PARENTHESIS>\\()|(?P<t_LESS_THAN_EQUAL><=)|(?P<t_MULTIPLICATION>\\*)|(?P<t_NOT_EQUAL><>)|(?P<t_RIGHT_BRACE>\\})|(?P<t_RIGHT_BRACKET>\\])|(?P<t_RIGHT_PARENTHESIS>\\))|(?P<t_ASSIGNMENT>=)|(?P<t_COMMA>,)|(?P<t_DIVISION>/)|(?P<t_GREATER_THAN>>)|(?P<t_LESS_THAN><)|(?P<t_SEMICOLON>;)|(?P<t_SUBTRACTION>-)', [None, ('t_REAL', 'REAL'), None, None, None, None, ('t_INTEGER', 'INTEGER'), ('t_STRING', 'STRING'), None, None, None, ('t_ID', 'ID'), ('t_newline', 'newline'), (None, 'EXPONENTIATION'), (None, 'ADDITION'), (None, 'CONS'), (None, 'EQUALS'), (None, 'GREATER_THAN_EQUAL'), (None, 'HASHTAG'), (None, 'LEFT_BRACE'), (None, 'LEFT_BRACKET'), (None, 'LEFT_PARENTHESIS'), (None, 'LESS_THAN_EQUAL'), (None, 'MULTIPLICATION'), (None, 'NOT_EQUAL'), (None, 'RIGHT_BRACE'), (None, 'RIGHT_BRACKET'), (None, 'RIGHT_PARENTHESIS'), (None, 'ASSIGNMENT'), (None, 'COMMA'), (None, 'DIVISION'), (None, 'GREATER_THAN'), (None, 'LESS_THAN'), (None, 'SEMICOLON'), (None, 'SUBTRACTION')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_source = 'ec32e5b4cfa4b1df460c44087e858d4ddbe7563f6c24b13abd2c3d680c30fd8c'
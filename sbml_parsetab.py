@@ -0,0 +1,108 @@
+
+# sbml_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftDISJUNCTIONleftCONJUNCTIONleftNEGATIONleftLESS_THAN_EQUALLESS_THANEQUALSNOT_EQUALGREATER_THAN_EQUALGREATER_THANrightCONSleftMEMBERSHIPleftADDITIONSUBTRACTIONleftMULTIPLICATIONDIVISIONINTEGER_DIVISIONMODULUSrightUMINUSrightEXPONENTIATIONleftLEFT_BRACKETRIGHT_BRACKETleftHASHTAGleftCOMMAleftLEFT_PARENTHESISCOMMARIGHT_PARENTHESISADDITION ASSIGNMENT COMMA CONJUNCTION CONS DISJUNCTION DIVISION ELSE EQUALS EXPONENTIATION FALSE FUNCTION GREATER_THAN GREATER_THAN_EQUAL HASHTAG IF INTEGER INTEGER_DIVISION LEFT_BRACE LEFT_BRACKET LEFT_PARENTHESIS LESS_THAN LESS_THAN_EQUAL MEMBERSHIP MODULUS MULTIPLICATION NEGATION NOT_EQUAL PRINT REAL RIGHT_BRACE RIGHT_BRACKET RIGHT_PARENTHESIS SEMICOLON STRING SUBTRACTION TRUE VARIABLE WHILEstart : function_list block\n             | blockblock : LEFT_BRACE statement_list RIGHT_BRACE\n             | LEFT_BRACE RIGHT_BRACEstatement_list : statement_list statement\n                      | statementstatement : print SEMICOLON\n                 | assignment SEMICOLON\n                 | while \n                 | if \n                 | if_else\n                 | block\n                 | function_call SEMICOLON\n                 | variable SEMICOLONvariable : VARIABLEfunction_list : function_list function SEMICOLON\n                     | function SEMICOLON function : FUNCTION VARIABLE LEFT_PARENTHESIS parameter_list RIGHT_PARENTHESIS ASSIGNMENT block expr\n                | FUNCTION VARIABLE LEFT_PARENTHESIS RIGHT_PARENTHESIS ASSIGNMENT block exprparameter_list : parameter_list COMMA VARIABLE \n                      | VARIABLEfunction_call : VARIABLE LEFT_PARENTHESIS input_list RIGHT_PARENTHESIS\n                     | VARIABLE LEFT_PARENTHESIS RIGHT_PARENTHESISinput_list : input_list COMMA expr\n                  | expr print : PRINT LEFT_PARENTHESIS expr RIGHT_PARENTHESISassignment : VARIABLE index_list ASSIGNMENT expr\n                  | VARIABLE ASSIGNMENT exprwhile : WHILE LEFT_PARENTHESIS expr RIGHT_PARENTHESIS blockif_else : if ELSE blockif : IF LEFT_PARENTHESIS expr RIGHT_PARENTHESIS blockindex_statement : expr index_listprop : VARIABLEexpr : prop\n            | list \n            | tuple\n            | index_statement\n            | tuple_index\n            | function_callprop : expr DISJUNCTION exprprop : expr CONJUNCTION exprprop : NEGATION exprprop : expr MEMBERSHIP exprprop : expr CONS exprprop : expr LESS_THAN_EQUAL expr \n            | expr LESS_THAN expr\n            | expr EQUALS expr\n            | expr NOT_EQUAL expr \n            | expr GREATER_THAN_EQUAL expr\n            | expr GREATER_THAN expr prop : SUBTRACTION expr %prec UMINUSprop : expr ADDITION expr \n            | expr SUBTRACTION expr \n            | expr MULTIPLICATION expr\n            | expr DIVISION expr \n            | expr INTEGER_DIVISION expr \n            | expr MODULUS expr\n            | expr EXPONENTIATION expr tuple_index : HASHTAG INTEGER tuple\n                   | HASHTAG INTEGER LEFT_PARENTHESIS VARIABLE RIGHT_PARENTHESIS\n                   | HASHTAG INTEGER VARIABLEindex_list : index_list index\n                  | index index : LEFT_BRACKET prop RIGHT_BRACKETprop : TRUE      \n            | FALSE prop : REAL   \n            | INTEGERprop : STRINGlist : LEFT_BRACKET  RIGHT_BRACKET\n            | LEFT_BRACKET element RIGHT_BRACKETelement : expr \n               | expr COMMA elementtuple : LEFT_PARENTHESIS expr COMMA RIGHT_PARENTHESIS\n             | LEFT_PARENTHESIS tup RIGHT_PARENTHESIStup : expr \n           | expr COMMA tupprop : LEFT_PARENTHESIS expr RIGHT_PARENTHESIS'
+    
+_lr_action_items = {'LEFT_BRACE':([0,2,5,9,10,11,12,15,16,17,18,26,27,28,29,30,31,32,33,43,106,107,110,137,138,139,],[5,5,5,-17,5,-4,-6,-9,-10,-11,-12,-16,-3,-5,-7,-8,5,-13,-14,-30,5,5,5,-29,-31,5,]),'FUNCTION':([0,2,9,26,],[6,6,-17,-16,]),'$end':([1,3,7,11,27,],[0,-2,-1,-4,-3,]),'SEMICOLON':([4,8,13,14,19,20,22,38,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,77,95,96,97,98,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,143,149,151,152,],[9,26,29,30,32,33,-15,-63,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,-28,-23,-26,-32,-42,-51,-70,-27,-22,-64,-78,-75,-40,-41,-43,-44,-45,-46,-47,-48,-49,-50,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,-74,-19,-60,-18,]),'RIGHT_BRACE':([5,10,11,12,15,16,17,18,27,28,29,30,32,33,43,137,138,],[11,27,-4,-6,-9,-10,-11,-12,-3,-5,-7,-8,-13,-14,-30,-29,-31,]),'PRINT':([5,10,11,12,15,16,17,18,27,28,29,30,32,33,43,137,138,],[21,21,-4,-6,-9,-10,-11,-12,-3,-5,-7,-8,-13,-14,-30,-29,-31,]),'VARIABLE':([5,6,10,11,12,15,16,17,18,27,28,29,30,32,33,34,36,37,39,40,41,42,43,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,101,104,109,112,132,134,137,138,141,148,150,],[22,25,22,-4,-6,-9,-10,-11,-12,-3,-5,-7,-8,-13,-14,52,52,52,52,52,52,72,-30,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,135,52,140,52,52,146,-29,-31,52,52,52,]),'WHILE':([5,10,11,12,15,16,17,18,27,28,29,30,32,33,43,137,138,],[23,23,-4,-6,-9,-10,-11,-12,-3,-5,-7,-8,-13,-14,-30,-29,-31,]),'IF':([5,10,11,12,15,16,17,18,27,28,29,30,32,33,43,137,138,],[24,24,-4,-6,-9,-10,-11,-12,-3,-5,-7,-8,-13,-14,-30,-29,-31,]),'ELSE':([11,16,27,138,],[-4,31,-3,-31,]),'NEGATION':([11,27,34,36,37,39,40,41,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,132,134,141,148,150,],[-4,-3,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'SUBTRACTION':([11,27,34,36,37,38,39,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,62,63,64,66,67,68,69,70,71,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,100,102,103,104,105,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,141,142,143,146,147,148,149,150,151,152,],[-4,-3,54,54,54,-63,54,54,54,54,89,-34,-35,-36,-37,-38,-39,-33,54,54,-65,-66,-67,-68,-69,54,54,-62,89,-23,89,-34,89,89,89,89,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-32,89,-51,-70,89,89,-22,54,-64,-78,54,-75,89,89,89,89,89,89,89,89,89,89,-52,-53,-54,-55,-56,-57,-58,-71,54,-59,54,-61,89,54,89,-74,-33,89,54,89,54,-60,89,]),'TRUE':([11,27,34,36,37,39,40,41,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,132,134,141,148,150,],[-4,-3,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'FALSE':([11,27,34,36,37,39,40,41,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,132,134,141,148,150,],[-4,-3,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'REAL':([11,27,34,36,37,39,40,41,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,132,134,141,148,150,],[-4,-3,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'INTEGER':([11,27,34,36,37,39,40,41,44,53,54,60,61,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,132,134,141,148,150,],[-4,-3,58,58,58,58,58,58,58,58,58,58,101,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'STRING':([11,27,34,36,37,39,40,41,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,132,134,141,148,150,],[-4,-3,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'LEFT_PARENTHESIS':([11,21,22,23,24,25,27,34,36,37,39,40,41,44,52,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,101,104,112,132,134,141,146,148,150,],[-4,34,37,40,41,42,-3,44,44,44,44,44,44,44,37,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,134,44,44,44,44,44,37,44,44,]),'LEFT_BRACKET':([11,22,27,34,35,36,37,38,39,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,62,63,64,66,67,68,69,70,71,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,100,102,103,104,105,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,141,142,143,146,147,148,149,150,151,152,],[-4,39,-3,60,39,60,60,-63,60,60,60,60,39,-34,-35,-36,-37,-38,-39,-33,60,60,-65,-66,-67,-68,-69,60,60,-62,39,-23,39,-34,39,39,39,39,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,39,39,39,-70,39,39,-22,60,-64,-78,60,-75,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-71,60,-59,60,-61,39,60,39,-74,-33,39,60,39,60,-60,39,]),'HASHTAG':([11,27,34,36,37,39,40,41,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,132,134,141,148,150,],[-4,-3,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'ASSIGNMENT':([22,35,38,63,74,105,108,],[36,62,-63,-62,110,-64,139,]),'RIGHT_PARENTHESIS':([37,38,42,45,46,47,48,49,50,51,52,55,56,57,58,59,63,65,66,67,70,71,72,73,75,76,95,96,97,98,103,105,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,140,142,143,144,146,147,151,],[66,-63,74,77,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,103,-23,-25,106,107,-21,108,111,113,-32,-42,-51,-70,-22,-64,-78,143,-75,-40,-41,-43,-44,-45,-46,-47,-48,-49,-50,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,-24,-20,-76,-74,-77,151,-76,-60,]),'DISJUNCTION':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,78,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,78,-23,78,-34,78,78,78,78,-32,-42,-51,-70,78,78,-22,-64,-78,-75,-40,-41,-43,-44,-45,-46,-47,-48,-49,-50,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,78,78,-74,-33,78,78,-60,78,]),'CONJUNCTION':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,79,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,79,-23,79,-34,79,79,79,79,-32,-42,-51,-70,79,79,-22,-64,-78,-75,79,-41,-43,-44,-45,-46,-47,-48,-49,-50,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,79,79,-74,-33,79,79,-60,79,]),'MEMBERSHIP':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,80,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,80,-23,80,-34,80,80,80,80,-32,80,-51,-70,80,80,-22,-64,-78,-75,80,80,-43,80,80,80,80,80,80,80,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,80,80,-74,-33,80,80,-60,80,]),'CONS':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,81,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,81,-23,81,-34,81,81,81,81,-32,81,-51,-70,81,81,-22,-64,-78,-75,81,81,-43,81,81,81,81,81,81,81,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,81,81,-74,-33,81,81,-60,81,]),'LESS_THAN_EQUAL':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,82,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,82,-23,82,-34,82,82,82,82,-32,82,-51,-70,82,82,-22,-64,-78,-75,82,82,-43,-44,-45,-46,-47,-48,-49,-50,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,82,82,-74,-33,82,82,-60,82,]),'LESS_THAN':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,83,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,83,-23,83,-34,83,83,83,83,-32,83,-51,-70,83,83,-22,-64,-78,-75,83,83,-43,-44,-45,-46,-47,-48,-49,-50,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,83,83,-74,-33,83,83,-60,83,]),'EQUALS':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,84,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,84,-23,84,-34,84,84,84,84,-32,84,-51,-70,84,84,-22,-64,-78,-75,84,84,-43,-44,-45,-46,-47,-48,-49,-50,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,84,84,-74,-33,84,84,-60,84,]),'NOT_EQUAL':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,85,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,85,-23,85,-34,85,85,85,85,-32,85,-51,-70,85,85,-22,-64,-78,-75,85,85,-43,-44,-45,-46,-47,-48,-49,-50,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,85,85,-74,-33,85,85,-60,85,]),'GREATER_THAN_EQUAL':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,86,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,86,-23,86,-34,86,86,86,86,-32,86,-51,-70,86,86,-22,-64,-78,-75,86,86,-43,-44,-45,-46,-47,-48,-49,-50,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,86,86,-74,-33,86,86,-60,86,]),'GREATER_THAN':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,87,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,87,-23,87,-34,87,87,87,87,-32,87,-51,-70,87,87,-22,-64,-78,-75,87,87,-43,-44,-45,-46,-47,-48,-49,-50,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,87,87,-74,-33,87,87,-60,87,]),'ADDITION':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,88,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,88,-23,88,-34,88,88,88,88,-32,88,-51,-70,88,88,-22,-64,-78,-75,88,88,88,88,88,88,88,88,88,88,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,88,88,-74,-33,88,88,-60,88,]),'MULTIPLICATION':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,90,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,90,-23,90,-34,90,90,90,90,-32,90,-51,-70,90,90,-22,-64,-78,-75,90,90,90,90,90,90,90,90,90,90,90,90,-54,-55,-56,-57,-58,-71,-59,-61,90,90,-74,-33,90,90,-60,90,]),'DIVISION':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,91,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,91,-23,91,-34,91,91,91,91,-32,91,-51,-70,91,91,-22,-64,-78,-75,91,91,91,91,91,91,91,91,91,91,91,91,-54,-55,-56,-57,-58,-71,-59,-61,91,91,-74,-33,91,91,-60,91,]),'INTEGER_DIVISION':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,92,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,92,-23,92,-34,92,92,92,92,-32,92,-51,-70,92,92,-22,-64,-78,-75,92,92,92,92,92,92,92,92,92,92,92,92,-54,-55,-56,-57,-58,-71,-59,-61,92,92,-74,-33,92,92,-60,92,]),'MODULUS':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,93,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,93,-23,93,-34,93,93,93,93,-32,93,-51,-70,93,93,-22,-64,-78,-75,93,93,93,93,93,93,93,93,93,93,93,93,-54,-55,-56,-57,-58,-71,-59,-61,93,93,-74,-33,93,93,-60,93,]),'EXPONENTIATION':([38,45,46,47,48,49,50,51,52,55,56,57,58,59,63,64,66,67,68,69,70,71,75,95,96,97,98,100,102,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,142,143,146,147,149,151,152,],[-63,94,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,94,-23,94,-34,94,94,94,94,-32,94,94,-70,94,94,-22,-64,-78,-75,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,-71,-59,-61,94,94,-74,-33,94,94,-60,94,]),'COMMA':([38,46,47,48,49,50,51,52,55,56,57,58,59,63,65,66,67,72,73,75,95,96,97,98,100,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,136,140,142,143,146,147,151,],[-63,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,-62,104,-23,-25,-21,109,112,-32,-42,-51,-70,132,-22,-64,-78,-75,-40,-41,-43,-44,-45,-46,-47,-48,-49,-50,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,-24,-20,150,-74,-33,112,-60,]),'RIGHT_BRACKET':([38,46,47,48,49,50,51,52,55,56,57,58,59,60,63,66,68,95,96,97,98,99,100,103,105,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,143,145,151,],[-63,-34,-35,-36,-37,-38,-39,-33,-65,-66,-67,-68,-69,98,-62,-23,105,-32,-42,-51,-70,131,-72,-22,-64,-78,-75,-40,-41,-43,-44,-45,-46,-47,-48,-49,-50,-52,-53,-54,-55,-56,-57,-58,-71,-59,-61,-74,-73,-60,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start':([0,],[1,]),'function_list':([0,],[2,]),'block':([0,2,5,10,31,106,107,110,139,],[3,7,18,18,43,137,138,141,148,]),'function':([0,2,],[4,8,]),'statement_list':([5,],[10,]),'statement':([5,10,],[12,28,]),'print':([5,10,],[13,13,]),'assignment':([5,10,],[14,14,]),'while':([5,10,],[15,15,]),'if':([5,10,],[16,16,]),'if_else':([5,10,],[17,17,]),'function_call':([5,10,34,36,37,39,40,41,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,132,134,141,148,150,],[19,19,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'variable':([5,10,],[20,20,]),'index_list':([22,45,64,67,69,70,71,75,96,97,100,102,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,136,142,147,149,152,],[35,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,]),'index':([22,35,45,64,67,69,70,71,75,95,96,97,100,102,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,136,142,147,149,152,],[38,63,38,38,38,38,38,38,38,63,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'expr':([34,36,37,39,40,41,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,132,134,141,148,150,],[45,64,67,69,70,71,75,96,97,100,102,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,136,142,100,147,149,152,142,]),'prop':([34,36,37,39,40,41,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,132,134,141,148,150,],[46,46,46,68,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'list':([34,36,37,39,40,41,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,132,134,141,148,150,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'tuple':([34,36,37,39,40,41,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,101,104,112,132,134,141,148,150,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,133,48,48,48,48,48,48,48,]),'index_statement':([34,36,37,39,40,41,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,132,134,141,148,150,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'tuple_index':([34,36,37,39,40,41,44,53,54,60,62,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,132,134,141,148,150,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'input_list':([37,],[65,]),'parameter_list':([42,],[73,]),'tup':([44,112,134,150,],[76,144,76,144,]),'element':([60,132,],[99,145,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('start -> function_list block','start',2,'p_start','Parser.py',33),
+  ('start -> block','start',1,'p_start','Parser.py',34),
+  ('block -> LEFT_BRACE statement_list RIGHT_BRACE','block',3,'p_block','Parser.py',39),
+  ('block -> LEFT_BRACE RIGHT_BRACE','block',2,'p_block','Parser.py',40),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','Parser.py',45),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','Parser.py',46),
+  ('statement -> print SEMICOLON','statement',2,'p_statement','Parser.py',53),
+  ('statement -> assignment SEMICOLON','statement',2,'p_statement','Parser.py',54),
+  ('statement -> while','statement',1,'p_statement','Parser.py',55),
+  ('statement -> if','statement',1,'p_statement','Parser.py',56),
+  ('statement -> if_else','statement',1,'p_statement','Parser.py',57),
+  ('statement -> block','statement',1,'p_statement','Parser.py',58),
+  ('statement -> function_call SEMICOLON','statement',2,'p_statement','Parser.py',59),
+  ('statement -> variable SEMICOLON','statement',2,'p_statement','Parser.py',60),
+  ('variable -> VARIABLE','variable',1,'p_variable','Parser.py',64),
+  ('function_list -> function_list function SEMICOLON','function_list',3,'p_function_list','Parser.py',69),
+  ('function_list -> function SEMICOLON','function_list',2,'p_function_list','Parser.py',70),
+  ('function -> FUNCTION VARIABLE LEFT_PARENTHESIS parameter_list RIGHT_PARENTHESIS ASSIGNMENT block expr','function',8,'p_function','Parser.py',75),
+  ('function -> FUNCTION VARIABLE LEFT_PARENTHESIS RIGHT_PARENTHESIS ASSIGNMENT block expr','function',7,'p_function','Parser.py',76),
+  ('parameter_list -> parameter_list COMMA VARIABLE','parameter_list',3,'p_parameter_list','Parser.py',84),
+  ('parameter_list -> VARIABLE','parameter_list',1,'p_parameter_list','Parser.py',85),
+  ('function_call -> VARIABLE LEFT_PARENTHESIS input_list RIGHT_PARENTHESIS','function_call',4,'p_function_call','Parser.py',90),
+  ('function_call -> VARIABLE LEFT_PARENTHESIS RIGHT_PARENTHESIS','function_call',3,'p_function_call','Parser.py',91),
+  ('input_list -> input_list COMMA expr','input_list',3,'p_input_list','Parser.py',99),
+  ('input_list -> expr','input_list',1,'p_input_list','Parser.py',100),
+  ('print -> PRINT LEFT_PARENTHESIS expr RIGHT_PARENTHESIS','print',4,'p_print','Parser.py',105),
+  ('assignment -> VARIABLE index_list ASSIGNMENT expr','assignment',4,'p_assignment','Parser.py',110),
+  ('assignment -> VARIABLE ASSIGNMENT expr','assignment',3,'p_assignment','Parser.py',111),
+  ('while -> WHILE LEFT_PARENTHESIS expr RIGHT_PARENTHESIS block','while',5,'p_while','Parser.py',121),
+  ('if_else -> if ELSE block','if_else',3,'p_if_else','Parser.py',126),
+  ('if -> IF LEFT_PARENTHESIS expr RIGHT_PARENTHESIS block','if',5,'p_if','Parser.py',131),
+  ('index_statement -> expr index_list','index_statement',2,'p_index_statement','Parser.py',136),
+  ('prop -> VARIABLE','prop',1,'p_prop_variable','Parser.py',141),
+  ('expr -> prop','expr',1,'p_expr','Parser.py',146),
+  ('expr -> list','expr',1,'p_expr','Parser.py',147),
+  ('expr -> tuple','expr',1,'p_expr','Parser.py',148),
+  ('expr -> index_statement','expr',1,'p_expr','Parser.py',149),
+  ('expr -> tuple_index','expr',1,'p_expr','Parser.py',150),
+  ('expr -> function_call','expr',1,'p_expr','Parser.py',151),
+  ('prop -> expr DISJUNCTION expr','prop',3,'p_prop_disjunction','Parser.py',155),
+  ('prop -> expr CONJUNCTION expr','prop',3,'p_prop_conjunction','Parser.py',160),
+  ('prop -> NEGATION expr','prop',2,'p_prop_negation','Parser.py',165),
+  ('prop -> expr MEMBERSHIP expr','prop',3,'p_prop_membership','Parser.py',170),
+  ('prop -> expr CONS expr','prop',3,'p_prop_cons','Parser.py',175),
+  ('prop -> expr LESS_THAN_EQUAL expr','prop',3,'p_prop_comparison','Parser.py',180),
+  ('prop -> expr LESS_THAN expr','prop',3,'p_prop_comparison','Parser.py',181),
+  ('prop -> expr EQUALS expr','prop',3,'p_prop_comparison','Parser.py',182),
+  ('prop -> expr NOT_EQUAL expr','prop',3,'p_prop_comparison','Parser.py',183),
+  ('prop -> expr GREATER_THAN_EQUAL expr','prop',3,'p_prop_comparison','Parser.py',184),
+  ('prop -> expr GREATER_THAN expr','prop',3,'p_prop_comparison','Parser.py',185),
+  ('prop -> SUBTRACTION expr','prop',2,'p_prop_uminus','Parser.py',190),
+  ('prop -> expr ADDITION expr','prop',3,'p_prop_binop','Parser.py',195),
+  ('prop -> expr SUBTRACTION expr','prop',3,'p_prop_binop','Parser.py',196),
+  ('prop -> expr MULTIPLICATION expr','prop',3,'p_prop_binop','Parser.py',197),
+  ('prop -> expr DIVISION expr','prop',3,'p_prop_binop','Parser.py',198),
+  ('prop -> expr INTEGER_DIVISION expr','prop',3,'p_prop_binop','Parser.py',199),
+  ('prop -> expr MODULUS expr','prop',3,'p_prop_binop','Parser.py',200),
+  ('prop -> expr EXPONENTIATION expr','prop',3,'p_prop_binop','Parser.py',201),
+  ('tuple_index -> HASHTAG INTEGER tuple','tuple_index',3,'p_index_tuple','Parser.py',207),
+  ('tuple_index -> HASHTAG INTEGER LEFT_PARENTHESIS VARIABLE RIGHT_PARENTHESIS','tuple_index',5,'p_index_tuple','Parser.py',208),
+  ('tuple_index -> HASHTAG INTEGER VARIABLE','tuple_index',3,'p_index_tuple','Parser.py',209),
+  ('index_list -> index_list index','index_list',2,'p_index_list','Parser.py',220),
+  ('index_list -> index','index_list',1,'p_index_list','Parser.py',221),
+  ('index -> LEFT_BRACKET prop RIGHT_BRACKET','index',3,'p_index','Parser.py',227),
+  ('prop -> TRUE','prop',1,'p_prop_boolean','Parser.py',232),
+  ('prop -> FALSE','prop',1,'p_prop_boolean','Parser.py',233),
+  ('prop -> REAL','prop',1,'p_prop_number','Parser.py',239),
+  ('prop -> INTEGER','prop',1,'p_prop_number','Parser.py',240),
+  ('prop -> STRING','prop',1,'p_prop_string','Parser.py',245),
+  ('list -> LEFT_BRACKET RIGHT_BRACKET','list',2,'p_list','Parser.py',251),
+  ('list -> LEFT_BRACKET element RIGHT_BRACKET','list',3,'p_list','Parser.py',252),
+  ('element -> expr','element',1,'p_element','Parser.py',259),
+  ('element -> expr COMMA element','element',3,'p_element','Parser.py',260),
+  ('tuple -> LEFT_PARENTHESIS expr COMMA RIGHT_PARENTHESIS','tuple',4,'p_tuple','Parser.py',270),
+  ('tuple -> LEFT_PARENTHESIS tup RIGHT_PARENTHESIS','tuple',3,'p_tuple','Parser.py',271),
+  ('tup -> expr','tup',1,'p_tup','Parser.py',276),
+  ('tup -> expr COMMA tup','tup',3,'p_tup','Parser.py',277),
+  ('prop -> LEFT_PARENTHESIS expr RIGHT_PARENTHESIS','prop',3,'p_prop_parenthetical','Parser.py',290),
+]